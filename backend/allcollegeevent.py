@@ -1,21 +1,22 @@
 import re
-import dateparser
+import date_parser
 from playwright.sync_api import Page, BrowserContext
-from base_scraper import GenericScraper
+from base_scraper import GenericScraper, LOAD_MORE_SELECTOR
 from models import HackathonItem
-from utils import extract_reg_end_date_from_text, search_date_on_web
 
 
 class AllCollegeEventScraper(GenericScraper):
     platform_name = "AllCollegeEvent"
     TARGET_URL = "https://www.allcollegeevent.com"
     HACKATHON_KEYWORDS = ["hackathon", "hack", "code", "coding", "tech", "programming"]
+    DETAIL_WAIT_MS = 2000
+    CARD_SELECTOR = ".event-card, .card, [class*='event']"
 
     def scrape(self, page: Page, context: BrowserContext) -> list[HackathonItem]:
         items = []
 
         try:
-            page.goto(self.TARGET_URL, wait_until="networkidle", timeout=30000)
+            self._goto(page, self.TARGET_URL, wait_until="networkidle", timeout=self.LIST_TIMEOUT_MS)
             page.wait_for_timeout(5000)
         except Exception:
             self.logger.warning("AllCollegeEvent page load timed out, proceeding with partial content")
@@ -28,7 +29,9 @@ class AllCollegeEventScraper(GenericScraper):
             except Exception:
                 pass
 
-        event_cards = page.query_selector_all(".event-card, .card, [class*='event']")
+        self._paginate(page, item_selector=self.CARD_SELECTOR, load_more_selector=LOAD_MORE_SELECTOR)
+
+        event_cards = page.query_selector_all(self.CARD_SELECTOR)
         if not event_cards:
             event_cards = page.query_selector_all("a[href*='event']")
 
@@ -69,7 +72,7 @@ class AllCollegeEventScraper(GenericScraper):
                     date_text, re.IGNORECASE
                 )
                 if date_match:
-                    dt = dateparser.parse(date_match[-1], settings={"PREFER_DATES_FROM": "future"})
+                    dt = date_parser.parse(date_match[-1])
                     if dt:
                         date_val = dt.strftime("%Y-%m-%d")
 
@@ -89,44 +92,3 @@ class AllCollegeEventScraper(GenericScraper):
         items = self._enrich_missing_dates(items, context)
 
         return items
-
-    def _enrich_missing_dates(self, items: list[HackathonItem], context: BrowserContext) -> list[HackathonItem]:
-        """Visit detail pages for items missing dates."""
-        enriched = []
-        for item in items:
-            if item.date:
-                enriched.append(item)
-                continue
-
-            try:
-                detail = context.new_page()
-                detail.goto(item.link, wait_until="domcontentloaded", timeout=15000)
-                detail.wait_for_timeout(2000)
-
-                body_text = detail.inner_text("body")
-                found_date = extract_reg_end_date_from_text(body_text)
-
-                if not found_date:
-                    found_date = search_date_on_web(item.title)
-
-                if found_date:
-                    enriched.append(HackathonItem(
-                        title=item.title,
-                        organizer=item.organizer,
-                        date=found_date,
-                        location=item.location,
-                        link=item.link,
-                        source_platform=item.source_platform,
-                        is_offline=item.is_offline,
-                        image_url=item.image_url,
-                    ))
-                else:
-                    self.logger.warning(f"No date found for: {item.title}")
-                    enriched.append(item)
-
-                detail.close()
-            except Exception as e:
-                self.logger.warning(f"Detail page failed for {item.title}: {e}")
-                enriched.append(item)
-
-        return enriched
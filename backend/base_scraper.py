@@ -1,9 +1,24 @@
+import time
 import logging
 import random
+from contextlib import contextmanager
+from concurrent.futures import Future
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from abc import ABC, abstractmethod
 from playwright.sync_api import sync_playwright, Page, BrowserContext
 
 from models import HackathonItem
+from http_cache import HttpCache
+from throttle import CircuitOpenError, get_throttle
+from latency import get_latency_store
+from prefetch import DetailPrefetcher
+from structured_data import extract_from_page
+from memory import current_rss_mb, peak_rss_mb
+from date_service import get_date_service
+from utils import (
+    search_date_on_web, get_env_int,
+    bound_text, DEADLINE_KEYWORDS, DETAIL_TEXT_LIMIT,
+)
 
 try:
     from playwright_stealth import Stealth
@@ -20,24 +35,190 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
 ]
 
+LOAD_MORE_SELECTOR = (
+    "button:has-text('Load more'), button:has-text('Show more'), "
+    "a:has-text('Load more'), a:has-text('View more')"
+)
+
+
+# Runs in the page: collects only the regions that can carry a deadline
+# (keyword windows of the body text, JSON-LD events, <time> elements and
+# date/countdown/sidebar widgets) so megabyte-sized bodies never cross IPC.
+RELEVANT_TEXT_JS = r"""
+({ keywords, span, limit }) => {
+    const parts = [];
+    let total = 0;
+    const push = (text) => {
+        const clean = String(text || "").replace(/\s+/g, " ").trim();
+        if (clean && total < limit) {
+            parts.push(clean);
+            total += clean.length;
+        }
+    };
+
+    const body = document.body ? document.body.innerText : "";
+    const escaped = keywords.map((k) => k.replace(/[.*+?^${}()|[\]\\]/g, "\\$&").replace(/ /g, "\\s+"));
+    const re = new RegExp(escaped.join("|"), "gi");
+    let match;
+    let lastEnd = 0;
+    while ((match = re.exec(body)) !== null && total < limit) {
+        const start = Math.max(match.index - 50, lastEnd);
+        const end = match.index + span;
+        if (end > lastEnd) {
+            push(body.slice(start, end));
+            lastEnd = end;
+        }
+    }
+
+    for (const script of document.querySelectorAll('script[type="application/ld+json"]')) {
+        try {
+            const stack = [JSON.parse(script.textContent)];
+            while (stack.length) {
+                const node = stack.pop();
+                if (Array.isArray(node)) { stack.push(...node); continue; }
+                if (!node || typeof node !== "object") continue;
+                if (node["@graph"]) stack.push(node["@graph"]);
+                if (/Event/i.test([].concat(node["@type"] || []).join(" ")) && node.endDate) {
+                    push(`ends on ${node.endDate}`);
+                }
+            }
+        } catch (e) {}
+    }
+
+    for (const el of document.querySelectorAll("time")) {
+        push(`${el.getAttribute("datetime") || ""} ${el.innerText}`);
+    }
+    const widgets = document.querySelectorAll(
+        '[class*="deadline" i], [class*="countdown" i], [class*="date" i], [id*="deadline" i], [data-deadline], [class*="sidebar" i]'
+    );
+    for (const el of widgets) {
+        const text = el.innerText;
+        if (text && text.length < 500) push(text);
+    }
+
+    return parts.join(" \n ").slice(0, limit);
+}
+"""
+
+
+class DetailContexts:
+    """Hands out browser contexts for detail tabs. Each context is thrown away
+    after ``context_recycle_pages`` pages, or as soon as RSS (including the
+    browser) passes ``memory_limit_mb``, so renderer memory cannot pile up
+    over a long enrichment loop. ``get()`` returns None while usage stays
+    above the ceiling even after recycling."""
+
+    def __init__(self, scraper: "GenericScraper", context: BrowserContext):
+        self.scraper = scraper
+        self.browser = getattr(context, "browser", None)
+        self.fallback = context
+        self.context = None
+        self.pages = 0
+        self.recycled = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.scraper._sample_memory()
+        self._close()
+
+    def _close(self):
+        if self.context is not None:
+            try:
+                self.context.close()
+            except Exception:
+                pass
+            self.context = None
+            self.pages = 0
+
+    def _recycle(self):
+        # Sampled before closing, while the context is at its largest
+        self.scraper._sample_memory()
+        self._close()
+        self.recycled += 1
+
+    def get(self) -> BrowserContext | None:
+        scraper = self.scraper
+        if self.browser is None:
+            return self.fallback
+        if self.pages >= scraper.context_recycle_pages:
+            self._recycle()
+
+        # Summing the process tree's RSS is not free (a /proc walk without
+        # psutil), so per-page samples are only taken to enforce a limit;
+        # otherwise the peak comes from the samples taken at each recycle,
+        # when the detail loop ends and when the browser session closes.
+        limit = scraper.memory_limit_mb
+        usage = scraper._sample_memory() if limit else None
+        if limit and usage is not None and usage > limit:
+            if self.context is not None:
+                self._recycle()
+                usage = scraper._sample_memory()
+            if usage is not None and usage > limit:
+                scraper.logger.warning(
+                    f"{scraper.platform_name}: RSS {usage:.0f} MB over MEMORY_LIMIT_MB={limit}, skipping detail page"
+                )
+                return None
+
+        if self.context is None:
+            self.context = scraper._new_context(self.browser)
+        self.pages += 1
+        return self.context
+
 
 class GenericScraper(ABC):
     platform_name: str = "Unknown"
+    # Ceilings for navigation; the effective timeout is learned per domain (latency.py)
+    LIST_TIMEOUT_MS: int = 30000
+    DETAIL_TIMEOUT_MS: int = 15000
+    DETAIL_WAIT_MS: int = 3000
+    SCROLL_WAIT_MS: int = 2000
+    PAGINATION_IDLE_ROUNDS: int = 2
+    # Default cadence for scheduler.py; override per platform or with
+    # CRAWL_INTERVAL_<PLATFORM> (minutes)
+    CRAWL_INTERVAL_MINUTES: int = 360
+    # Detail pages visited per run (None = no cap); MAX_DETAIL_PAGES_<PLATFORM>
+    MAX_DETAIL_PAGES: int | None = None
 
     def __init__(self):
         self.logger = logging.getLogger(self.platform_name)
         self._captured_responses: list[dict] = []
+        self._captured_urls: list[str] = []
+        self.pagination_max_seconds = get_env_int("PAGINATION_MAX_SECONDS", 60, min_value=1)
+        self.pagination_max_items = get_env_int("PAGINATION_MAX_ITEMS", None, min_value=1)
+        self.pagination_max_api_pages = get_env_int("PAGINATION_MAX_API_PAGES", 20, min_value=0)
+        self.max_detail_pages = self.platform_env_int("MAX_DETAIL_PAGES", self.MAX_DETAIL_PAGES, min_value=0)
+        self.context_recycle_pages = get_env_int("CONTEXT_RECYCLE_PAGES", 25, min_value=1)
+        self.memory_limit_mb = get_env_int("MEMORY_LIMIT_MB", None, min_value=64)
+        self.peak_memory_mb = 0.0
+        self.http_cache = HttpCache()
+        self.throttle = get_throttle()
+        self.latency = get_latency_store()
+        self.prefetch_workers = get_env_int("PREFETCH_WORKERS", 4, min_value=0)
+        self.prefetcher: DetailPrefetcher | None = None
+
+    @classmethod
+    def platform_env_int(cls, prefix: str, default=None, min_value=None):
+        """Read ``<PREFIX>_<PLATFORM>`` (e.g. MAX_DETAIL_PAGES_KNOWAFEST), else ``default``."""
+        suffix = "".join(c for c in cls.platform_name.upper() if c.isalnum())
+        return get_env_int(f"{prefix}_{suffix}", default, min_value=min_value)
 
     def _random_ua(self) -> str:
         return random.choice(USER_AGENTS)
 
-    def _create_context(self, playwright_instance) -> tuple:
-        browser = playwright_instance.chromium.launch(headless=True)
+    def _new_context(self, browser) -> BrowserContext:
         context = browser.new_context(
             user_agent=self._random_ua(),
             viewport={"width": 1920, "height": 1080},
             locale="en-US",
         )
+        self.http_cache.attach(context)
+        return context
+
+    def _create_context(self, playwright_instance) -> tuple:
+        browser = playwright_instance.chromium.launch(headless=True)
+        context = self._new_context(browser)
         page = context.new_page()
         if HAS_STEALTH and _stealth:
             _stealth.apply_stealth_sync(page)
@@ -47,12 +228,184 @@ class GenericScraper(ABC):
         def _handle_response(response):
             if url_pattern in response.url:
                 try:
-                    self._captured_responses.append(response.json())
+                    payload = response.json()
                 except Exception:
-                    pass
+                    return
+                self._captured_responses.append(payload)
+                self._captured_urls.append(response.url)
+                self._prefetch_payload(payload)
 
         page.on("response", _handle_response)
-        page.goto(target_url, wait_until="networkidle", timeout=30000)
+        self._goto(page, target_url, wait_until="networkidle", timeout=self.LIST_TIMEOUT_MS)
+
+    def _timeout(self, url: str, kind: str, default_ms: int) -> int:
+        return self.latency.timeout_for(self.throttle.domain_for(url), kind, default_ms)
+
+    def _goto(self, page: Page, url: str, **kwargs):
+        """Navigate through the per-domain throttle and circuit breaker, with a
+        timeout sized from the domain's observed latency (``timeout`` is the default)."""
+        kind = kwargs.get("wait_until", "load")
+        domain = self.throttle.domain_for(url)
+        kwargs["timeout"] = self.latency.timeout_for(domain, kind, kwargs.get("timeout") or self.DETAIL_TIMEOUT_MS)
+        self.throttle.acquire(url)
+        start = time.monotonic()
+        try:
+            response = page.goto(url, **kwargs)
+        except Exception:
+            self.latency.record(domain, kind, None)
+            self.throttle.record(url, error=True)
+            raise
+        self.latency.record(domain, kind, (time.monotonic() - start) * 1000)
+        self.throttle.record_response(url, response)
+        return response
+
+    def _loaded_count(self, page: Page, item_selector: str | None) -> int:
+        if not item_selector:
+            return 0
+        try:
+            return page.eval_on_selector_all(item_selector, "els => els.length")
+        except Exception:
+            return 0
+
+    def _pagination_progress(self, page: Page, item_selector: str | None) -> tuple:
+        try:
+            height = page.evaluate("document.body.scrollHeight")
+        except Exception:
+            height = 0
+        return len(self._captured_responses), self._loaded_count(page, item_selector), height
+
+    def _paginate(
+        self,
+        page: Page,
+        item_selector: str | None = None,
+        load_more_selector: str | None = None,
+        wait_ms: int | None = None,
+        max_seconds: int | None = None,
+        max_items: int | None = None,
+    ) -> int:
+        """Scroll (or click "load more") until neither new API responses, new
+        cards nor extra page height show up, or the time/item budget runs out.
+        Returns the number of rounds that loaded something new."""
+        wait_ms = wait_ms or self.SCROLL_WAIT_MS
+        deadline = time.monotonic() + (max_seconds or self.pagination_max_seconds)
+        max_items = max_items or self.pagination_max_items
+
+        progress = self._pagination_progress(page, item_selector)
+        idle_rounds = 0
+        productive_rounds = 0
+        while time.monotonic() < deadline and idle_rounds < self.PAGINATION_IDLE_ROUNDS:
+            if max_items and progress[1] >= max_items:
+                break
+
+            clicked = False
+            if load_more_selector:
+                try:
+                    button = page.query_selector(load_more_selector)
+                    if button and button.is_visible():
+                        button.click()
+                        clicked = True
+                except Exception:
+                    pass
+            if not clicked:
+                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+
+            # Poll instead of sleeping the full wait so fast pages move on quickly
+            round_deadline = time.monotonic() + wait_ms / 1000
+            current = progress
+            while time.monotonic() < round_deadline:
+                page.wait_for_timeout(250)
+                current = self._pagination_progress(page, item_selector)
+                if current != progress:
+                    break
+
+            if current == progress:
+                idle_rounds += 1
+            else:
+                idle_rounds = 0
+                productive_rounds += 1
+            progress = current
+
+        self.logger.info(
+            f"{self.platform_name}: pagination stopped after {productive_rounds} productive rounds "
+            f"({progress[0]} API responses, {progress[1]} cards)"
+        )
+        return productive_rounds
+
+    def _follow_api_pages(self, context: BrowserContext, is_empty, page_param: str = "page") -> int:
+        """Once an intercepted GET API exposes a page parameter, request the
+        following pages directly instead of scrolling for them. Stops at the
+        first page for which ``is_empty(payload)`` is true."""
+        paged_urls = [u for u in self._captured_urls if page_param in parse_qs(urlparse(u).query)]
+        if not paged_urls:
+            return 0
+        try:
+            current = max(int(parse_qs(urlparse(u).query)[page_param][0]) for u in paged_urls)
+        except ValueError:
+            return 0
+
+        parsed = urlparse(paged_urls[-1])
+        query = parse_qs(parsed.query, keep_blank_values=True)
+        deadline = time.monotonic() + self.pagination_max_seconds
+        fetched = 0
+        while fetched < self.pagination_max_api_pages and time.monotonic() < deadline:
+            current += 1
+            query[page_param] = [str(current)]
+            url = urlunparse(parsed._replace(query=urlencode(query, doseq=True)))
+            self.throttle.acquire(url)
+            start = time.monotonic()
+            try:
+                response = context.request.get(url, timeout=self._timeout(url, "request", self.LIST_TIMEOUT_MS))
+            except Exception as e:
+                self.latency.record(self.throttle.domain_for(url), "request", None)
+                self.throttle.record(url, error=True)
+                self.logger.warning(f"API page {current} failed: {e}")
+                break
+            self.latency.record(self.throttle.domain_for(url), "request", (time.monotonic() - start) * 1000)
+            self.throttle.record_response(url, response)
+            if not response.ok:
+                break
+            try:
+                payload = response.json()
+            except Exception:
+                break
+            if is_empty(payload):
+                break
+            self._captured_responses.append(payload)
+            self._captured_urls.append(url)
+            self._prefetch_payload(payload)
+            fetched += 1
+
+        self.logger.info(f"{self.platform_name}: fetched {fetched} extra API pages directly")
+        return fetched
+
+    def _dateless_links(self, payload) -> list[str]:
+        """Detail links of items in an API payload that have no date yet.
+        Scrapers that parse intercepted APIs override this so enrichment can
+        start while the listing is still loading."""
+        return []
+
+    def _prefetch_payload(self, payload):
+        if self.prefetcher is None:
+            return
+        try:
+            links = self._dateless_links(payload)
+        except Exception as e:
+            self.logger.debug(f"Could not read prefetch links: {e}")
+            return
+        for link in links:
+            if self.max_detail_pages is not None and self.prefetcher.queued >= self.max_detail_pages:
+                break
+            self.prefetcher.submit(link)
+
+    def _prefetched(self, item: HackathonItem, timeout: float = 0) -> dict | None:
+        """Prefetched details with a date; waits at most ``timeout`` seconds."""
+        if self.prefetcher is None:
+            return None
+        details = self.prefetcher.result(item.link, timeout=timeout)
+        return details if details and details.get("date") else None
+
+    def _prefetch_pending(self, item: HackathonItem) -> bool:
+        return self.prefetcher is not None and not self.prefetcher.done(item.link)
 
     def _safe_text(self, page: Page, selector: str, default: str = "") -> str:
         try:
@@ -68,24 +421,269 @@ class GenericScraper(ABC):
         except Exception:
             return default
 
-    def run(self) -> list[HackathonItem]:
-        self.logger.info(f"Starting {self.platform_name} scraper")
-        self._captured_responses.clear()
+    def _sample_memory(self) -> float | None:
+        usage = current_rss_mb()
+        if usage is not None:
+            self.peak_memory_mb = max(self.peak_memory_mb, usage)
+        return usage
+
+    def _capped(self, items: list) -> list:
+        if self.max_detail_pages is None or len(items) <= self.max_detail_pages:
+            return items
+        self.logger.info(f"{self.platform_name}: visiting {self.max_detail_pages} of {len(items)} detail pages (cap)")
+        return items[:self.max_detail_pages]
+
+    def _enrich_missing_dates(self, items: list[HackathonItem], context: BrowserContext) -> list[HackathonItem]:
+        """Visit detail pages for items missing dates to extract registration end date."""
+        dateless = self._capped([item for item in items if not item.date])
+        to_visit = {id(item) for item in dateless}
+        if self.prefetcher is not None:
+            for item in dateless:
+                self.prefetcher.submit(item.link)
+        enriched = list(items)
+        deferred = []
+        # The last page's date parses in the date pool while the next one loads
+        in_flight = None
+        with DetailContexts(self, context) as detail_contexts:
+            for index, item in enumerate(items):
+                if id(item) not in to_visit:
+                    continue
+                if self._prefetch_pending(item):
+                    deferred.append(index)
+                    continue
+                details = self._start_detail(item, detail_contexts)
+                if in_flight is not None:
+                    enriched[in_flight[0]] = self._finish_detail(*in_flight[1:])
+                in_flight = (index, item, details)
+            if in_flight is not None:
+                enriched[in_flight[0]] = self._finish_detail(*in_flight[1:])
+            # Slow prefetches go last, by when most have finished; waiting for
+            # them beats opening a tab that requests the same URL again. One
+            # still queued behind the throttle is cancelled and visited in the
+            # browser instead; one already fetching is bounded by its request
+            # timeout. Either way a miss falls back to the browser and web search.
+            for index in deferred:
+                item = items[index]
+                prefetched = self._prefetched(item, timeout=self.DETAIL_TIMEOUT_MS / 1000)
+                if not prefetched and self._prefetch_pending(item) and not self.prefetcher.cancel(item.link):
+                    timeout_ms = self._timeout(item.link, "request", self.DETAIL_TIMEOUT_MS)
+                    prefetched = self._prefetched(item, timeout=timeout_ms / 1000)
+                if prefetched:
+                    enriched[index] = self._fill_missing(item, prefetched)
+                else:
+                    enriched[index] = self._enrich_detail(item, detail_contexts)
+        return enriched
+
+    def _enrich_detail(self, item: HackathonItem, detail_contexts: DetailContexts) -> HackathonItem:
+        """Fill ``item`` from its finished prefetch, else from a browser visit."""
+        return self._finish_detail(item, self._start_detail(item, detail_contexts))
+
+    def _start_detail(self, item: HackathonItem, detail_contexts: DetailContexts) -> dict | None:
+        """Details from ``item``'s finished prefetch, else from a browser visit
+        whose date may still be parsing; None leaves the item as it is."""
+        prefetched = self._prefetched(item)
+        if prefetched:
+            return prefetched
+        detail_context = detail_contexts.get()
+        if detail_context is None:
+            return None
+        try:
+            return self._fetch_details(item, detail_context)
+        except CircuitOpenError as e:
+            self.logger.info(f"Skipping detail page for {item.title}: {e}")
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Detail page failed for {item.title}: {e}")
+            return None
+
+    def _finish_detail(self, item: HackathonItem, details: dict | None) -> HackathonItem:
+        if details is None:
+            return item
+        details = self._await_date(item, details)
+        if not details.get("date"):
+            details["date"] = search_date_on_web(item.title)
+        if not details["date"]:
+            self.logger.warning(f"No date found for: {item.title}")
+        return self._fill_missing(item, details)
+
+    @staticmethod
+    def _fill_missing(item: HackathonItem, details: dict) -> HackathonItem:
+        """Copy detail-page fields onto ``item`` without overwriting anything the listing already had."""
+        update = {}
+        for key, value in details.items():
+            if value in (None, ""):
+                continue
+            if key == "is_offline":
+                if value and not item.is_offline:
+                    update[key] = True
+            elif not getattr(item, key, None):
+                update[key] = value
+        return item.model_copy(update=update) if update else item
+
+    def _collect_date(self, date_val, title: str):
+        """Resolve a date still parsing in the date pool; search the web if
+        the page had none."""
+        if isinstance(date_val, Future):
+            try:
+                date_val = date_val.result()
+            except Exception as e:
+                self.logger.warning(f"Date extraction failed for {title}: {e}")
+                date_val = None
+        return date_val or search_date_on_web(title)
+
+    def _await_date(self, item: HackathonItem, details: dict) -> dict:
+        """Collect a detail date still parsing in the date pool and cache the
+        finished result of the visit."""
+        date = details.get("date")
+        if isinstance(date, Future):
+            try:
+                details["date"] = date.result()
+            except Exception as e:
+                self.logger.warning(f"Date extraction failed for {item.title}: {e}")
+                details["date"] = None
+            self.http_cache.store_result(item.link, details)
+        return details
+
+    def _fetch_details(self, item: HackathonItem, context: BrowserContext) -> dict:
+        # An unchanged detail page (HTTP 304) reuses last run's result
+        if self.http_cache.has_result(item.link):
+            domain = self.throttle.domain_for(item.link)
+            self.throttle.acquire(item.link)
+            start = time.monotonic()
+            unchanged, details, response = self.http_cache.revalidate(
+                context, item.link, timeout=self._timeout(item.link, "request", self.DETAIL_TIMEOUT_MS)
+            )
+            if response is None:
+                self.latency.record(domain, "request", None)
+                self.throttle.record(item.link, error=True)
+            else:
+                self.latency.record(domain, "request", (time.monotonic() - start) * 1000)
+                self.throttle.record_response(item.link, response)
+            failed = response is None or response.status == 429 or response.status >= 500
+            if unchanged or failed:
+                # A failing domain is not worth a second full timeout in the
+                # browser; keep last run's result until it recovers.
+                return {"date": details} if isinstance(details, str) else dict(details or {})
+        return self._visit_detail(item, context)
+
+    def _visit_detail(self, item: HackathonItem, context: BrowserContext) -> dict:
+        detail = context.new_page()
+        try:
+            self._goto(detail, item.link, wait_until="domcontentloaded", timeout=self.DETAIL_TIMEOUT_MS)
+
+            # Structured data is in the server-rendered HTML, so it needs no
+            # settle time; only the heuristic text scan waits for client rendering.
+            details = extract_from_page(detail)
+            if details.get("date"):
+                self.http_cache.store_result(item.link, details)
+            else:
+                detail.wait_for_timeout(self.DETAIL_WAIT_MS)
+                # A Future; _await_date collects and caches it
+                details["date"] = self._extract_detail_date(detail)
+            return details
+        finally:
+            detail.close()
+
+    def _relevant_text(self, detail: Page) -> str:
+        """Return the deadline-bearing regions of a detail page, bounded to DETAIL_TEXT_LIMIT."""
+        try:
+            return detail.evaluate(
+                RELEVANT_TEXT_JS,
+                {"keywords": DEADLINE_KEYWORDS, "span": 300, "limit": DETAIL_TEXT_LIMIT},
+            )
+        except Exception as e:
+            self.logger.debug(f"Relevant-text extraction failed, using body text: {e}")
+            return bound_text(detail.inner_text("body"))
+
+    def _detail_date_texts(self, detail: Page) -> list[str]:
+        """Texts of a detail page searched, in order, for the registration end date."""
+        return [self._relevant_text(detail)]
+
+    def _extract_detail_date(self, detail: Page) -> Future:
+        return get_date_service().submit(*self._detail_date_texts(detail))
+
+    @contextmanager
+    def _browser_session(self):
         pw = sync_playwright().start()
         try:
             browser, context, page = self._create_context(pw)
             try:
-                results = self.scrape(page, context)
-                self.logger.info(f"{self.platform_name}: scraped {len(results)} items")
-                return results
+                yield page, context
             finally:
                 context.close()
                 browser.close()
+        finally:
+            pw.stop()
+
+    def run(self) -> list[HackathonItem]:
+        self.logger.info(f"Starting {self.platform_name} scraper")
+        self._captured_responses.clear()
+        self._captured_urls.clear()
+        self.peak_memory_mb = 0.0
+        if self.prefetch_workers:
+            self.prefetcher = DetailPrefetcher(
+                self.http_cache, self.throttle, self.latency,
+                user_agent=self._random_ua(),
+                timeout_ms=self.DETAIL_TIMEOUT_MS,
+                workers=self.prefetch_workers,
+            )
+        try:
+            with self._browser_session() as (page, context):
+                try:
+                    results = self.scrape(page, context)
+                finally:
+                    # Before the browser closes, and even when scrape() raised
+                    self._sample_memory()
+                self.logger.info(f"{self.platform_name}: scraped {len(results)} items")
+                self.logger.info(
+                    f"{self.platform_name}: HTTP cache {self.http_cache.hits} hits, {self.http_cache.misses} misses"
+                )
+                return results
         except Exception as e:
             self.logger.error(f"{self.platform_name} failed: {e}")
             return []
         finally:
-            pw.stop()
+            if self.prefetcher is not None:
+                self.logger.info(f"{self.platform_name}: {self.prefetcher.hits} dates found by prefetch")
+                self.prefetcher.close()
+                self.prefetcher = None
+            self.latency.save()
+            self.http_cache.prune()
+            self._log_memory()
+
+    def _log_memory(self):
+        # At least one sample, even if the browser never started
+        self._sample_memory()
+        peak = peak_rss_mb()
+        self.logger.info(
+            f"{self.platform_name}: peak RSS {self.peak_memory_mb:.0f} MB sampled incl. browser"
+            + (f", process high-water {peak:.0f} MB" if peak is not None else "")
+        )
+
+    def recheck(self, items: list[HackathonItem]) -> list[HackathonItem]:
+        """Re-read the detail pages of already-stored items and return them with
+        the registration end date found now (``date`` stays None if none was).
+        Unchanged pages are answered from the HTTP cache with a 304."""
+        rechecked = []
+        try:
+            with self._browser_session() as (_, context), DetailContexts(self, context) as detail_contexts:
+                for item in self._capped(items):
+                    detail_context = detail_contexts.get()
+                    if detail_context is None:
+                        break
+                    try:
+                        details = self._await_date(item, self._fetch_details(item, detail_context))
+                    except CircuitOpenError as e:
+                        self.logger.info(f"{self.platform_name}: recheck stopped: {e}")
+                        break
+                    except Exception as e:
+                        self.logger.warning(f"Recheck failed for {item.title}: {e}")
+                        continue
+                    rechecked.append(item.model_copy(update={"date": details.get("date")}))
+        except Exception as e:
+            self.logger.error(f"{self.platform_name} recheck failed: {e}")
+        self.latency.save()
+        return rechecked
 
     @abstractmethod
     def scrape(self, page: Page, context: BrowserContext) -> list[HackathonItem]:
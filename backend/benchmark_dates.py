@@ -0,0 +1,99 @@
+"""Per-call latency of date parsing: dateparser defaults (language
+autodetection across every locale) versus the shared, English-locale parsers
+in date_parser.py.
+
+    python benchmark_dates.py [--rounds N]
+
+Each variant runs in a fresh subprocess so its first-call cost is measured
+cold rather than inherited from the other variant.
+"""
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+SAMPLES = [
+    "Dec 5, 2026",
+    "5 December 2026",
+    "05/12/2026",
+    "2026-12-05",
+    "Registration closes on 5 Dec 2026 at 11:59 PM IST",
+    "Applications close in 3 days",
+    "Last date to register: 15th November 2026",
+    "Submission deadline: Nov 30, 2026",
+    "Oct 12 - 14, 2026",
+    "Starts 1 Jan 2027, ends 3 Jan 2027",
+]
+
+VARIANTS = {
+    "default": (
+        "import dateparser\n"
+        "from dateparser.search import search_dates\n"
+        "settings = {'PREFER_DATES_FROM': 'future', 'RETURN_AS_TIMEZONE_AWARE': False}\n"
+        "parse = lambda t: dateparser.parse(t, settings=settings)\n"
+        "search = lambda t: search_dates(t, settings=settings)\n"
+    ),
+    "shared": (
+        "import date_parser\n"
+        "parse = date_parser.parse\n"
+        "search = date_parser.search\n"
+    ),
+}
+
+_RUNNER = """
+import json, sys, time
+{setup}
+samples, rounds = json.loads(sys.argv[1]), int(sys.argv[2])
+out = {{}}
+for name, fn in (("parse", parse), ("search", search)):
+    start = time.perf_counter()
+    fn(samples[0])
+    first = time.perf_counter() - start
+    timings = []
+    for _ in range(rounds):
+        for text in samples:
+            start = time.perf_counter()
+            fn(text)
+            timings.append(time.perf_counter() - start)
+    out[name] = {{"first": first, "timings": timings}}
+print(json.dumps(out))
+"""
+
+
+def _run_variant(setup: str, rounds: int) -> dict:
+    code = _RUNNER.format(setup=setup)
+    result = subprocess.run(
+        [sys.executable, "-c", code, json.dumps(SAMPLES), str(rounds)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:8.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{len(SAMPLES)} samples x {args.rounds} rounds, times in ms")
+    print(f"{'variant':<8} {'call':<7} {'first':>8} {'mean':>8} {'p50':>8} {'p95':>8}")
+    for variant, setup in VARIANTS.items():
+        started = time.perf_counter()
+        results = _run_variant(setup, args.rounds)
+        for call, data in results.items():
+            timings = sorted(data["timings"])
+            p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+            print(
+                f"{variant:<8} {call:<7} {_ms(data['first'])} {_ms(statistics.mean(timings))} "
+                f"{_ms(statistics.median(timings))} {_ms(p95)}"
+            )
+        print(f"{variant:<8} total   {_ms(time.perf_counter() - started)}")
+
+
+if __name__ == "__main__":
+    main()
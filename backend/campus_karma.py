@@ -1,13 +1,17 @@
 import re
-import dateparser
+import date_parser
 from playwright.sync_api import Page, BrowserContext
-from base_scraper import GenericScraper
+from base_scraper import GenericScraper, DetailContexts
+from structured_data import extract_from_page
 from models import HackathonItem
-from utils import extract_reg_end_date_from_text, search_date_on_web
+from date_service import get_date_service
 
 
 class CampusKarmaScraper(GenericScraper):
     platform_name = "CampusKarma"
+    CRAWL_INTERVAL_MINUTES = 720
+    MAX_DETAIL_PAGES = 20
+    DETAIL_TIMEOUT_MS = 10000
     TARGET_URL = "https://www.campuskarma.in"
     HACKATHON_KEYWORDS = ["hackathon", "hack", "code", "coding", "tech", "programming", "software"]
 
@@ -15,7 +19,7 @@ class CampusKarmaScraper(GenericScraper):
         items = []
 
         try:
-            page.goto(self.TARGET_URL, wait_until="domcontentloaded", timeout=30000)
+            self._goto(page, self.TARGET_URL, wait_until="domcontentloaded", timeout=self.LIST_TIMEOUT_MS)
             page.wait_for_timeout(5000)
         except Exception:
             self.logger.warning("CampusKarma page load failed or timed out")
@@ -53,44 +57,55 @@ class CampusKarmaScraper(GenericScraper):
                 is_offline=True,
             ))
 
-        for item in candidates[:20]:
-            try:
-                detail = context.new_page()
-                detail.goto(item.link, wait_until="domcontentloaded", timeout=10000)
-                detail.wait_for_timeout(2000)
-                body = detail.inner_text("body")
-
-                # Try regex-based date extraction
-                date_val = None
-                date_match = re.findall(
-                    r"(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})",
-                    body, re.IGNORECASE
-                )
-                if date_match:
-                    dt = dateparser.parse(date_match[-1], settings={"PREFER_DATES_FROM": "future"})
-                    if dt:
-                        date_val = dt.strftime("%Y-%m-%d")
-
-                # Fallback: use generic extractor
-                if not date_val:
-                    date_val = extract_reg_end_date_from_text(body)
-
-                # Fallback: web search
-                if not date_val:
-                    date_val = search_date_on_web(item.title)
-
-                items.append(HackathonItem(
-                    title=item.title,
-                    date=date_val,
-                    link=item.link,
-                    source_platform="CampusKarma",
-                    location="Chennai",
-                    is_offline=True,
-                ))
-                detail.close()
-            except Exception:
-                continue
-
+        # (item, date or a Future still parsing in the date pool)
+        found = []
+        with DetailContexts(self, context) as detail_contexts:
+            for item in self._capped(candidates):
+                detail_context = detail_contexts.get()
+                if detail_context is None:
+                    break
+                detail = detail_context.new_page()
+                try:
+                    self._goto(detail, item.link, wait_until="domcontentloaded", timeout=self.DETAIL_TIMEOUT_MS)
+                    detail.wait_for_timeout(2000)
+                    body = detail.inner_text("body")
+
+                    structured = extract_from_page(detail)
+                    date_val = structured.get("date")
+
+                    # Try regex-based date extraction
+                    if not date_val:
+                        date_match = re.findall(
+                            r"(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})",
+                            body, re.IGNORECASE
+                        )
+                        if date_match:
+                            dt = date_parser.parse(date_match[-1])
+                            if dt:
+                                date_val = dt.strftime("%Y-%m-%d")
+
+                    # Fallback: generic extractor, parsed while the next page loads
+                    if not date_val:
+                        date_val = get_date_service().submit(body)
+
+                    found.append((HackathonItem(
+                        title=item.title,
+                        organizer=structured.get("organizer", ""),
+                        link=item.link,
+                        source_platform="CampusKarma",
+                        location="Chennai",
+                        is_offline=True,
+                    ), date_val))
+                except Exception:
+                    continue
+                finally:
+                    detail.close()
+
+        # Fallback: web search, for pages the extractor found nothing on
+        items = [
+            found_item.model_copy(update={"date": self._collect_date(date_val, found_item.title)})
+            for found_item, date_val in found
+        ]
         if not items:
             items = candidates
 
@@ -0,0 +1,62 @@
+import os
+import threading
+from dateparser.date import DateDataParser
+from dateparser.languages.loader import default_loader
+from dateparser.search import search_dates as _search_dates
+
+# Our sources publish English dates only; restricting the locale set skips
+# dateparser's detection across every bundled locale, which dominates its
+# per-call cost and first-call latency. Most listings are Indian and write
+# DD/MM/YYYY, so en-IN (day-first) goes before en (month-first). dateparser
+# cannot mix regions of one language in a parser, so each locale gets its
+# own and they are tried in order.
+DATE_LOCALES = [loc.strip() for loc in os.environ.get("DATE_LOCALES", "en-IN,en").split(",") if loc.strip()]
+DATE_SETTINGS = {"PREFER_DATES_FROM": "future", "RETURN_AS_TIMEZONE_AWARE": False}
+
+_parsers: list[DateDataParser] | None = None
+_parsers_lock = threading.Lock()
+
+
+def get_parsers() -> list[DateDataParser]:
+    global _parsers
+    with _parsers_lock:
+        if _parsers is None:
+            _parsers = [DateDataParser(locales=[locale], settings=DATE_SETTINGS) for locale in DATE_LOCALES]
+        return _parsers
+
+
+def _search_settings(locale: str) -> dict:
+    # search_dates takes languages but not locales, so the locale's field
+    # order is passed through the settings instead
+    date_order = default_loader.get_locale(locale).info.get("date_order")
+    return dict(DATE_SETTINGS, DATE_ORDER=date_order) if date_order else DATE_SETTINGS
+
+
+def parse(text: str):
+    """``dateparser.parse`` with the shared locales and settings; returns a datetime or None."""
+    if not text:
+        return None
+    for parser in get_parsers():
+        date_obj = parser.get_date_data(text).date_obj
+        if date_obj is not None:
+            return date_obj
+    return None
+
+
+def search(text: str):
+    """``dateparser.search.search_dates`` with the shared locales and settings."""
+    if not text:
+        return None
+    for locale in DATE_LOCALES:
+        found = _search_dates(text, languages=[locale.split("-")[0]], settings=_search_settings(locale))
+        if found:
+            return found
+    return None
+
+
+def warm_up():
+    """Load the locale data and compile dateparser's patterns up front so
+    the first real page does not pay for it. Also used as the date worker
+    pool initializer."""
+    parse("15 January 2026")
+    search("Registration closes on 15 January 2026")
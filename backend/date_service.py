@@ -0,0 +1,128 @@
+import os
+import atexit
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from date_parser import warm_up
+from utils import extract_reg_end_date_from_text, parse_date_flexible, get_env_int
+
+
+def _extract_first(texts) -> str | None:
+    """First registration end date found in ``texts``, tried in order."""
+    for text in texts:
+        found = extract_reg_end_date_from_text(text)
+        if found:
+            return found
+    return None
+
+
+class DateService:
+    """Runs dateparser-heavy work in a process pool.
+
+    dateparser is pure Python and holds the GIL, so parsing inline stalls
+    the Playwright thread, the prefetch workers and the HTTP cache route
+    handlers alike. Batches and ``submit()``ed detail texts run on
+    DATE_WORKERS processes instead; ``submit()`` returns a Future so the
+    scraper can load the next page while the last one is parsed. Batches
+    smaller than DATE_POOL_MIN_BATCH, or DATE_WORKERS <= 1, run inline:
+    pickling plus IPC would cost more than the parsing.
+    """
+
+    def __init__(self):
+        self.workers = get_env_int("DATE_WORKERS", os.cpu_count() or 1, min_value=0)
+        self.min_batch = get_env_int("DATE_POOL_MIN_BATCH", 16, min_value=1)
+        self.logger = logging.getLogger("date_service")
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor | None:
+        if self.workers <= 1:
+            return None
+        with self._lock:
+            if self._pool is None:
+                try:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        # Forking would copy a process that already runs the
+                        # prefetch threads and Playwright driver, locks included
+                        mp_context=multiprocessing.get_context(
+                            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                        ),
+                        initializer=warm_up,
+                    )
+                except (OSError, NotImplementedError) as e:
+                    self.logger.warning(f"Process pool unavailable, parsing dates inline: {e}")
+                    self.workers = 0
+            return self._pool
+
+    def _reset(self, error, pool: ProcessPoolExecutor | None = None):
+        with self._lock:
+            # Every future of a broken pool fails; restart it only once
+            if self._pool is None or (pool is not None and pool is not self._pool):
+                return
+            self.logger.warning(f"Date worker pool failed, restarting it: {error}")
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _map(self, fn, values: list) -> list:
+        pool = self._get_pool() if len(values) >= self.min_batch else None
+        if pool is None:
+            return [fn(v) for v in values]
+        try:
+            return list(pool.map(fn, values, chunksize=max(1, len(values) // (self.workers * 4))))
+        except Exception as e:
+            self._reset(e, pool)
+            return [fn(v) for v in values]
+
+    def submit(self, *texts: str) -> Future:
+        """Future for the first registration end date found in ``texts``,
+        extracted in the pool; already resolved when there is no pool. If the
+        pool breaks, the texts are parsed inline instead."""
+        future = Future()
+        pool = self._get_pool()
+        if pool is not None:
+            try:
+                pool_future = pool.submit(_extract_first, texts)
+            except Exception as e:
+                self._reset(e, pool)
+            else:
+                pool_future.add_done_callback(lambda done: self._settle(future, done, texts, pool))
+                return future
+        future.set_result(_extract_first(texts))
+        return future
+
+    def _settle(self, future: Future, done: Future, texts, pool: ProcessPoolExecutor):
+        try:
+            future.set_result(done.result())
+        except Exception as e:
+            self._reset(e, pool)
+            try:
+                future.set_result(_extract_first(texts))
+            except Exception as inline_error:
+                future.set_exception(inline_error)
+
+    def extract_many(self, texts: list[str]) -> list:
+        return self._map(extract_reg_end_date_from_text, texts)
+
+    def parse_many(self, values: list) -> list:
+        return self._map(parse_date_flexible, values)
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+
+_service: DateService | None = None
+_service_lock = threading.Lock()
+
+
+def get_date_service() -> DateService:
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = DateService()
+            atexit.register(_service.shutdown)
+        return _service
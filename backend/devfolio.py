@@ -2,22 +2,20 @@ import time
 from playwright.sync_api import Page, BrowserContext
 from base_scraper import GenericScraper
 from models import HackathonItem
-from utils import extract_reg_end_date_from_text, search_date_on_web
 
 
 class DevfolioScraper(GenericScraper):
     platform_name = "Devfolio"
+    CRAWL_INTERVAL_MINUTES = 120
     TARGET_URL = "https://devfolio.co/hackathons/open"
     API_PATTERN = "api.devfolio.co"
+    CARD_SELECTOR = "a[href*='/hackathons/']"
 
     def scrape(self, page: Page, context: BrowserContext) -> list[HackathonItem]:
         items: list[HackathonItem] = []
 
         self._intercept_api(page, self.API_PATTERN, self.TARGET_URL)
-
-        for _ in range(5):
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(2000)
+        self._paginate(page, item_selector=self.CARD_SELECTOR)
 
         if self._captured_responses:
             items = self._parse_api_responses()
@@ -30,105 +28,71 @@ class DevfolioScraper(GenericScraper):
 
         return items
 
+    def _dateless_links(self, payload) -> list[str]:
+        return [item.link for item in self._items_from_payload(payload) if not item.date]
+
     def _parse_api_responses(self) -> list[HackathonItem]:
         items = []
         for payload in self._captured_responses:
-            hackathons = []
-            if isinstance(payload, dict):
-                hackathons = payload.get("results", payload.get("hackathons", []))
-                if not hackathons and "data" in payload:
-                    hackathons = payload["data"] if isinstance(payload["data"], list) else []
-
-            for h in hackathons:
-                if not isinstance(h, dict):
-                    continue
-                name = h.get("name", "") or h.get("title", "")
-                if not name:
-                    continue
-
-                slug = h.get("slug", "")
-                link = f"https://devfolio.co/hackathons/{slug}" if slug else ""
-                if not link:
-                    continue
-
-                # Try multiple API fields for end date
-                end_date = (
-                    h.get("application_end_at")
-                    or h.get("applications_end_at")
-                    or h.get("reg_end_at")
-                    or h.get("ends_at")
-                    or h.get("hackathon_end")
-                    or ""
-                )
-                if end_date and "T" in str(end_date):
-                    end_date = str(end_date).split("T")[0]
-                elif not end_date:
-                    end_date = None
-
-                location = h.get("location", "") or ""
-                is_offline = h.get("is_offline", False)
-                logo = h.get("logo", "") or h.get("cover_img", "") or ""
-                organizer = h.get("organisation_name", "") or ""
-                themes = ", ".join(h.get("themes", [])) if isinstance(h.get("themes"), list) else ""
-
-                items.append(HackathonItem(
-                    title=name,
-                    organizer=organizer,
-                    date=end_date if end_date else None,
-                    location=location,
-                    link=link,
-                    source_platform="Devfolio",
-                    is_offline=bool(is_offline),
-                    image_url=logo,
-                    themes=themes,
-                ))
+            items.extend(self._items_from_payload(payload))
         return items
 
-    def _enrich_missing_dates(self, items: list[HackathonItem], context: BrowserContext) -> list[HackathonItem]:
-        """Visit detail pages for items missing dates to extract registration end date."""
-        enriched = []
-        for item in items:
-            if item.date:
-                enriched.append(item)
+    def _items_from_payload(self, payload) -> list[HackathonItem]:
+        items = []
+        hackathons = []
+        if isinstance(payload, dict):
+            hackathons = payload.get("results", payload.get("hackathons", []))
+            if not hackathons and "data" in payload:
+                hackathons = payload["data"] if isinstance(payload["data"], list) else []
+
+        for h in hackathons:
+            if not isinstance(h, dict):
+                continue
+            name = h.get("name", "") or h.get("title", "")
+            if not name:
+                continue
+
+            slug = h.get("slug", "")
+            link = f"https://devfolio.co/hackathons/{slug}" if slug else ""
+            if not link:
                 continue
 
-            try:
-                detail = context.new_page()
-                detail.goto(item.link, wait_until="domcontentloaded", timeout=15000)
-                detail.wait_for_timeout(3000)
-
-                body_text = detail.inner_text("body")
-                found_date = extract_reg_end_date_from_text(body_text)
-
-                if not found_date:
-                    found_date = search_date_on_web(item.title)
-
-                if found_date:
-                    enriched.append(HackathonItem(
-                        title=item.title,
-                        organizer=item.organizer,
-                        date=found_date,
-                        location=item.location,
-                        link=item.link,
-                        source_platform=item.source_platform,
-                        is_offline=item.is_offline,
-                        image_url=item.image_url,
-                        themes=item.themes,
-                    ))
-                else:
-                    self.logger.warning(f"No date found for: {item.title}")
-                    enriched.append(item)
-
-                detail.close()
-            except Exception as e:
-                self.logger.warning(f"Detail page failed for {item.title}: {e}")
-                enriched.append(item)
-
-        return enriched
+            # Try multiple API fields for end date
+            end_date = (
+                h.get("application_end_at")
+                or h.get("applications_end_at")
+                or h.get("reg_end_at")
+                or h.get("ends_at")
+                or h.get("hackathon_end")
+                or ""
+            )
+            if end_date and "T" in str(end_date):
+                end_date = str(end_date).split("T")[0]
+            elif not end_date:
+                end_date = None
+
+            location = h.get("location", "") or ""
+            is_offline = h.get("is_offline", False)
+            logo = h.get("logo", "") or h.get("cover_img", "") or ""
+            organizer = h.get("organisation_name", "") or ""
+            themes = ", ".join(h.get("themes", [])) if isinstance(h.get("themes"), list) else ""
+
+            items.append(HackathonItem(
+                title=name,
+                organizer=organizer,
+                date=end_date if end_date else None,
+                location=location,
+                link=link,
+                source_platform="Devfolio",
+                is_offline=bool(is_offline),
+                image_url=logo,
+                themes=themes,
+            ))
+        return items
 
     def _fallback_dom(self, page: Page) -> list[HackathonItem]:
         items = []
-        cards = page.query_selector_all("a[href*='/hackathons/']")
+        cards = page.query_selector_all(self.CARD_SELECTOR)
         seen = set()
         for card in cards:
             href = card.get_attribute("href") or ""
@@ -1,28 +1,21 @@
 import re
 import time
-import dateparser
+import date_parser
 from playwright.sync_api import Page, BrowserContext
 from base_scraper import GenericScraper
 from models import HackathonItem
-from utils import extract_reg_end_date_from_text, search_date_on_web
 
 
 class DevpostScraper(GenericScraper):
     platform_name = "Devpost"
+    CRAWL_INTERVAL_MINUTES = 180
     TARGET_URL = "https://devpost.com/hackathons?challenge_type[]=online&status[]=upcoming"
 
     def scrape(self, page: Page, context: BrowserContext) -> list[HackathonItem]:
-        page.goto(self.TARGET_URL, wait_until="domcontentloaded", timeout=30000)
+        self._goto(page, self.TARGET_URL, wait_until="domcontentloaded", timeout=self.LIST_TIMEOUT_MS)
         page.wait_for_selector(".hackathon-tile", timeout=15000)
 
-        last_height = page.evaluate("document.body.scrollHeight")
-        while True:
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(3000)
-            new_height = page.evaluate("document.body.scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
+        self._paginate(page, item_selector=".hackathon-tile", wait_ms=3000)
 
         tiles = page.query_selector_all(".hackathon-tile")
         items = []
@@ -74,53 +67,15 @@ class DevpostScraper(GenericScraper):
 
         return items
 
-    def _enrich_missing_dates(self, items: list[HackathonItem], context: BrowserContext) -> list[HackathonItem]:
-        """Visit detail pages for items missing dates."""
-        enriched = []
-        for item in items:
-            if item.date:
-                enriched.append(item)
-                continue
+    def _detail_date_texts(self, detail: Page) -> list[str]:
+        texts = super()._detail_date_texts(detail)
 
-            try:
-                detail = context.new_page()
-                detail.goto(item.link, wait_until="domcontentloaded", timeout=15000)
-                detail.wait_for_timeout(3000)
-
-                body_text = detail.inner_text("body")
-                found_date = extract_reg_end_date_from_text(body_text)
-
-                # Also check for specific Devpost deadline selectors
-                if not found_date:
-                    deadline_el = detail.query_selector("#submission-period, .deadline, [data-deadline]")
-                    if deadline_el:
-                        found_date = extract_reg_end_date_from_text(deadline_el.inner_text().strip())
-
-                if not found_date:
-                    found_date = search_date_on_web(item.title)
-
-                if found_date:
-                    enriched.append(HackathonItem(
-                        title=item.title,
-                        organizer=item.organizer,
-                        date=found_date,
-                        location=item.location,
-                        link=item.link,
-                        source_platform=item.source_platform,
-                        is_offline=item.is_offline,
-                        image_url=item.image_url,
-                        themes=item.themes,
-                    ))
-                else:
-                    self.logger.warning(f"No date found for: {item.title}")
-                    enriched.append(item)
-
-                detail.close()
-            except Exception as e:
-                self.logger.warning(f"Detail page failed for {item.title}: {e}")
-                enriched.append(item)
-
-        return enriched
+        # Also check for specific Devpost deadline selectors
+        deadline_el = detail.query_selector("#submission-period, .deadline, [data-deadline]")
+        if deadline_el:
+            texts.append(deadline_el.inner_text().strip())
+
+        return texts
 
     @staticmethod
     def _parse_date_range(text: str):
@@ -133,7 +88,7 @@ class DevpostScraper(GenericScraper):
                 month_match = re.search(r"([a-zA-Z]+)", parts[0].strip())
                 if month_match:
                     end_part = f"{month_match.group(1)} {end_part}"
-            dt = dateparser.parse(end_part)
+            dt = date_parser.parse(end_part)
             return dt.strftime("%Y-%m-%d") if dt else None
         except Exception:
             return None
@@ -1,24 +1,19 @@
-import re
+from geo import get_matcher
 
 
-CHENNAI_KEYWORDS = [
-    "chennai", "thandalam", "kattankulathur", "omr", "guindy",
-    "vadapalani", "tambaram", "chromepet", "avadi", "porur",
-    "sholinganallur", "velachery", "adyar", "nungambakkam",
-    "thiruvanmiyur", "sriperumbudur", "chengalpattu", "kelambakkam",
-]
-
-_PATTERN = re.compile(
-    r"\b(" + "|".join(re.escape(k) for k in CHENNAI_KEYWORDS) + r")\b",
-    re.IGNORECASE,
-)
+def is_in_city(location: str, city: str) -> bool:
+    if not location:
+        return False
+    return get_matcher().matches(location, city)
 
 
 def is_chennai(location: str) -> bool:
-    if not location:
-        return False
-    return bool(_PATTERN.search(location))
+    return is_in_city(location, "Chennai")
+
+
+def filter_city(items: list, city: str) -> list:
+    return [i for i in items if is_in_city(getattr(i, "location", "") or "", city)]
 
 
 def filter_chennai(items: list) -> list:
-    return [i for i in items if is_chennai(getattr(i, "location", "") or "")]
+    return filter_city(items, "Chennai")
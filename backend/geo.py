@@ -0,0 +1,57 @@
+import os
+import re
+import json
+from functools import lru_cache
+
+GAZETTEER_PATH = os.environ.get("GAZETTEER_PATH") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "gazetteer.json"
+)
+
+
+class LocationMatcher:
+    """Maps free-text locations to normalised city tags.
+
+    Every alias in the gazetteer is compiled into one alternation (longest
+    aliases first), so tagging a location is a single regex scan however
+    many cities are listed.
+    """
+
+    def __init__(self, gazetteer: dict[str, list[str]]):
+        self._alias_to_city: dict[str, str] = {}
+        for city, aliases in gazetteer.items():
+            for alias in [city, *aliases]:
+                self._alias_to_city[self._normalize(alias)] = city
+        alternation = "|".join(
+            re.escape(alias).replace(r"\ ", r"\s+")
+            for alias in sorted(self._alias_to_city, key=len, reverse=True)
+        )
+        self._pattern = re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+        self.cities = list(gazetteer)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    def city_tags(self, text: str) -> list[str]:
+        """Return the distinct cities mentioned in ``text``, in order of appearance."""
+        if not text:
+            return []
+        tags = []
+        for match in self._pattern.finditer(text):
+            city = self._alias_to_city.get(self._normalize(match.group(0)))
+            if city and city not in tags:
+                tags.append(city)
+        return tags
+
+    def matches(self, text: str, city: str) -> bool:
+        return city in self.city_tags(text)
+
+
+@lru_cache(maxsize=None)
+def get_matcher(path: str = GAZETTEER_PATH) -> LocationMatcher:
+    with open(path, "r", encoding="utf-8") as f:
+        return LocationMatcher(json.load(f))
+
+
+def city_tags(text: str) -> list[str]:
+    return get_matcher().city_tags(text)
@@ -1,22 +1,22 @@
 import time
 from datetime import datetime, timedelta
 from playwright.sync_api import Page, BrowserContext
-from base_scraper import GenericScraper
+from base_scraper import GenericScraper, LOAD_MORE_SELECTOR
 from models import HackathonItem
-from utils import extract_reg_end_date_from_text, search_date_on_web
+from date_service import get_date_service
 
 
 class HackerEarthScraper(GenericScraper):
     platform_name = "HackerEarth"
+    CRAWL_INTERVAL_MINUTES = 240
     TARGET_URL = "https://www.hackerearth.com/challenges/"
+    CARD_SELECTOR = ".challenge-card-modern, .challenge-card"
 
     def scrape(self, page: Page, context: BrowserContext) -> list[HackathonItem]:
-        page.goto(self.TARGET_URL, wait_until="domcontentloaded", timeout=30000)
+        self._goto(page, self.TARGET_URL, wait_until="domcontentloaded", timeout=self.LIST_TIMEOUT_MS)
         page.wait_for_timeout(5000)
 
-        for _ in range(5):
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(2000)
+        self._paginate(page, item_selector=self.CARD_SELECTOR, load_more_selector=LOAD_MORE_SELECTOR)
 
         cards = page.query_selector_all(".challenge-card-modern")
         if not cards:
@@ -25,6 +25,7 @@ class HackerEarthScraper(GenericScraper):
             cards = page.query_selector_all("[class*='challenge']")
 
         items = []
+        card_texts = []
         for card in cards:
             try:
                 anchor = card.query_selector("a[href]")
@@ -44,60 +45,21 @@ class HackerEarthScraper(GenericScraper):
                     image_url = img.get_attribute("src") or ""
 
                 text_content = card.inner_text()
-                end_date = extract_reg_end_date_from_text(text_content)
-
                 items.append(HackathonItem(
                     title=title,
-                    date=end_date,
                     link=link,
                     source_platform="HackerEarth",
                     image_url=image_url or None,
                 ))
+                card_texts.append(text_content)
             except Exception:
                 continue
 
+        # Parse all card dates in one batch across the date worker pool
+        end_dates = get_date_service().extract_many(card_texts)
+        items = [item.model_copy(update={"date": end_date}) for item, end_date in zip(items, end_dates)]
+
         # Enrich items missing dates by visiting their detail pages
         items = self._enrich_missing_dates(items, context)
 
         return items
-
-    def _enrich_missing_dates(self, items: list[HackathonItem], context: BrowserContext) -> list[HackathonItem]:
-        """Visit detail pages for items missing dates."""
-        enriched = []
-        for item in items:
-            if item.date:
-                enriched.append(item)
-                continue
-
-            try:
-                detail = context.new_page()
-                detail.goto(item.link, wait_until="domcontentloaded", timeout=15000)
-                detail.wait_for_timeout(3000)
-
-                body_text = detail.inner_text("body")
-                found_date = extract_reg_end_date_from_text(body_text)
-
-                if not found_date:
-                    found_date = search_date_on_web(item.title)
-
-                if found_date:
-                    enriched.append(HackathonItem(
-                        title=item.title,
-                        organizer=item.organizer,
-                        date=found_date,
-                        location=item.location,
-                        link=item.link,
-                        source_platform=item.source_platform,
-                        is_offline=item.is_offline,
-                        image_url=item.image_url,
-                    ))
-                else:
-                    self.logger.warning(f"No date found for: {item.title}")
-                    enriched.append(item)
-
-                detail.close()
-            except Exception as e:
-                self.logger.warning(f"Detail page failed for {item.title}: {e}")
-                enriched.append(item)
-
-        return enriched
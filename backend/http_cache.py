@@ -0,0 +1,249 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from utils import get_cache_dir, get_env_bool, get_env_int
+
+CACHEABLE_RESOURCE_TYPES = {"document", "xhr", "fetch"}
+# Response headers kept with a body and replayed when a 304 is answered from
+# disk. Bodies are stored decoded (Playwright and urllib both decompress), so
+# content-encoding and content-length must not be replayed with them.
+REPLAYED_HEADERS = ("content-type", "content-language", "cache-control", "expires", "vary")
+# Entries not used for this long are pruned, then the least recently used
+# ones until the cache fits in HTTP_CACHE_MAX_MB
+HTTP_CACHE_MAX_MB = get_env_int("HTTP_CACHE_MAX_MB", 256, min_value=1)
+HTTP_CACHE_MAX_AGE_DAYS = get_env_int("HTTP_CACHE_MAX_AGE_DAYS", 30, min_value=1)
+
+
+class HttpCache:
+    """On-disk HTTP cache keyed by URL.
+
+    Each entry keeps the ETag/Last-Modified validators, the last response body
+    and optionally the extraction result for that URL, so an unchanged page can
+    be answered from disk (or skipped entirely) on the next run. An entry's
+    mtime marks its last use, which ``prune()`` evicts by.
+    """
+
+    def __init__(self, namespace: str = "http"):
+        self.enabled = get_env_bool("HTTP_CACHE_ENABLED", True)
+        self.directory = get_cache_dir(namespace) if self.enabled else None
+        self.logger = logging.getLogger("http_cache")
+        self.hits = 0
+        self.misses = 0
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def get(self, url: str) -> dict | None:
+        if not self.enabled:
+            return None
+        meta_path, _ = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path: str, data: bytes):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _write_entry(self, url: str, entry: dict):
+        meta_path, _ = self._paths(url)
+        self._write(meta_path, json.dumps(entry).encode("utf-8"))
+
+    def validators(self, url: str) -> dict:
+        entry = self.get(url) or {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def body(self, url: str) -> bytes | None:
+        if not self.enabled:
+            return None
+        _, body_path = self._paths(url)
+        try:
+            with open(body_path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store(self, url: str, headers: dict, body: bytes | None = None):
+        """Save validators (and body) from a 200 response. Responses without
+        validators are not cached since they can never be revalidated."""
+        if not self.enabled:
+            return
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+
+        entry = self.get(url) or {}
+        if entry.get("etag") != etag or entry.get("last_modified") != last_modified:
+            # The resource changed, so any previous extraction result is stale
+            entry.pop("result", None)
+        entry.pop("content_type", None)
+        entry.update({
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {name: headers[name] for name in REPLAYED_HEADERS if headers.get(name)},
+            "stored_at": time.time(),
+        })
+        try:
+            if body is not None:
+                _, body_path = self._paths(url)
+                self._write(body_path, body)
+            self._write_entry(url, entry)
+        except OSError as e:
+            self.logger.warning(f"Could not write cache entry for {url}: {e}")
+
+    def store_result(self, url: str, result):
+        """Remember the extraction result for a URL whose validators are cached."""
+        entry = self.get(url)
+        if not entry:
+            return
+        entry["result"] = result
+        try:
+            self._write_entry(url, entry)
+        except OSError as e:
+            self.logger.warning(f"Could not write cache entry for {url}: {e}")
+
+    def touch(self, url: str):
+        """Mark ``url``'s entry as just used, so ``prune()`` keeps it longer."""
+        if not self.enabled:
+            return
+        meta_path, _ = self._paths(url)
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+
+    def prune(self, max_mb: int = HTTP_CACHE_MAX_MB, max_age_days: int = HTTP_CACHE_MAX_AGE_DAYS) -> int:
+        """Delete entries unused for ``max_age_days``, then the least recently
+        used ones until the cache fits in ``max_mb``. Returns how many went."""
+        if not self.enabled:
+            return 0
+        entries: dict[str, list] = {}
+        try:
+            with os.scandir(self.directory) as it:
+                for file in it:
+                    key, ext = os.path.splitext(file.name)
+                    if ext not in (".json", ".body"):
+                        continue
+                    try:
+                        stat = file.stat()
+                    except OSError:
+                        continue
+                    entry = entries.setdefault(key, [0, 0.0])
+                    entry[0] += stat.st_size
+                    entry[1] = max(entry[1], stat.st_mtime)
+        except OSError as e:
+            self.logger.warning(f"Could not scan HTTP cache: {e}")
+            return 0
+
+        total = sum(size for size, _ in entries.values())
+        budget = max_mb * 1024 * 1024
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        for key, (size, used) in sorted(entries.items(), key=lambda kv: kv[1][1]):
+            if used >= cutoff and total <= budget:
+                break
+            base = os.path.join(self.directory, key)
+            for path in (base + ".json", base + ".body"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+            removed += 1
+        if removed:
+            self.logger.info(f"Pruned {removed} HTTP cache entries, {total / 1024 / 1024:.0f} MB left")
+        return removed
+
+    def replay_headers(self, entry: dict, response=None) -> dict:
+        """Headers to fulfill a cached body with: the stored ones, updated by
+        whatever a 304 ``response`` sent along (e.g. a fresh cache-control)."""
+        headers = dict(entry.get("headers") or {})
+        headers.setdefault("content-type", entry.get("content_type") or "text/html")
+        if response is not None:
+            for name, value in response.headers.items():
+                if name.lower() in REPLAYED_HEADERS and name.lower() != "content-type":
+                    headers[name.lower()] = value
+        return headers
+
+    def has_result(self, url: str) -> bool:
+        entry = self.get(url)
+        return bool(entry) and "result" in entry
+
+    def revalidate(self, context, url: str, timeout: int = 15000) -> tuple[bool, object, object]:
+        """Conditionally re-request ``url``. Returns ``(unchanged, result, response)``:
+        ``unchanged`` is True when the server answers 304 and a previous
+        extraction result is cached; ``response`` is None when the request
+        itself failed, so the caller can feed the outcome to its throttle."""
+        entry = self.get(url)
+        if not entry or "result" not in entry:
+            return False, None, None
+        try:
+            response = context.request.get(url, headers=self.validators(url), timeout=timeout)
+        except Exception as e:
+            self.logger.debug(f"Revalidation failed for {url}: {e}")
+            return False, entry["result"], None
+        if response.status == 304:
+            self.hits += 1
+            self.touch(url)
+            return True, entry["result"], response
+        self.misses += 1
+        if response.ok:
+            self.store(url, response.headers, response.body())
+        return False, entry["result"], response
+
+    def attach(self, context):
+        """Route document and XHR/fetch requests of a browser context through the cache."""
+        if self.enabled:
+            context.route("**/*", self._handle_route)
+
+    @staticmethod
+    def _keeps_body(resource_type: str, headers: dict) -> bool:
+        # Documents, and the JSON APIs listings are paged through; other
+        # xhr/fetch traffic (trackers, widgets) would only fill the disk
+        return resource_type == "document" or "json" in (headers.get("content-type") or "")
+
+    def _handle_route(self, route, request):
+        if request.method != "GET" or request.resource_type not in CACHEABLE_RESOURCE_TYPES:
+            route.continue_()
+            return
+
+        url = request.url
+        entry = self.get(url)
+        cached_body = self.body(url) if entry else None
+        headers = dict(request.headers)
+        if cached_body is not None:
+            headers.update(self.validators(url))
+
+        try:
+            response = route.fetch(headers=headers)
+        except Exception:
+            route.continue_()
+            return
+
+        if response.status == 304 and cached_body is not None:
+            self.hits += 1
+            self.touch(url)
+            route.fulfill(status=200, headers=self.replay_headers(entry, response), body=cached_body)
+            return
+
+        self.misses += 1
+        if response.ok and self._keeps_body(request.resource_type, response.headers):
+            self.store(url, response.headers, response.body())
+        route.fulfill(response=response)
@@ -1,85 +1,183 @@
+import os
 import re
-import dateparser
+import json
+import time
+import date_parser
 from playwright.sync_api import Page, BrowserContext
-from base_scraper import GenericScraper
+from base_scraper import GenericScraper, DetailContexts
+from structured_data import extract_from_page
 from models import HackathonItem
-from utils import extract_reg_end_date_from_text, search_date_on_web
+from date_service import get_date_service
+from utils import get_cache_dir, get_env_int
+
+
+# Runs in the page: every event link with its title and the text of the
+# card around it, in one round trip instead of two IPC calls per anchor.
+EVENT_CARDS_JS = r"""
+(anchors) => anchors.map((a) => {
+    const card = a.closest("li, article, tr, .card, [class*='event' i]") || a.parentElement || a;
+    return {
+        href: a.getAttribute("href") || "",
+        title: (a.innerText || "").trim(),
+        snippet: (card.innerText || "").replace(/\s+/g, " ").trim().slice(0, 400),
+    };
+})
+"""
+
+VERDICT_TTL_SECONDS = get_env_int("KNOWAFEST_VERDICT_TTL_DAYS", 30, min_value=1) * 86400
 
 
 class KnowafestScraper(GenericScraper):
     platform_name = "Knowafest"
+    CRAWL_INTERVAL_MINUTES = 720
+    # Non-tech fests are filtered before any tab opens, so the cap can be generous
+    MAX_DETAIL_PAGES = 60
     TARGET_URL = "https://www.knowafest.com/college-fests/city/chennai"
     HACKATHON_KEYWORDS = ["hackathon", "hack", "code", "coding", "tech", "programming", "software", "ai", "ml", "data"]
+    EXTRA_TECH_KEYWORDS = [
+        "technical", "techno", "techfest", "symposium", "developer", "robotics",
+        "cyber", "blockchain", "iot", "computer", "cse",
+    ]
+    NON_TECH_KEYWORDS = [
+        "cultural", "dance", "music", "sports", "fashion", "film", "photography", "literary",
+        "fine arts", "management", "mba", "marketing", "quiz", "debate", "art", "drama",
+    ]
+    _TECH_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, HACKATHON_KEYWORDS + EXTRA_TECH_KEYWORDS)) + r")\b", re.IGNORECASE)
+    _NON_TECH_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, NON_TECH_KEYWORDS)) + r")\b", re.IGNORECASE)
+
+    def __init__(self):
+        super().__init__()
+        self._verdicts_path = os.path.join(get_cache_dir("knowafest"), "verdicts.json")
+        self._verdicts = self._load_verdicts()
+
+    def _load_verdicts(self) -> dict:
+        try:
+            with open(self._verdicts_path, "r", encoding="utf-8") as f:
+                verdicts = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        now = time.time()
+        return {link: v for link, v in verdicts.items() if now - v.get("at", 0) < VERDICT_TTL_SECONDS}
+
+    def _save_verdicts(self):
+        tmp_path = f"{self._verdicts_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._verdicts, f)
+            os.replace(tmp_path, self._verdicts_path)
+        except OSError as e:
+            self.logger.warning(f"Could not save Knowafest verdicts: {e}")
+
+    def _score(self, text: str) -> int:
+        """Positive for tech-looking text, negative for clearly non-tech fests, 0 if unclear."""
+        return len(set(m.lower() for m in self._TECH_RE.findall(text))) - len(
+            set(m.lower() for m in self._NON_TECH_RE.findall(text))
+        )
+
+    def _preclassify(self, candidates: list[tuple[HackathonItem, str]]) -> list[HackathonItem]:
+        """Order candidates likely-tech first, then uncertain; drop those the
+        list text or a cached verdict already rules out."""
+        likely, uncertain = [], []
+        skipped = 0
+        for item, snippet in candidates:
+            cached = self._verdicts.get(item.link)
+            if cached is not None:
+                if cached["tech"]:
+                    likely.append(item)
+                else:
+                    skipped += 1
+                continue
+            score = self._score(f"{item.title} {snippet}")
+            if score > 0:
+                likely.append(item)
+            elif score == 0:
+                uncertain.append(item)
+            else:
+                skipped += 1
+        self.logger.info(
+            f"Knowafest: {len(likely)} likely tech, {len(uncertain)} uncertain, {skipped} skipped before detail visits"
+        )
+        return likely + uncertain
 
     def scrape(self, page: Page, context: BrowserContext) -> list[HackathonItem]:
-        page.goto(self.TARGET_URL, wait_until="domcontentloaded", timeout=30000)
+        self._goto(page, self.TARGET_URL, wait_until="domcontentloaded", timeout=self.LIST_TIMEOUT_MS)
         page.wait_for_timeout(3000)
 
-        items = []
-        event_links = page.query_selector_all("a[href*='/college-fests/events/']")
+        candidates = []
+        cards = page.eval_on_selector_all("a[href*='/college-fests/events/']", EVENT_CARDS_JS)
         seen = set()
 
-        for anchor in event_links:
-            href = anchor.get_attribute("href") or ""
+        for card in cards:
+            href = card["href"]
             if not href or href in seen:
                 continue
             seen.add(href)
 
-            title = anchor.inner_text().strip()
+            title = card["title"]
             if not title or len(title) < 3:
                 continue
 
             link = href if href.startswith("http") else f"https://www.knowafest.com{href}"
-            items.append(HackathonItem(
+            candidates.append((HackathonItem(
                 title=title,
                 link=link,
                 source_platform="Knowafest",
                 location="Chennai",
                 is_offline=True,
-            ))
-
-        enriched = []
-        for item in items[:30]:
-            try:
-                detail_page = context.new_page()
-                detail_page.goto(item.link, wait_until="domcontentloaded", timeout=15000)
-                detail_page.wait_for_timeout(2000)
-
-                body_text = detail_page.inner_text("body")
-                lower_body = body_text.lower()
-
-                is_tech = any(kw in lower_body for kw in self.HACKATHON_KEYWORDS)
-                if not is_tech:
-                    detail_page.close()
+            ), card["snippet"]))
+
+        items = self._preclassify(candidates)
+
+        # (item, date or a Future still parsing in the date pool)
+        found = []
+        with DetailContexts(self, context) as detail_contexts:
+            for item in self._capped(items):
+                detail_context = detail_contexts.get()
+                if detail_context is None:
+                    break
+                detail_page = detail_context.new_page()
+                try:
+                    self._goto(detail_page, item.link, wait_until="domcontentloaded", timeout=self.DETAIL_TIMEOUT_MS)
+                    detail_page.wait_for_timeout(2000)
+
+                    body_text = detail_page.inner_text("body")
+
+                    is_tech = bool(self._TECH_RE.search(body_text))
+                    self._verdicts[item.link] = {"tech": is_tech, "at": time.time()}
+                    if not is_tech:
+                        continue
+
+                    structured = extract_from_page(detail_page)
+
+                    # Try extracting date from detail page
+                    date_val = structured.get("date") or self._extract_date_from_detail(detail_page, body_text)
+
+                    # Fallback: generic date extractor, parsed while the next page loads
+                    if not date_val:
+                        date_val = get_date_service().submit(body_text)
+
+                    organizer = structured.get("organizer") or self._extract_organizer(detail_page)
+                    location = structured.get("location") or self._extract_location(body_text) or "Chennai"
+
+                    found.append((HackathonItem(
+                        title=item.title,
+                        organizer=organizer,
+                        location=location,
+                        link=item.link,
+                        source_platform="Knowafest",
+                        is_offline=True,
+                    ), date_val))
+                except Exception:
                     continue
+                finally:
+                    detail_page.close()
 
-                # Try extracting date from detail page
-                date_val = self._extract_date_from_detail(detail_page, body_text)
-
-                # Fallback: use generic date extractor
-                if not date_val:
-                    date_val = extract_reg_end_date_from_text(body_text)
-
-                # Fallback: web search
-                if not date_val:
-                    date_val = search_date_on_web(item.title)
-
-                organizer = self._extract_organizer(detail_page)
-                location = self._extract_location(body_text) or "Chennai"
-
-                enriched.append(HackathonItem(
-                    title=item.title,
-                    organizer=organizer,
-                    date=date_val,
-                    location=location,
-                    link=item.link,
-                    source_platform="Knowafest",
-                    is_offline=True,
-                ))
-                detail_page.close()
-            except Exception:
-                continue
-
+        # Fallback: web search, for pages the extractor found nothing on
+        enriched = [
+            found_item.model_copy(update={"date": self._collect_date(date_val, found_item.title)})
+            for found_item, date_val in found
+        ]
+        self._save_verdicts()
         return enriched
 
     def _extract_date_from_detail(self, page: Page, body_text: str):
@@ -90,7 +188,7 @@ class KnowafestScraper(GenericScraper):
         for pattern in date_patterns:
             matches = re.findall(pattern, body_text, re.IGNORECASE)
             if matches:
-                dt = dateparser.parse(matches[-1], settings={"PREFER_DATES_FROM": "future"})
+                dt = date_parser.parse(matches[-1])
                 if dt:
                     return dt.strftime("%Y-%m-%d")
         return None
@@ -0,0 +1,117 @@
+import os
+import json
+import math
+import time
+import logging
+import threading
+from utils import get_cache_dir, get_env_int, get_env_float
+
+# Latency samples kept per domain and kind
+MAX_SAMPLES = 200
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    rank = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+class LatencyStore:
+    """Page-load latencies per domain and ``kind`` (the wait_until event, or
+    "request"), persisted across runs, used to size navigation timeouts.
+
+    Once a domain has ``min_samples`` observations, its timeout becomes
+    ``max(p95 * multiplier, p99)`` clamped to [min_ms, the caller's default],
+    so the configured timeout stays a ceiling and fast domains fail sooner.
+    A domain whose recent loads mostly timed out is considered degraded and
+    gets ``degraded_ms`` so a dead site fails fast instead of burning the full
+    timeout on every page.
+    """
+
+    def __init__(self):
+        self.min_samples = get_env_int("LATENCY_MIN_SAMPLES", 10, min_value=1)
+        self.multiplier = get_env_float("LATENCY_TIMEOUT_MULTIPLIER", 2.0, min_value=1.0)
+        self.min_ms = get_env_int("LATENCY_MIN_TIMEOUT_MS", 5000, min_value=500)
+        self.degraded_ms = get_env_int("LATENCY_DEGRADED_TIMEOUT_MS", 5000, min_value=500)
+        self.recent_window = get_env_int("LATENCY_RECENT_WINDOW", 5, min_value=1)
+        self.degraded_seconds = get_env_int("LATENCY_DEGRADED_SECONDS", 600, min_value=0)
+        self.path = os.path.join(get_cache_dir("latency"), "latency.json")
+        self.logger = logging.getLogger("latency")
+        self._lock = threading.Lock()
+        self._samples: dict[str, list[float]] = {}
+        # Recent outcomes as [unix time, ok]
+        self._recent: dict[str, list[list]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._samples = data.get("samples", {})
+            self._recent = data.get("recent", {})
+        except (OSError, ValueError):
+            pass
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps({"samples": self._samples, "recent": self._recent})
+            self._dirty = False
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not save latency store: {e}")
+
+    @staticmethod
+    def _key(domain: str, kind: str) -> str:
+        return f"{domain}|{kind}"
+
+    def record(self, domain: str, kind: str, elapsed_ms: float | None):
+        """Record one navigation; ``elapsed_ms=None`` marks a timeout or error."""
+        key = self._key(domain, kind)
+        with self._lock:
+            recent = self._recent.setdefault(key, [])
+            recent.append([time.time(), elapsed_ms is not None])
+            del recent[:-self.recent_window]
+            if elapsed_ms is not None:
+                samples = self._samples.setdefault(key, [])
+                samples.append(round(elapsed_ms))
+                del samples[:-MAX_SAMPLES]
+            self._dirty = True
+
+    def is_degraded(self, domain: str, kind: str) -> bool:
+        """Mostly failing lately, and the last attempt failed recently. Once
+        ``degraded_seconds`` pass, one attempt gets the full timeout again."""
+        with self._lock:
+            recent = list(self._recent.get(self._key(domain, kind), []))
+        if len(recent) < self.recent_window:
+            return False
+        failures = sum(1 for _, ok in recent if not ok)
+        last_at, last_ok = recent[-1]
+        return failures > len(recent) // 2 and not last_ok and time.time() - last_at < self.degraded_seconds
+
+    def timeout_for(self, domain: str, kind: str, default_ms: int) -> int:
+        if self.is_degraded(domain, kind):
+            return min(self.degraded_ms, default_ms)
+        with self._lock:
+            samples = sorted(self._samples.get(self._key(domain, kind), []))
+        if len(samples) < self.min_samples:
+            return default_ms
+        derived = max(_percentile(samples, 95) * self.multiplier, _percentile(samples, 99))
+        return int(min(max(derived, self.min_ms), default_ms))
+
+
+_store: LatencyStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_latency_store() -> LatencyStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = LatencyStore()
+        return _store
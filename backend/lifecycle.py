@@ -0,0 +1,48 @@
+import logging
+from datetime import datetime, timezone, timedelta
+from utils import get_supabase_client, get_env_int, get_env_bool
+
+logger = logging.getLogger("lifecycle")
+
+# Days a hackathon stays listed after its reg_end_date (late registrations,
+# timezone slack between the platform and UTC).
+EXPIRY_GRACE_DAYS = get_env_int("EXPIRY_GRACE_DAYS", 0, min_value=0)
+ARCHIVE_EXPIRED = get_env_bool("ARCHIVE_EXPIRED", True)
+
+
+def expiry_cutoff(today=None) -> str:
+    """First reg_end_date (YYYY-MM-DD) that is still live."""
+    today = today or datetime.now(timezone.utc).date()
+    return (today - timedelta(days=EXPIRY_GRACE_DAYS)).strftime("%Y-%m-%d")
+
+
+def _delete_count_only(supabase, cutoff: str) -> int:
+    result = (
+        supabase.table("hackathons")
+        .delete(count="exact", returning="minimal")
+        .lt("reg_end_date", cutoff)
+        .execute()
+    )
+    return result.count or 0
+
+
+def archive_expired(supabase=None) -> int | None:
+    """Move rows past the grace period into hackathons_archive server-side
+    and return how many were moved. Falls back to a count-only delete when
+    archiving is disabled or the RPC is not deployed."""
+    supabase = supabase or get_supabase_client()
+    cutoff = expiry_cutoff()
+    try:
+        if ARCHIVE_EXPIRED:
+            try:
+                moved = supabase.rpc("archive_expired_hackathons", {"cutoff": cutoff}).execute().data
+                logger.info(f"Archived {moved or 0} expired hackathons (reg_end_date < {cutoff})")
+                return moved or 0
+            except Exception as e:
+                logger.warning(f"Archive RPC failed, deleting without history: {e}")
+        deleted = _delete_count_only(supabase, cutoff)
+        logger.info(f"Deleted {deleted} expired hackathons (reg_end_date < {cutoff})")
+        return deleted
+    except Exception as e:
+        logger.error(f"Cleanup failed: {e}")
+        return None
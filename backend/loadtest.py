@@ -0,0 +1,109 @@
+"""Offline end-to-end throughput test: synthetic items through dedup,
+normalisation, upsert and expiry against the in-process Supabase stand-in.
+
+    python loadtest.py --items 100000 [--duplicates 0.15] [--formats iso=0.7,text=0.3]
+                       [--latency-ms 20] [--batch-size 500] [--profile]
+
+Nothing touches the network; the same seed gives the same items.
+"""
+import os
+import time
+import argparse
+from datetime import datetime, timezone, timedelta
+from local_supabase import LocalSupabase
+from synthetic import DEFAULT_FORMAT_WEIGHTS, generate_items, parse_format_weights
+
+
+def _stale_rows(count: int, seed: int) -> list[dict]:
+    """Already-expired rows to seed the table with, so expiry has work to do."""
+    today = datetime.now(timezone.utc).date()
+    items = generate_items(
+        count, duplicate_rate=0, no_date_rate=0, expired_rate=1,
+        format_weights={"iso": 1}, seed=seed + 1, today=today - timedelta(days=1),
+    )
+    return [dict(item.to_supabase_dict(), link=f"{item.link}?stale") for item in items]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--duplicates", type=float, default=0.15, help="share of items repeating an earlier event")
+    parser.add_argument("--no-date", type=float, default=0.05, help="share of items without a deadline")
+    parser.add_argument("--expired", type=float, default=0.05, help="share of items already past their deadline")
+    parser.add_argument(
+        "--formats", default=",".join(f"{k}={v}" for k, v in DEFAULT_FORMAT_WEIGHTS.items()),
+        help="date format weights, e.g. iso=0.5,us=0.2,text=0.3",
+    )
+    parser.add_argument("--stale", type=int, default=None, help="expired rows pre-loaded into the table (default 10%%)")
+    parser.add_argument("--latency-ms", type=int, default=0, help="delay added to every stand-in request")
+    parser.add_argument("--batch-size", type=int, default=None, help="SUPABASE_UPSERT_BATCH_SIZE for the upload")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profile", action="store_true", help="write per-stage flamegraphs (see profiler.py)")
+    args = parser.parse_args()
+    format_weights = parse_format_weights(args.formats)
+
+    with LocalSupabase(latency_ms=args.latency_ms) as db:
+        # utils reads these at import time, so the pipeline is imported afterwards
+        os.environ["SUPABASE_URL"] = db.url
+        os.environ["SUPABASE_KEY"] = db.key
+        if args.batch_size:
+            os.environ["SUPABASE_UPSERT_BATCH_SIZE"] = str(args.batch_size)
+        import date_parser
+        from dedup import DeduplicationEngine
+        from lifecycle import archive_expired
+        from main import normalize_and_filter, upload_data
+        from memory import peak_rss_mb
+        from profiler import stage, start_profiling, stop_profiling
+        from utils import get_cache_dir, setup_logging
+
+        logger = setup_logging("loadtest")
+        if args.profile:
+            start_profiling()
+        date_parser.warm_up()
+
+        timings = []
+
+        def timed(name: str, count: int, fn, *fn_args):
+            start = time.perf_counter()
+            with stage(name):
+                result = fn(*fn_args)
+            timings.append((name, time.perf_counter() - start, count))
+            return result
+
+        stale = _stale_rows(args.items // 10 if args.stale is None else args.stale, args.seed)
+        table = db.tables["hackathons"]
+        for row in stale:
+            table.insert(row)
+
+        items = timed("generate", args.items, lambda: list(generate_items(
+            args.items, args.duplicates, args.no_date, args.expired, format_weights, args.seed,
+        )))
+        unique = timed("dedup", len(items), DeduplicationEngine().deduplicate, items)
+        rows = timed("normalize", len(unique), normalize_and_filter, unique)
+        timed("upload (insert)", len(rows), upload_data, rows)
+        timed("upload (update)", len(rows), upload_data, rows)
+        live_before = len(table.rows)
+        moved = timed("archive", live_before, archive_expired)
+
+        if args.profile:
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            stop_profiling(os.path.join(get_cache_dir("profiles"), f"loadtest-{stamp}"))
+
+        print()
+        print(f"{'stage':<18} {'seconds':>9} {'items':>9} {'items/s':>11}")
+        for name, seconds, count in timings:
+            print(f"{name:<18} {seconds:9.2f} {count:9d} {count / seconds if seconds else 0:11.0f}")
+        print()
+        print(f"items: {len(items)} generated, {len(items) - len(unique)} duplicates removed, {len(rows)} rows kept")
+        print(f"table: {len(table.rows)} live, {len(db.tables['hackathons_archive'].rows)} archived "
+              f"({moved} expired of {len(stale)} stale)")
+        print(f"stand-in: {dict(db.requests)} requests, {db.rows_written} rows written")
+        peak = peak_rss_mb()
+        if peak:
+            print(f"peak RSS: {peak:.0f} MB")
+        if len(table.rows) != len(rows):
+            logger.error(f"Expected {len(rows)} live rows after the run, found {len(table.rows)}")
+
+
+if __name__ == "__main__":
+    main()
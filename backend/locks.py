@@ -0,0 +1,75 @@
+import os
+import time
+import logging
+from contextlib import contextmanager
+from utils import get_cache_dir, get_env_int
+
+logger = logging.getLogger("locks")
+
+# A crawl never legitimately holds a lock this long; older locks are
+# left over from a killed process.
+LOCK_STALE_SECONDS = get_env_int("LOCK_STALE_SECONDS", 3 * 60 * 60, min_value=60)
+
+
+def _lock_path(name: str) -> str:
+    safe = "".join(c if c.isalnum() else "-" for c in name.lower())
+    return os.path.join(get_cache_dir("locks"), f"{safe}.lock")
+
+
+def _is_stale(path: str) -> bool:
+    try:
+        age = time.time() - os.path.getmtime(path)
+        with open(path, "r", encoding="utf-8") as f:
+            pid = int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return True
+    if age > LOCK_STALE_SECONDS:
+        return True
+    if os.name == "posix" and pid:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass
+    return False
+
+
+def acquire(name: str) -> bool:
+    """Create the lock file for ``name``; False if another live process holds it."""
+    path = _lock_path(name)
+    for _ in range(2):
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if not _is_stale(path):
+                return False
+            logger.warning(f"Removing stale lock {path}")
+            try:
+                os.remove(path)
+            except OSError:
+                return False
+            continue
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(str(os.getpid()))
+        return True
+    return False
+
+
+def release(name: str):
+    try:
+        os.remove(_lock_path(name))
+    except OSError:
+        pass
+
+
+@contextmanager
+def platform_lock(name: str):
+    """Yield True while holding the lock for ``name``, or False (without
+    waiting) when a run for the same platform is already in progress."""
+    acquired = acquire(name)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            release(name)
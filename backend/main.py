@@ -1,11 +1,21 @@
 import os
 import time
+import argparse
 import logging
+from collections import Counter
 from datetime import datetime, timezone
-from utils import get_supabase_client, setup_logging, parse_date_flexible
+import date_parser
+from utils import get_cache_dir, get_env_bool, get_supabase_client, reset_supabase_client, setup_logging
 from models import HackathonItem
 from dedup import DeduplicationEngine
-from filters import is_chennai
+from geo import city_tags
+from locks import platform_lock
+from lifecycle import archive_expired, expiry_cutoff
+from normalize import normalize_rows
+from snapshots import publish_snapshots
+from run_store import profile_dir, save_run
+from profiler import stage, start_profiling, stop_profiling
+from thumbnails import attach_thumbnails
 from unstop import UnstopScraper
 from devfolio import DevfolioScraper
 from devpost import DevpostScraper
@@ -27,51 +37,35 @@ ALL_SCRAPERS = [
 ]
 
 
-def run_all_scrapers() -> list[HackathonItem]:
-    results: list[HackathonItem] = []
-    for scraper_cls in ALL_SCRAPERS:
+def run_scraper(scraper_cls) -> list[HackathonItem] | None:
+    """Run one platform under its lock; None when another run holds it."""
+    with platform_lock(scraper_cls.platform_name) as acquired:
+        if not acquired:
+            logger.warning(f"{scraper_cls.platform_name}: another run is in progress, skipping")
+            return None
         scraper = scraper_cls()
         try:
             data = scraper.run()
-            results.extend(data)
             logger.info(f"{scraper.platform_name}: {len(data)} items")
+            return data
         except Exception as e:
             logger.error(f"{scraper.platform_name} crashed: {e}")
+            return []
+
+
+def run_all_scrapers() -> list[HackathonItem]:
+    results: list[HackathonItem] = []
+    for scraper_cls in ALL_SCRAPERS:
+        with stage(f"scrape {scraper_cls.platform_name}"):
+            results.extend(run_scraper(scraper_cls) or [])
     return results
 
 
 def normalize_and_filter(items: list[HackathonItem]) -> list[dict]:
     """Convert items to Supabase rows, dropping any without a valid reg_end_date
-    and any whose registration has already expired."""
-    today = datetime.now(timezone.utc).date()
-    cleaned = []
-    dropped_no_date = 0
-    dropped_expired = 0
-
-    for item in items:
-        row = item.to_supabase_dict()
-
-        # --- Normalise and validate the registration end date ---
-        reg_end = row.get("reg_end_date")
-        normalized = parse_date_flexible(reg_end)
-
-        if not normalized:
-            dropped_no_date += 1
-            continue  # HIGH PRIORITY: every row MUST have a date
-
-        row["reg_end_date"] = normalized
-
-        # Drop already-expired hackathons
-        try:
-            end_date = datetime.strptime(normalized, "%Y-%m-%d").date()
-            if end_date < today:
-                dropped_expired += 1
-                continue
-        except ValueError:
-            dropped_no_date += 1
-            continue
-
-        cleaned.append(row)
+    and any that are already past the expiry grace period."""
+    # HIGH PRIORITY: every row MUST have a date
+    cleaned, dropped_no_date, dropped_expired = normalize_rows(items, expiry_cutoff())
 
     logger.info(
         f"Normalize: kept {len(cleaned)}, "
@@ -94,44 +88,74 @@ def upload_data(data: list[dict]):
     logger.info(f"Uploading {len(data)} items to Supabase")
     for i in range(0, len(data), batch_size):
         batch = data[i:i + batch_size]
-        try:
-            supabase.table("hackathons").upsert(batch, on_conflict="link").execute()
-            count += len(batch)
-        except Exception as e:
-            errors += len(batch)
-            logger.error(f"Upload batch error: {e}")
+        for attempt in range(2):
+            try:
+                supabase.table("hackathons").upsert(batch, on_conflict="link").execute()
+                count += len(batch)
+                break
+            except Exception as e:
+                if attempt == 0:
+                    # A dropped pooled connection should cost one retry, not the batch
+                    logger.warning(f"Upload batch error, reconnecting: {e}")
+                    reset_supabase_client()
+                    supabase = get_supabase_client()
+                    continue
+                errors += len(batch)
+                logger.error(f"Upload batch error: {e}")
 
     logger.info(f"Upload done. Synced: {count}, Errors: {errors}")
 
 
-def delete_expired():
-    """Delete hackathons whose reg_end_date has passed."""
-    supabase = get_supabase_client()
-    try:
-        today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        result = supabase.table("hackathons").delete().lt("reg_end_date", today_str).execute()
-        deleted = len(result.data) if result.data else 0
-        logger.info(f"Deleted {deleted} expired hackathons (reg_end_date < {today_str})")
-    except Exception as e:
-        logger.error(f"Cleanup failed: {e}")
+def process_items(raw_items: list[HackathonItem], upload: bool = True) -> list[dict]:
+    """Dedup, normalise and upload scraped items, then expire old rows and
+    republish the snapshots. With ``upload=False`` only the rows are returned."""
+    with stage("dedup"):
+        engine = DeduplicationEngine()
+        unique_items = engine.deduplicate(raw_items)
+    logger.info(f"After dedup: {len(unique_items)} (removed {len(raw_items) - len(unique_items)} dupes)")
 
+    city_counts = Counter(city for i in unique_items for city in city_tags(i.location))
+    logger.info(f"Events by city: {dict(city_counts.most_common())}")
 
-def main():
-    start = time.time()
+    with stage("normalize"):
+        supabase_rows = normalize_and_filter(unique_items)
+    if upload:
+        with stage("thumbnails"):
+            attach_thumbnails(supabase_rows)
+        with stage("upload"):
+            upload_data(supabase_rows)
+        with stage("archive"):
+            archive_expired()
+        with stage("snapshots"):
+            publish_snapshots()
+    return supabase_rows
 
-    raw_items = run_all_scrapers()
-    logger.info(f"Total raw items: {len(raw_items)}")
 
-    engine = DeduplicationEngine()
-    unique_items = engine.deduplicate(raw_items)
-    logger.info(f"After dedup: {len(unique_items)} (removed {len(raw_items) - len(unique_items)} dupes)")
+def main():
+    parser = argparse.ArgumentParser(description="Scrape every platform once and sync the results.")
+    parser.add_argument(
+        "--profile", action="store_true", default=get_env_bool("PROFILE", False),
+        help="sample each pipeline stage and write flamegraphs next to the stored run",
+    )
+    args = parser.parse_args()
 
-    chennai_count = sum(1 for i in unique_items if is_chennai(i.location))
-    logger.info(f"Chennai-area events: {chennai_count}")
+    start = time.time()
+    started_at = datetime.now(timezone.utc)
+    if args.profile:
+        start_profiling()
+    with stage("warm up"):
+        date_parser.warm_up()
 
-    supabase_rows = normalize_and_filter(unique_items)
-    upload_data(supabase_rows)
-    delete_expired()
+    run_id = None
+    try:
+        raw_items = run_all_scrapers()
+        logger.info(f"Total raw items: {len(raw_items)}")
+        run_id = save_run(raw_items, started_at)
+        process_items(raw_items)
+    finally:
+        if args.profile:
+            stamp = started_at.strftime("%Y%m%dT%H%M%SZ")
+            stop_profiling(profile_dir(run_id) if run_id else os.path.join(get_cache_dir("profiles"), stamp))
 
     duration = time.time() - start
     logger.info(f"All tasks completed in {duration:.2f}s")
@@ -0,0 +1,81 @@
+import os
+import sys
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    psutil = None
+    HAS_PSUTIL = False
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _proc_tree_rss_linux(root_pid: int) -> int:
+    """Sum VmRSS (bytes) of ``root_pid`` and all its descendants from /proc."""
+    children: dict[int, list[int]] = {}
+    rss: dict[int, int] = {}
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                stat = f.read()
+            with open(f"/proc/{entry}/statm", "r") as f:
+                resident = int(f.read().split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        # The command name may contain spaces, so split after its closing paren
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        pid = int(entry)
+        children.setdefault(ppid, []).append(pid)
+        rss[pid] = resident * page_size
+
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total
+
+
+def current_rss_mb() -> float | None:
+    """Resident memory of this process plus its children (the Playwright
+    driver and the browser it launched), in MB. None if it cannot be measured."""
+    if HAS_PSUTIL:
+        try:
+            proc = psutil.Process()
+            procs = [proc] + proc.children(recursive=True)
+            total = 0
+            for p in procs:
+                try:
+                    total += p.memory_info().rss
+                except psutil.Error:
+                    pass
+            return total / (1024 * 1024)
+        except psutil.Error:
+            return None
+    if sys.platform.startswith("linux"):
+        try:
+            return _proc_tree_rss_linux(os.getpid()) / (1024 * 1024)
+        except OSError:
+            return None
+    return None
+
+
+def peak_rss_mb() -> float | None:
+    """High-water RSS of this process and of its largest reaped child, in MB."""
+    if resource is None:
+        return None
+    # ru_maxrss is in KB on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return peak / scale
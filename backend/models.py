@@ -1,6 +1,7 @@
 import hashlib
 from typing import Optional
 from pydantic import BaseModel, Field, computed_field
+from geo import city_tags
 
 
 class HackathonItem(BaseModel):
@@ -23,7 +24,11 @@ class HackathonItem(BaseModel):
     def to_supabase_dict(self) -> dict:
         return {
             "title": self.title,
+            "organizer": self.organizer,
+            "themes": self.themes,
             "mode": "Offline" if self.is_offline else "Online",
+            "location": self.location,
+            "cities": city_tags(self.location),
             "reg_end_date": self.date,
             "link": self.link,
             "image_url": self.image_url,
@@ -0,0 +1,62 @@
+import re
+from datetime import date
+import numpy as np
+from models import HackathonItem
+from date_service import get_date_service
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _parse_iso(text: str) -> str | None:
+    try:
+        return date.fromisoformat(text).strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def normalize_dates(values: list) -> list[str | None]:
+    """Normalise a column of raw date values to YYYY-MM-DD, parsing each
+    distinct value only once. Most dates arrive already normalised
+    (structured data, APIs) and are validated directly; only the rest go to
+    dateparser, in the process pool."""
+    keys = [value.strip() if isinstance(value, str) else value for value in values]
+    parsed: dict = {}
+    pending = []
+    for key in keys:
+        if key in parsed:
+            continue
+        if isinstance(key, str) and _ISO_DATE_RE.fullmatch(key):
+            parsed[key] = _parse_iso(key)
+        else:
+            parsed[key] = None
+            pending.append(key)
+
+    for key, value in zip(pending, get_date_service().parse_many(pending)):
+        parsed[key] = value
+    return [parsed[key] for key in keys]
+
+
+def expired_mask(dates: list[str], cutoff: str) -> list[bool]:
+    """True for every normalised date before ``cutoff`` (both YYYY-MM-DD)."""
+    if not dates:
+        return []
+    return (np.array(dates, dtype="datetime64[D]") < np.datetime64(cutoff, "D")).tolist()
+
+
+def normalize_rows(items: list[HackathonItem], cutoff: str) -> tuple[list[dict], int, int]:
+    """Batch version of the per-row normalise/validate loop. Returns
+    ``(rows, dropped_no_date, dropped_expired)``."""
+    rows = [item.to_supabase_dict() for item in items]
+    dates = normalize_dates([row.get("reg_end_date") for row in rows])
+
+    dated = []
+    dated_values = []
+    for row, value in zip(rows, dates):
+        if value:
+            row["reg_end_date"] = value
+            dated.append(row)
+            dated_values.append(value)
+
+    expired = expired_mask(dated_values, cutoff)
+    kept = [row for row, is_old in zip(dated, expired) if not is_old]
+    return kept, len(rows) - len(dated), len(dated) - len(kept)
@@ -0,0 +1,128 @@
+import time
+import logging
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from structured_data import extract_from_html
+from throttle import CircuitOpenError
+from utils import get_env_int
+
+PREFETCH_MAX_BYTES = get_env_int("PREFETCH_MAX_BYTES", 2 * 1024 * 1024, min_value=65536)
+
+
+class DetailPrefetcher:
+    """Fetches detail pages over plain HTTP on worker threads while the listing
+    is still being paged, and extracts their structured data (JSON-LD,
+    microdata, meta tags). Enrichment then only opens a browser tab for pages
+    whose deadline was not found this way.
+
+    Playwright's sync API is bound to the thread that started it, so workers
+    use urllib and share only the thread-safe throttle, latency store and
+    on-disk HTTP cache with the scraper.
+    """
+
+    def __init__(self, http_cache, throttle, latency, user_agent: str, timeout_ms: int, workers: int):
+        self.http_cache = http_cache
+        self.throttle = throttle
+        self.latency = latency
+        self.user_agent = user_agent
+        self.timeout_ms = timeout_ms
+        self.logger = logging.getLogger("prefetch")
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self._futures = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    @property
+    def queued(self) -> int:
+        return len(self._futures)
+
+    def submit(self, url: str):
+        if not url:
+            return
+        with self._lock:
+            if url not in self._futures:
+                self._futures[url] = self._executor.submit(self._fetch, url)
+
+    def done(self, url: str) -> bool:
+        """True unless a fetch of ``url`` is queued or still running."""
+        with self._lock:
+            future = self._futures.get(url)
+        return future is None or future.done()
+
+    def cancel(self, url: str) -> bool:
+        """Drop a fetch of ``url`` that has not started yet; False if it is
+        already running, finished, or was never queued."""
+        with self._lock:
+            future = self._futures.get(url)
+        return future is not None and future.cancel()
+
+    def result(self, url: str, timeout: float | None = None) -> dict | None:
+        """Prefetched details for ``url``; None if it was never queued, failed,
+        or is not ready within ``timeout`` seconds."""
+        with self._lock:
+            future = self._futures.get(url)
+        if future is None:
+            return None
+        try:
+            details = future.result(timeout=timeout)
+        except FutureTimeout:
+            return None
+        except Exception as e:
+            self.logger.debug(f"Prefetch failed for {url}: {e}")
+            return None
+        if details and details.get("date"):
+            self.hits += 1
+        return details
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch(self, url: str) -> dict:
+        try:
+            self.throttle.acquire(url)
+        except CircuitOpenError:
+            return {}
+        domain = self.throttle.domain_for(url)
+        timeout_ms = self.latency.timeout_for(domain, "request", self.timeout_ms)
+        headers = {"User-Agent": self.user_agent, "Accept": "text/html,application/xhtml+xml"}
+        headers.update(self.http_cache.validators(url))
+        request = urllib.request.Request(url, headers=headers)
+
+        start = time.monotonic()
+        try:
+            with urllib.request.urlopen(request, timeout=timeout_ms / 1000) as response:
+                body = response.read(PREFETCH_MAX_BYTES + 1)
+                charset = response.headers.get_content_charset() or "utf-8"
+                response_headers = dict(response.headers.items())
+        except urllib.error.HTTPError as e:
+            self.latency.record(domain, "request", (time.monotonic() - start) * 1000)
+            self.throttle.record(url, status=e.code, retry_after=e.headers.get("retry-after"))
+            if e.code != 304:
+                return {}
+            # Unchanged since last run: reuse the stored result, or re-parse the cached body
+            self.http_cache.touch(url)
+            result = (self.http_cache.get(url) or {}).get("result")
+            if isinstance(result, dict):
+                return dict(result)
+            if isinstance(result, str):
+                return {"date": result}
+            cached = self.http_cache.body(url)
+            return extract_from_html(cached.decode("utf-8", errors="replace")) if cached else {}
+        except Exception:
+            self.latency.record(domain, "request", None)
+            self.throttle.record(url, error=True)
+            return {}
+
+        self.latency.record(domain, "request", (time.monotonic() - start) * 1000)
+        self.throttle.record(url)
+        if len(body) > PREFETCH_MAX_BYTES:
+            # Never cache a truncated body: the browser route could replay it
+            body = body[:PREFETCH_MAX_BYTES]
+        else:
+            self.http_cache.store(url, response_headers, body)
+        details = extract_from_html(body.decode(charset, errors="replace"))
+        if details.get("date"):
+            self.http_cache.store_result(url, details)
+        return details
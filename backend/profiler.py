@@ -0,0 +1,228 @@
+import os
+import re
+import sys
+import time
+import logging
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from utils import get_env_int
+
+logger = logging.getLogger("profiler")
+
+PROFILE_INTERVAL_MS = get_env_int("PROFILE_INTERVAL_MS", 10, min_value=1)
+PROFILE_TOP_N = get_env_int("PROFILE_TOP_N", 25, min_value=1)
+PROFILE_MAX_DEPTH = 128
+
+# Leaf frames of worker threads that are parked, not working; sampling them
+# would bury the stage's real work under idle pool threads.
+_IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+
+def _label(frame) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{os.path.basename(code.co_filename)}:{name}".replace(";", ":").replace(" ", "_")
+
+
+class StageProfiler:
+    """Wall-clock sampling profiler attributed to pipeline stages.
+
+    A daemon thread snapshots every thread's stack with
+    ``sys._current_frames()`` each PROFILE_INTERVAL_MS while a stage is open,
+    so the profiled code runs unmodified and the cost is one stack walk per
+    sample. Time spent blocked (Playwright IPC, HTTP) shows up as the frame
+    doing the waiting. Date worker processes are not sampled; their cost
+    appears as the main thread waiting on the pool.
+    """
+
+    def __init__(self, interval_ms: int = PROFILE_INTERVAL_MS):
+        self.interval = interval_ms / 1000
+        self.stacks: dict[str, Counter] = defaultdict(Counter)
+        self.wall: dict[str, float] = defaultdict(float)
+        self._stages: list[str] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._sample_loop, name="profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    @contextmanager
+    def stage(self, name: str):
+        self._stages.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.wall[name] += time.perf_counter() - start
+            self._stages.pop()
+
+    def _sample_loop(self):
+        own_ident = threading.get_ident()
+        main_ident = threading.main_thread().ident
+        while not self._stop.wait(self.interval):
+            try:
+                stage = self._stages[-1]
+            except IndexError:
+                continue
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                code = frame.f_code
+                if ident != main_ident and (os.path.basename(code.co_filename), code.co_name) in _IDLE_LEAVES:
+                    continue
+                labels = []
+                while frame is not None and len(labels) < PROFILE_MAX_DEPTH:
+                    labels.append(_label(frame))
+                    frame = frame.f_back
+                labels.append(names.get(ident, f"thread-{ident}").replace(";", ":").replace(" ", "_"))
+                self.stacks[stage][";".join(reversed(labels))] += 1
+
+    def write(self, out_dir: str):
+        """Write ``<stage>.collapsed`` and ``<stage>.svg`` per stage plus
+        ``summary.txt`` into ``out_dir``."""
+        os.makedirs(out_dir, exist_ok=True)
+        for stage, stacks in self.stacks.items():
+            base = os.path.join(out_dir, _file_name(stage))
+            with open(f"{base}.collapsed", "w", encoding="utf-8") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            with open(f"{base}.svg", "w", encoding="utf-8") as f:
+                f.write(render_flamegraph(stacks, title=f"{stage} ({self.wall.get(stage, 0):.1f}s wall)"))
+        with open(os.path.join(out_dir, "summary.txt"), "w", encoding="utf-8") as f:
+            f.write(self.summary())
+
+    def summary(self, top_n: int = PROFILE_TOP_N) -> str:
+        lines = [f"Sampling interval: {self.interval * 1000:g} ms", "", f"{'stage':<32} {'wall s':>9} {'samples':>9}"]
+        for stage, seconds in self.wall.items():
+            lines.append(f"{stage:<32} {seconds:9.2f} {sum(self.stacks[stage].values()):9d}")
+        for stage, stacks in self.stacks.items():
+            total = sum(stacks.values())
+            self_counts, total_counts = hot_functions(stacks)
+            lines += ["", f"== {stage}: top {top_n} functions by self time ==", f"{'self %':>7} {'total %':>8}  function"]
+            for function, count in self_counts.most_common(top_n):
+                lines.append(f"{100 * count / total:7.1f} {100 * total_counts[function] / total:8.1f}  {function}")
+        return "\n".join(lines) + "\n"
+
+
+def hot_functions(stacks: Counter) -> tuple[Counter, Counter]:
+    """Self (leaf) and inclusive sample counts per function; a recursive
+    function counts once per stack towards its inclusive total."""
+    self_counts, total_counts = Counter(), Counter()
+    for stack, count in stacks.items():
+        # The root entry is the thread name, not a function
+        frames = stack.split(";")[1:]
+        if not frames:
+            continue
+        self_counts[frames[-1]] += count
+        for function in set(frames):
+            total_counts[function] += count
+    return self_counts, total_counts
+
+
+def _file_name(stage: str) -> str:
+    return re.sub(r"[^\w.-]+", "-", stage.lower()).strip("-") or "stage"
+
+
+def _escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def render_flamegraph(stacks: Counter, title: str = "", width: int = 1200, frame_height: int = 16) -> str:
+    """Render collapsed stacks as a static flamegraph SVG (root at the
+    bottom, hover a frame for its sample count)."""
+    root = {"children": {}, "value": 0}
+    for stack, count in stacks.items():
+        root["value"] += count
+        node = root
+        for name in stack.split(";"):
+            node = node["children"].setdefault(name, {"children": {}, "value": 0})
+            node["value"] += count
+
+    total = root["value"] or 1
+    rects = []
+    max_depth = 0
+
+    def layout(node, depth, x):
+        nonlocal max_depth
+        for name, child in sorted(node["children"].items()):
+            child_width = child["value"] / total * (width - 20)
+            if child_width >= 0.5:
+                max_depth = max(max_depth, depth)
+                rects.append((name, child["value"], depth, x, child_width))
+                layout(child, depth + 1, x)
+            x += child_width
+
+    layout(root, 0, 10.0)
+    height = (max_depth + 1) * frame_height + 60
+    out = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" font-family="monospace" font-size="11">',
+        '<rect width="100%" height="100%" fill="#f8f8f8"/>',
+        f'<text x="{width / 2}" y="20" text-anchor="middle" font-size="14">{_escape(title)}</text>',
+    ]
+    for name, value, depth, x, w in rects:
+        y = height - 20 - (depth + 1) * frame_height
+        # Stable warm colour per function name
+        shade = sum(name.encode()) % 120
+        label = name
+        if len(name) * 7 >= w - 6:
+            label = name[: int((w - 6) / 7) - 2] + ".." if w > 30 else ""
+        out.append(
+            f'<g><title>{_escape(name)} ({value} samples, {100 * value / total:.1f}%)</title>'
+            f'<rect x="{x:.1f}" y="{y}" width="{w:.1f}" height="{frame_height - 1}" '
+            f'fill="rgb(230,{90 + shade},{40 + shade // 3})" rx="2"/>'
+            + (f'<text x="{x + 3:.1f}" y="{y + frame_height - 4}">{_escape(label)}</text>' if label else "")
+            + "</g>"
+        )
+    out.append("</svg>")
+    return "\n".join(out) + "\n"
+
+
+_profiler: StageProfiler | None = None
+
+
+def start_profiling(interval_ms: int = PROFILE_INTERVAL_MS) -> StageProfiler:
+    global _profiler
+    _profiler = StageProfiler(interval_ms)
+    _profiler.start()
+    logger.info(f"Sampling profiler on ({interval_ms} ms interval)")
+    return _profiler
+
+
+def stop_profiling(out_dir: str) -> str | None:
+    """Stop the profiler and write its output; returns ``out_dir``."""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler is None:
+        return None
+    profiler.stop()
+    try:
+        profiler.write(out_dir)
+    except OSError as e:
+        logger.error(f"Could not write profile to {out_dir}: {e}")
+        return None
+    logger.info(f"Profile written to {out_dir}")
+    return out_dir
+
+
+@contextmanager
+def stage(name: str):
+    """Attribute samples taken inside the block to ``name``; a no-op unless
+    profiling was started."""
+    profiler = _profiler
+    if profiler is None:
+        yield
+        return
+    with profiler.stage(name):
+        yield
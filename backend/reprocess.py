@@ -0,0 +1,44 @@
+import sys
+import json
+import time
+import argparse
+from utils import setup_logging
+from run_store import list_runs, load_run, resolve_run_id
+from main import process_items
+
+logger = setup_logging("reprocess")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Re-run dedup/normalize/upload on a stored raw run, without a browser."
+    )
+    parser.add_argument("run_id", nargs="?", default="latest", help="stored run id (default: latest)")
+    parser.add_argument("--list", action="store_true", help="list stored runs and exit")
+    parser.add_argument("--dry-run", action="store_true", help="normalize only, do not touch Supabase")
+    parser.add_argument("--output", help="write the normalized rows to this JSON file")
+    args = parser.parse_args()
+
+    if args.list:
+        for meta in list_runs():
+            print(f"{meta['run_id']}\t{meta['item_count']} items\t{json.dumps(meta['platforms'])}")
+        return
+
+    run_id = resolve_run_id(args.run_id)
+    start = time.time()
+    try:
+        items = load_run(args.run_id)
+    except (FileNotFoundError, OSError) as e:
+        logger.error(f"Cannot load run {args.run_id}: {e}")
+        sys.exit(1)
+    logger.info(f"Loaded {len(items)} raw items from run {run_id}")
+
+    rows = process_items(items, upload=not args.dry_run)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2, default=str)
+    logger.info(f"Reprocessed run {run_id} in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import os
+import json
+import gzip
+import shutil
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from models import HackathonItem
+from utils import get_cache_dir, get_env_bool, get_env_int
+
+logger = logging.getLogger("run_store")
+
+RUN_STORE_ENABLED = get_env_bool("RUN_STORE_ENABLED", True)
+RUN_STORE_DIR = os.environ.get("RUN_STORE_DIR")
+RUN_STORE_KEEP = get_env_int("RUN_STORE_KEEP", 50, min_value=1)
+SCHEMA_VERSION = 1
+
+
+def _store_dir() -> str:
+    if RUN_STORE_DIR:
+        os.makedirs(RUN_STORE_DIR, exist_ok=True)
+        return RUN_STORE_DIR
+    return get_cache_dir("runs")
+
+
+def _paths(run_id: str) -> tuple[str, str]:
+    base = os.path.join(_store_dir(), run_id)
+    return base + ".meta.json", base + ".jsonl.gz"
+
+
+def save_run(items: list[HackathonItem], started_at: datetime, label: str = "all") -> str | None:
+    """Persist the raw scraped items of one run as gzipped JSON lines next to
+    a small metadata file. Returns the run id."""
+    if not RUN_STORE_ENABLED:
+        return None
+    finished_at = datetime.now(timezone.utc)
+    run_id = f"{started_at.strftime('%Y%m%dT%H%M%SZ')}-{label.lower()}"
+    meta_path, items_path = _paths(run_id)
+    meta = {
+        "run_id": run_id,
+        "schema_version": SCHEMA_VERSION,
+        "label": label,
+        "started_at": started_at.isoformat(),
+        "finished_at": finished_at.isoformat(),
+        "item_count": len(items),
+        "platforms": dict(Counter(item.source_platform for item in items)),
+    }
+    try:
+        tmp_path = f"{items_path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            for item in items:
+                f.write(json.dumps(item.model_dump(exclude={"dedup_hash"}), separators=(",", ":")))
+                f.write("\n")
+        os.replace(tmp_path, items_path)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+    except OSError as e:
+        logger.error(f"Could not store run {run_id}: {e}")
+        return None
+    logger.info(f"Stored {len(items)} raw items as run {run_id}")
+    prune_runs()
+    return run_id
+
+
+def list_runs() -> list[dict]:
+    """Metadata of stored runs, oldest first."""
+    runs = []
+    directory = _store_dir()
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".meta.json"):
+            continue
+        try:
+            with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                runs.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return runs
+
+
+def profile_dir(run_id: str) -> str:
+    """Where the profiler output of a run goes, next to its stored items."""
+    return os.path.join(_store_dir(), f"{run_id}.profile")
+
+
+def prune_runs(keep: int = RUN_STORE_KEEP):
+    for meta in list_runs()[:-keep]:
+        for path in _paths(meta["run_id"]):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        shutil.rmtree(profile_dir(meta["run_id"]), ignore_errors=True)
+
+
+def resolve_run_id(run_id: str = "latest") -> str | None:
+    if run_id != "latest":
+        return run_id
+    runs = list_runs()
+    return runs[-1]["run_id"] if runs else None
+
+
+def load_run(run_id: str = "latest") -> list[HackathonItem]:
+    resolved = resolve_run_id(run_id)
+    if not resolved:
+        raise FileNotFoundError("No stored runs")
+    _, items_path = _paths(resolved)
+    items = []
+    with gzip.open(items_path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                items.append(HackathonItem.model_validate_json(line))
+    return items
@@ -0,0 +1,181 @@
+import os
+import time
+import random
+import signal
+import argparse
+from collections import defaultdict
+from datetime import datetime, timezone, timedelta
+from utils import get_supabase_client, setup_logging, parse_date_flexible, get_env_int, get_env_float
+import date_parser
+from models import HackathonItem
+from locks import platform_lock
+from lifecycle import archive_expired
+from snapshots import publish_snapshots
+from run_store import save_run
+from main import ALL_SCRAPERS, run_scraper, process_items
+
+logger = setup_logging("scheduler")
+
+SCHEDULER_JITTER = get_env_float("SCHEDULER_JITTER", 0.1, min_value=0.0)
+SCHEDULER_MAX_SLEEP_SECONDS = get_env_int("SCHEDULER_MAX_SLEEP_SECONDS", 60, min_value=1)
+RECHECK_INTERVAL_MINUTES = get_env_int("RECHECK_INTERVAL_MINUTES", 60, min_value=1)
+RECHECK_WINDOW_DAYS = get_env_int("RECHECK_WINDOW_DAYS", 3, min_value=0)
+RECHECK_MAX_ITEMS = get_env_int("RECHECK_MAX_ITEMS", 50, min_value=1)
+
+
+def crawl_interval_minutes(scraper_cls) -> int:
+    return scraper_cls.platform_env_int("CRAWL_INTERVAL", scraper_cls.CRAWL_INTERVAL_MINUTES, min_value=1)
+
+
+class Job:
+    def __init__(self, name: str, interval_minutes: int, action):
+        self.name = name
+        self.interval = interval_minutes * 60
+        self.action = action
+        self.next_run = time.monotonic()
+
+    def reschedule(self):
+        jitter = random.uniform(-SCHEDULER_JITTER, SCHEDULER_JITTER)
+        self.next_run = time.monotonic() + self.interval * (1 + jitter)
+
+    def overdue(self, now: float) -> float:
+        """How late the job is, relative to its own interval."""
+        return (now - self.next_run) / self.interval
+
+
+def crawl_job(scraper_cls) -> Job:
+    def action():
+        started_at = datetime.now(timezone.utc)
+        data = run_scraper(scraper_cls)
+        if data:
+            save_run(data, started_at, label=scraper_cls.platform_name)
+            process_items(data)
+
+    return Job(scraper_cls.platform_name, crawl_interval_minutes(scraper_cls), action)
+
+
+def recheck_closing_soon():
+    """Re-read the detail pages of hackathons closing within RECHECK_WINDOW_DAYS,
+    so deadline changes on the busiest rows land well before the next full crawl."""
+    supabase = get_supabase_client()
+    today = datetime.now(timezone.utc).date()
+    try:
+        rows = (
+            supabase.table("hackathons")
+            .select("title, link, source, reg_end_date")
+            .gte("reg_end_date", today.strftime("%Y-%m-%d"))
+            .lte("reg_end_date", (today + timedelta(days=RECHECK_WINDOW_DAYS)).strftime("%Y-%m-%d"))
+            .order("reg_end_date")
+            .limit(RECHECK_MAX_ITEMS)
+            .execute()
+        ).data or []
+    except Exception as e:
+        logger.error(f"Recheck query failed: {e}")
+        return
+
+    by_source = defaultdict(list)
+    for row in rows:
+        by_source[row.get("source")].append(row)
+    scrapers = {cls.platform_name: cls for cls in ALL_SCRAPERS}
+
+    changed = 0
+    for source, source_rows in by_source.items():
+        scraper_cls = scrapers.get(source)
+        if not scraper_cls:
+            continue
+        with platform_lock(scraper_cls.platform_name) as acquired:
+            if not acquired:
+                logger.info(f"{source}: crawl in progress, skipping recheck")
+                continue
+            stored = {row["link"]: str(row["reg_end_date"]) for row in source_rows}
+            items = [HackathonItem(title=row["title"], link=row["link"], source_platform=source) for row in source_rows]
+            for item in scraper_cls().recheck(items):
+                new_date = parse_date_flexible(item.date)
+                if not new_date or new_date == stored[item.link]:
+                    continue
+                try:
+                    supabase.table("hackathons").update({"reg_end_date": new_date}).eq("link", item.link).execute()
+                    changed += 1
+                    logger.info(f"{item.title}: reg_end_date {stored[item.link]} -> {new_date}")
+                except Exception as e:
+                    logger.error(f"Recheck update failed for {item.link}: {e}")
+
+    logger.info(f"Rechecked {len(rows)} closing-soon hackathons, {changed} deadlines changed")
+    if changed:
+        archive_expired()
+        publish_snapshots()
+
+
+class Scheduler:
+    """Runs each platform's crawl on its own interval (with jitter) plus a
+    frequent recheck of near-deadline rows. Jobs run one at a time; when
+    several are due, the one most overdue relative to its interval goes first."""
+
+    def __init__(self, jobs: list[Job]):
+        self.jobs = jobs
+        self._stopping = False
+
+    def stop(self, *_):
+        logger.info("Stop requested, exiting after the current job")
+        self._stopping = True
+
+    def run_due(self) -> bool:
+        now = time.monotonic()
+        due = [job for job in self.jobs if job.next_run <= now]
+        if not due:
+            return False
+        job = max(due, key=lambda j: j.overdue(now))
+        logger.info(f"Running {job.name}")
+        start = time.time()
+        try:
+            job.action()
+        except Exception as e:
+            logger.error(f"{job.name} failed: {e}")
+        job.reschedule()
+        logger.info(
+            f"{job.name} finished in {time.time() - start:.1f}s, "
+            f"next run in {(job.next_run - time.monotonic()) / 60:.0f} min"
+        )
+        return True
+
+    def run_forever(self):
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+        for job in self.jobs:
+            logger.info(f"{job.name}: every {job.interval / 60:.0f} min")
+        while not self._stopping:
+            if self.run_due():
+                continue
+            wait = min(job.next_run for job in self.jobs) - time.monotonic()
+            time.sleep(min(max(wait, 1), SCHEDULER_MAX_SLEEP_SECONDS))
+
+    def run_once(self):
+        """Run every job once, in priority order, and return."""
+        for job in self.jobs:
+            job.next_run = time.monotonic()
+        while not self._stopping and any(job.next_run <= time.monotonic() for job in self.jobs):
+            self.run_due()
+
+
+def build_jobs() -> list[Job]:
+    jobs = [crawl_job(cls) for cls in ALL_SCRAPERS]
+    jobs.append(Job("closing-soon recheck", RECHECK_INTERVAL_MINUTES, recheck_closing_soon))
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawl each platform on its own schedule.")
+    parser.add_argument("--once", action="store_true", help="run every job once and exit")
+    args = parser.parse_args()
+
+    date_parser.warm_up()
+    scheduler = Scheduler(build_jobs())
+    logger.info(f"Scheduler started (pid {os.getpid()})")
+    if args.once:
+        scheduler.run_once()
+    else:
+        scheduler.run_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+import os
+import re
+import gzip
+import json
+import shutil
+import hashlib
+import logging
+import urllib.request
+from datetime import datetime, timezone, timedelta
+from utils import get_supabase_client, get_env_int
+
+logger = logging.getLogger("snapshots")
+
+SNAPSHOT_DIR = os.environ.get("SNAPSHOT_DIR")
+SNAPSHOT_BUCKET = os.environ.get("SNAPSHOT_BUCKET")
+SNAPSHOT_REVALIDATE_URL = os.environ.get("SNAPSHOT_REVALIDATE_URL")
+REVALIDATE_SECRET = os.environ.get("REVALIDATE_SECRET", "")
+
+# Must match LIST_COLUMNS in frontend/src/lib/hackathonQueries.js
+SNAPSHOT_COLUMNS = "id, title, organizer, description, themes, mode, cities, reg_end_date, is_closed, link, image_url, thumbnail_url, source"
+# Wider than the frontend's 7-day urgency window so the shard stays
+# complete for a week after it was published.
+CLOSING_SOON_SHARD_DAYS = 14
+MANIFEST_NAME = "manifest.json"
+# Published versions kept after a publish; the previous one stays so readers
+# still holding its manifest can load its shards
+SNAPSHOT_KEEP_VERSIONS = get_env_int("SNAPSHOT_KEEP_VERSIONS", 2, min_value=2)
+_VERSION_RE = re.compile(r"\d{8}T\d{6}Z-[0-9a-f]{10}")
+_BUCKET_PAGE = 1000
+
+
+def shard_key(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", str(value).lower()).strip("-")
+
+
+def fetch_rows(supabase, page_size: int = 1000) -> list[dict]:
+    """Read the whole table once, in the same order the frontend lists it."""
+    rows = []
+    start = 0
+    while True:
+        result = (
+            supabase.table("hackathons")
+            .select(SNAPSHOT_COLUMNS)
+            .order("reg_end_date")
+            .order("id")
+            .range(start, start + page_size - 1)
+            .execute()
+        )
+        batch = result.data or []
+        rows.extend(batch)
+        if len(batch) < page_size:
+            return rows
+        start += page_size
+
+
+def build_shards(rows: list[dict], today=None) -> dict[str, list[dict]]:
+    today = today or datetime.now(timezone.utc).date()
+    soon = (today + timedelta(days=CLOSING_SOON_SHARD_DAYS)).strftime("%Y-%m-%d")
+    today_str = today.strftime("%Y-%m-%d")
+
+    shards: dict[str, list[dict]] = {"all": rows, "closing-soon": []}
+    for row in rows:
+        if row.get("source"):
+            shards.setdefault(f"platform/{shard_key(row['source'])}", []).append(row)
+        if row.get("mode"):
+            shards.setdefault(f"mode/{shard_key(row['mode'])}", []).append(row)
+        for city in row.get("cities") or []:
+            shards.setdefault(f"city/{shard_key(city)}", []).append(row)
+        reg_end = str(row.get("reg_end_date") or "")
+        if today_str <= reg_end <= soon:
+            shards["closing-soon"].append(row)
+    return shards
+
+
+def _encode(rows: list[dict]) -> bytes:
+    # mtime=0 keeps identical content byte-identical across runs
+    return gzip.compress(json.dumps(rows, separators=(",", ":"), default=str).encode("utf-8"), mtime=0)
+
+
+def _previous_manifest(supabase) -> dict | None:
+    """The manifest currently published: the local copy when SNAPSHOT_DIR is
+    set, otherwise the one in the bucket."""
+    try:
+        if SNAPSHOT_DIR:
+            with open(os.path.join(SNAPSHOT_DIR, MANIFEST_NAME), "r", encoding="utf-8") as f:
+                return json.load(f)
+        if SNAPSHOT_BUCKET:
+            return json.loads(supabase.storage.from_(SNAPSHOT_BUCKET).download(MANIFEST_NAME))
+    except Exception as e:
+        # First publish, or an unreadable manifest: publish a fresh version
+        logger.debug(f"No previous snapshot manifest: {e}")
+    return None
+
+
+def _write_local(files: dict[str, bytes]):
+    for path, data in files.items():
+        full_path = os.path.join(SNAPSHOT_DIR, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        tmp_path = f"{full_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, full_path)
+
+
+def _upload_bucket(supabase, files: dict[str, bytes]):
+    bucket = supabase.storage.from_(SNAPSHOT_BUCKET)
+    for path, data in files.items():
+        is_manifest = path == MANIFEST_NAME
+        bucket.upload(
+            path,
+            data,
+            file_options={
+                "content-type": "application/json" if is_manifest else "application/gzip",
+                # Versioned shards never change; only the manifest moves
+                "cache-control": "60" if is_manifest else "31536000",
+                "upsert": "true",
+            },
+        )
+
+
+def _stale_versions(names, current: str) -> list[str]:
+    versions = sorted(name for name in names if _VERSION_RE.fullmatch(name))
+    return [version for version in versions[:-SNAPSHOT_KEEP_VERSIONS] if version != current]
+
+
+def _prune_local(current: str):
+    for version in _stale_versions(os.listdir(SNAPSHOT_DIR), current):
+        shutil.rmtree(os.path.join(SNAPSHOT_DIR, version), ignore_errors=True)
+        logger.info(f"Removed snapshot {version} from {SNAPSHOT_DIR}")
+
+
+def _bucket_list(bucket, prefix: str) -> list[dict]:
+    entries = []
+    while True:
+        page = bucket.list(prefix, {"limit": _BUCKET_PAGE, "offset": len(entries)})
+        entries.extend(page)
+        if len(page) < _BUCKET_PAGE:
+            return entries
+
+
+def _bucket_files(bucket, prefix: str) -> list[str]:
+    """Every object under ``prefix``; folders are listed without an id."""
+    paths = []
+    for entry in _bucket_list(bucket, prefix):
+        path = f"{prefix}/{entry['name']}"
+        if entry.get("id") is None:
+            paths.extend(_bucket_files(bucket, path))
+        else:
+            paths.append(path)
+    return paths
+
+
+def _prune_bucket(supabase, current: str):
+    bucket = supabase.storage.from_(SNAPSHOT_BUCKET)
+    folders = [entry["name"] for entry in _bucket_list(bucket, "") if entry.get("id") is None]
+    for version in _stale_versions(folders, current):
+        paths = _bucket_files(bucket, version)
+        for start in range(0, len(paths), _BUCKET_PAGE):
+            bucket.remove(paths[start:start + _BUCKET_PAGE])
+        logger.info(f"Removed snapshot {version} from bucket {SNAPSHOT_BUCKET}")
+
+
+def prune_versions(supabase, current: str):
+    """Delete all but the newest SNAPSHOT_KEEP_VERSIONS versions (never
+    ``current``), locally and in the bucket. Failures are only logged: the
+    new snapshot is already live."""
+    try:
+        if SNAPSHOT_DIR:
+            _prune_local(current)
+        if SNAPSHOT_BUCKET:
+            _prune_bucket(supabase, current)
+    except Exception as e:
+        logger.warning(f"Could not prune old snapshots: {e}")
+
+
+def notify_revalidate():
+    if not SNAPSHOT_REVALIDATE_URL:
+        return
+    request = urllib.request.Request(
+        SNAPSHOT_REVALIDATE_URL,
+        method="POST",
+        headers={"x-revalidate-secret": REVALIDATE_SECRET},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=get_env_int("SNAPSHOT_REVALIDATE_TIMEOUT", 10)) as response:
+            logger.info(f"Frontend revalidation requested ({response.status})")
+    except Exception as e:
+        logger.warning(f"Frontend revalidation failed: {e}")
+
+
+def publish_snapshots(rows: list[dict] | None = None) -> dict | None:
+    """Export versioned, gzipped JSON shards of the hackathons table plus a
+    manifest pointing at them, then ask the frontend to revalidate."""
+    if not SNAPSHOT_DIR and not SNAPSHOT_BUCKET:
+        logger.info("Snapshot export disabled (set SNAPSHOT_DIR and/or SNAPSHOT_BUCKET)")
+        return None
+
+    try:
+        supabase = get_supabase_client()
+        if rows is None:
+            rows = fetch_rows(supabase)
+
+        shards = build_shards(rows)
+        encoded = {key: _encode(shard) for key, shard in shards.items()}
+        digest = hashlib.sha256()
+        for key in sorted(encoded):
+            digest.update(key.encode())
+            digest.update(encoded[key])
+        content_hash = digest.hexdigest()
+
+        previous = _previous_manifest(supabase)
+        if previous and previous.get("content_hash") == content_hash:
+            logger.info(f"Snapshot unchanged ({previous.get('version')}), skipping publish")
+            return previous
+
+        generated_at = datetime.now(timezone.utc)
+        version = f"{generated_at.strftime('%Y%m%dT%H%M%SZ')}-{content_hash[:10]}"
+        manifest = {
+            "version": version,
+            "generated_at": generated_at.isoformat(),
+            "content_hash": content_hash,
+            "shards": {
+                key: {"path": f"{version}/{key}.json.gz", "count": len(shard)}
+                for key, shard in shards.items()
+            },
+        }
+        files = {manifest["shards"][key]["path"]: data for key, data in encoded.items()}
+        # Manifest last, so readers never see a version whose shards are missing
+        files[MANIFEST_NAME] = json.dumps(manifest, indent=2).encode("utf-8")
+
+        if SNAPSHOT_DIR:
+            _write_local(files)
+        if SNAPSHOT_BUCKET:
+            _upload_bucket(supabase, files)
+        logger.info(f"Published snapshot {version}: {len(rows)} rows in {len(encoded)} shards")
+    except Exception as e:
+        logger.error(f"Snapshot export failed: {e}")
+        return None
+
+    prune_versions(supabase, version)
+    notify_revalidate()
+    return manifest
@@ -0,0 +1,265 @@
+import json
+from datetime import datetime
+from html.parser import HTMLParser
+from utils import parse_date_flexible
+
+EVENT_TYPES = ("event", "hackathon")
+# Elements without a closing tag; they never open a scope
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+# Collects the same raw parts as StructuredDataParser, straight from a live DOM
+STRUCTURED_DATA_JS = r"""
+() => {
+    const ldJson = [...document.querySelectorAll('script[type="application/ld+json"]')].map((s) => s.textContent);
+    const meta = {};
+    for (const el of document.querySelectorAll("meta[property], meta[name]")) {
+        const key = (el.getAttribute("property") || el.getAttribute("name") || "").toLowerCase();
+        if (key && !(key in meta)) meta[key] = el.getAttribute("content") || "";
+    }
+    const microdata = [];
+    for (const scope of document.querySelectorAll("[itemscope][itemtype]")) {
+        if (!/event|hackathon/i.test(scope.getAttribute("itemtype"))) continue;
+        for (const el of scope.querySelectorAll("[itemprop]")) {
+            const value = el.getAttribute("content") || el.getAttribute("datetime") || el.innerText || "";
+            microdata.push([el.getAttribute("itemprop"), value.trim()]);
+        }
+    }
+    return { ld_json: ldJson, meta, microdata };
+}
+"""
+
+
+class StructuredDataParser(HTMLParser):
+    """Single streaming pass over raw HTML collecting JSON-LD blocks, meta tags
+    and microdata properties found inside schema.org Event scopes."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.ld_json: list[str] = []
+        self.meta: dict[str, str] = {}
+        self.microdata: list[list[str]] = []
+        self._in_ld_json = False
+        self._ld_buffer: list[str] = []
+        # Open elements, and the index in it of the event itemscope element
+        self._open_tags: list[str] = []
+        self._event_scope_at: int | None = None
+        self._pending_prop = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "script" and (attrs.get("type") or "").lower() == "application/ld+json":
+            self._in_ld_json = True
+            self._ld_buffer = []
+            return
+        if tag == "meta":
+            key = (attrs.get("property") or attrs.get("name") or "").lower()
+            if key and key not in self.meta:
+                self.meta[key] = attrs.get("content") or ""
+        if tag not in VOID_TAGS:
+            self._open_tags.append(tag)
+            if (
+                self._event_scope_at is None
+                and "itemscope" in attrs
+                and any(t in (attrs.get("itemtype") or "").lower() for t in EVENT_TYPES)
+            ):
+                self._event_scope_at = len(self._open_tags) - 1
+        prop = attrs.get("itemprop")
+        if prop and self._event_scope_at is not None:
+            value = attrs.get("content") or attrs.get("datetime")
+            if value:
+                self.microdata.append([prop, value.strip()])
+            else:
+                self._pending_prop = prop
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self._in_ld_json:
+            self._in_ld_json = False
+            self.ld_json.append("".join(self._ld_buffer))
+        if tag not in self._open_tags:
+            return
+        # Like a browser, a closing tag also closes anything left open inside it
+        while self._open_tags.pop() != tag:
+            pass
+        if self._event_scope_at is not None and len(self._open_tags) <= self._event_scope_at:
+            self._event_scope_at = None
+            self._pending_prop = None
+
+    def handle_data(self, data):
+        if self._in_ld_json:
+            self._ld_buffer.append(data)
+        elif self._pending_prop and data.strip():
+            self.microdata.append([self._pending_prop, data.strip()])
+            self._pending_prop = None
+
+    def parts(self) -> dict:
+        return {"ld_json": self.ld_json, "meta": self.meta, "microdata": self.microdata}
+
+
+def _iter_nodes(node):
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, list):
+            stack.extend(current)
+        elif isinstance(current, dict):
+            yield current
+            if "@graph" in current:
+                stack.append(current["@graph"])
+
+
+def _is_event(node: dict) -> bool:
+    types = node.get("@type") or []
+    if isinstance(types, str):
+        types = [types]
+    return any(isinstance(t, str) and any(e in t.lower() for e in EVENT_TYPES) for t in types)
+
+
+def _first(value):
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _name(value) -> str:
+    value = _first(value)
+    if isinstance(value, dict):
+        return str(value.get("name") or "").strip()
+    return str(value or "").strip()
+
+
+def _image(value) -> str:
+    value = _first(value)
+    if isinstance(value, dict):
+        value = value.get("url") or value.get("contentUrl")
+    return str(value or "").strip()
+
+
+def _location(value) -> tuple[str, bool | None]:
+    """Return ``(location text, is_offline)`` for a schema.org location value."""
+    value = _first(value)
+    if isinstance(value, str):
+        return value.strip(), None
+    if not isinstance(value, dict):
+        return "", None
+    if "virtual" in str(value.get("@type", "")).lower():
+        return "Online", False
+    if str(value.get("name") or "").strip().lower() in {"online", "virtual"}:
+        return "Online", False
+
+    parts = [str(value.get("name") or "").strip()]
+    address = value.get("address")
+    if isinstance(address, dict):
+        for key in ("addressLocality", "addressRegion", "addressCountry"):
+            part = _name(address.get(key))
+            if part:
+                parts.append(part)
+    elif isinstance(address, str):
+        parts.append(address.strip())
+    seen = []
+    for part in parts:
+        if part and part not in seen:
+            seen.append(part)
+    return ", ".join(seen), True if seen else None
+
+
+def normalize_iso_date(value):
+    """Return YYYY-MM-DD for ISO-8601 values without touching dateparser;
+    anything else goes through parse_date_flexible."""
+    if not value:
+        return None
+    text = str(value).strip()
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).strftime("%Y-%m-%d")
+    except ValueError:
+        return parse_date_flexible(text)
+
+
+def _from_event(node: dict) -> dict:
+    data = {}
+    offers = _first(node.get("offers"))
+    deadline = None
+    if isinstance(offers, dict):
+        deadline = offers.get("validThrough") or offers.get("availabilityEnds")
+    date_val = normalize_iso_date(deadline or node.get("endDate"))
+    if date_val:
+        data["date"] = date_val
+
+    location, is_offline = _location(node.get("location"))
+    if location:
+        data["location"] = location
+    mode = str(node.get("eventAttendanceMode") or "").lower()
+    if "offline" in mode:
+        is_offline = True
+    elif "online" in mode:
+        is_offline = False
+    if is_offline is not None:
+        data["is_offline"] = is_offline
+
+    organizer = _name(node.get("organizer"))
+    if organizer:
+        data["organizer"] = organizer
+    image = _image(node.get("image"))
+    if image:
+        data["image_url"] = image
+    keywords = node.get("keywords")
+    if isinstance(keywords, list):
+        keywords = ", ".join(str(k).strip() for k in keywords if k)
+    if keywords:
+        data["themes"] = str(keywords).strip()
+    return data
+
+
+def interpret(parts: dict) -> dict:
+    """Map raw JSON-LD / microdata / meta parts onto HackathonItem fields.
+    Only fields that were actually found are returned."""
+    data = {}
+    for raw in parts.get("ld_json") or []:
+        try:
+            payload = json.loads(raw)
+        except (TypeError, ValueError):
+            continue
+        for node in _iter_nodes(payload):
+            if _is_event(node):
+                for key, value in _from_event(node).items():
+                    data.setdefault(key, value)
+
+    props: dict[str, str] = {}
+    for prop, value in parts.get("microdata") or []:
+        props.setdefault(prop, value)
+    if "date" not in data:
+        date_val = normalize_iso_date(props.get("validThrough") or props.get("endDate"))
+        if date_val:
+            data["date"] = date_val
+    if "location" not in data and props.get("location"):
+        data["location"] = props["location"]
+    if "organizer" not in data and props.get("organizer"):
+        data["organizer"] = props["organizer"]
+
+    meta = parts.get("meta") or {}
+    if "date" not in data:
+        date_val = normalize_iso_date(meta.get("event:end_time"))
+        if date_val:
+            data["date"] = date_val
+    if "image_url" not in data and meta.get("og:image"):
+        data["image_url"] = meta["og:image"]
+    return data
+
+
+def extract_from_html(html: str) -> dict:
+    parser = StructuredDataParser()
+    try:
+        parser.feed(html or "")
+        parser.close()
+    except Exception:
+        pass
+    return interpret(parser.parts())
+
+
+def extract_from_page(page) -> dict:
+    try:
+        return interpret(page.evaluate(STRUCTURED_DATA_JS))
+    except Exception:
+        return {}
@@ -0,0 +1,124 @@
+"""Synthetic ``HackathonItem`` streams for load tests.
+
+Items look like what the scrapers emit: per-platform links, organizers,
+themes, gazetteer cities and a mix of date formats, with a controllable
+share of duplicates (same title and date re-listed on another platform),
+undated and already-expired events. Output is deterministic for a seed.
+"""
+import os
+import json
+import random
+from datetime import date, timedelta
+from typing import Iterator
+from models import HackathonItem
+
+PLATFORMS = {
+    "Unstop": "https://unstop.com/hackathons/{slug}-{n}",
+    "Devfolio": "https://{slug}-{n}.devfolio.co/",
+    "Devpost": "https://{slug}-{n}.devpost.com/",
+    "HackerEarth": "https://www.hackerearth.com/challenges/hackathon/{slug}-{n}/",
+    "Knowafest": "https://www.knowafest.com/explore/events/2026/{n}-{slug}",
+    "CampusKarma": "https://www.campuskarma.in/events/{slug}-{n}",
+    "AllCollegeEvent": "https://allevents.in/{slug}/{n}",
+}
+
+_PREFIXES = ["Hack", "Code", "Build", "Smart", "Open", "Green", "Quantum", "Cyber", "Future", "Data"]
+_SUBJECTS = ["India", "the Planet", "Health", "Cities", "Campus", "Fintech", "Climate", "Web3", "AI", "Mobility"]
+_SUFFIXES = ["Hackathon", "Hack", "Challenge", "Sprint", "Jam", "Buildathon", "Innovation Challenge"]
+_ORGANIZERS = [
+    "IIT Madras", "IIT Bombay", "NIT Trichy", "BITS Pilani", "VIT Vellore", "Google Developer Groups",
+    "Microsoft Learn Student Ambassadors", "MLH", "Smart India Hackathon", "IEEE Student Branch",
+]
+_THEMES = ["AI/ML", "Web3", "FinTech", "HealthTech", "EdTech", "Open Innovation", "Sustainability", "IoT", "Cybersecurity"]
+
+# Formats seen in scraped listings; "text" is free text the normaliser must search
+DATE_FORMATS = {
+    "iso": lambda d: d.strftime("%Y-%m-%d"),
+    "us": lambda d: d.strftime("%b %d, %Y"),
+    "long": lambda d: d.strftime("%d %B %Y"),
+    "numeric": lambda d: d.strftime("%d/%m/%Y"),
+    "text": lambda d: f"Registration closes on {d.strftime('%d %b %Y')} at 11:59 PM IST",
+}
+DEFAULT_FORMAT_WEIGHTS = {"iso": 0.7, "us": 0.1, "long": 0.08, "numeric": 0.05, "text": 0.07}
+
+
+def _load_cities() -> list[str]:
+    path = os.path.join(os.path.dirname(__file__), "data", "gazetteer.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return list(json.load(f))
+    except (OSError, ValueError):
+        return ["Bengaluru", "Chennai", "Mumbai", "Hyderabad", "Pune"]
+
+
+def parse_format_weights(spec: str) -> dict[str, float]:
+    """``"iso=0.5,text=0.5"`` -> weights; unknown format names raise ValueError."""
+    weights = {}
+    for part in spec.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in DATE_FORMATS:
+            raise ValueError(f"Unknown date format {name!r} (choose from {', '.join(DATE_FORMATS)})")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def generate_items(
+    count: int,
+    duplicate_rate: float = 0.15,
+    no_date_rate: float = 0.05,
+    expired_rate: float = 0.05,
+    format_weights: dict[str, float] | None = None,
+    seed: int = 0,
+    today: date | None = None,
+) -> Iterator[HackathonItem]:
+    """Yield ``count`` items. ``duplicate_rate`` of them repeat an earlier
+    event's title and date under another platform's link, which the
+    DeduplicationEngine should drop."""
+    rng = random.Random(seed)
+    today = today or date.today()
+    cities = _load_cities()
+    weights = format_weights or DEFAULT_FORMAT_WEIGHTS
+    format_names = list(weights)
+    format_weights = [weights[name] for name in format_names]
+    platforms = list(PLATFORMS)
+    # Recent originals only, so duplicates stay cheap to pick at 1M items
+    recent: list[HackathonItem] = []
+
+    for n in range(count):
+        platform = rng.choice(platforms)
+        if recent and rng.random() < duplicate_rate:
+            original = rng.choice(recent)
+            title = original.title.upper() if rng.random() < 0.2 else f"  {original.title} "
+            slug = "-".join(original.title.lower().split())
+            yield original.model_copy(update={
+                "title": title,
+                "source_platform": platform,
+                "link": PLATFORMS[platform].format(slug=slug, n=n),
+            })
+            continue
+
+        title = f"{rng.choice(_PREFIXES)} {rng.choice(_SUBJECTS)} {rng.choice(_SUFFIXES)} {2026 + n % 3} #{n}"
+        deadline = None
+        if rng.random() >= no_date_rate:
+            offset = -rng.randint(15, 365) if rng.random() < expired_rate else rng.randint(1, 120)
+            day = today + timedelta(days=offset)
+            fmt = rng.choices(format_names, weights=format_weights)[0]
+            deadline = DATE_FORMATS[fmt](day)
+        is_offline = rng.random() < 0.4
+        location = rng.choice(cities) if is_offline else "Online"
+        slug = "-".join(title.lower().replace("#", "").split())
+        item = HackathonItem(
+            title=title,
+            organizer=rng.choice(_ORGANIZERS),
+            date=deadline,
+            location=location,
+            link=PLATFORMS[platform].format(slug=slug, n=n),
+            source_platform=platform,
+            is_offline=is_offline,
+            image_url=f"https://images.example.com/{platform.lower()}/{n}.png" if rng.random() < 0.8 else None,
+            themes=", ".join(rng.sample(_THEMES, rng.randint(1, 3))),
+        )
+        recent.append(item)
+        if len(recent) > 1000:
+            recent.pop(rng.randrange(len(recent)))
+        yield item
@@ -0,0 +1,155 @@
+import time
+import random
+import logging
+import threading
+from urllib.parse import urlparse
+from utils import get_env_int, get_env_float
+
+
+class CircuitOpenError(Exception):
+    """Raised when a domain has failed too often and is being short-circuited."""
+
+
+class _DomainState:
+    def __init__(self, capacity: float):
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.backoff = 0.0
+        self.backoff_until = 0.0
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+        self.trial_started = 0.0
+        self.lock = threading.Lock()
+        # Notified when a half-open trial request has been recorded
+        self.settled = threading.Condition(self.lock)
+
+
+class DomainThrottle:
+    """Per-domain token bucket with adaptive backoff and a circuit breaker.
+
+    Every request to a domain takes a token; 429/5xx responses and network
+    errors double the domain's backoff (honouring Retry-After) and, after
+    ``failure_threshold`` consecutive failures, open the circuit so further
+    requests fail immediately until ``cooldown`` seconds have passed. The
+    first request after the cooldown is a trial: other callers wait for its
+    outcome, and one more failure re-opens the circuit. A trial that is never
+    recorded stops holding them back after ``trial_timeout`` seconds.
+    """
+
+    def __init__(self):
+        self.rate = get_env_float("THROTTLE_RATE_PER_SEC", 1.0, min_value=0.01)
+        self.burst = get_env_float("THROTTLE_BURST", 3.0, min_value=1.0)
+        self.base_backoff = get_env_float("THROTTLE_BASE_BACKOFF_SECONDS", 2.0, min_value=0.0)
+        self.max_backoff = get_env_float("THROTTLE_MAX_BACKOFF_SECONDS", 60.0, min_value=0.0)
+        self.failure_threshold = get_env_int("CIRCUIT_FAILURE_THRESHOLD", 5, min_value=1)
+        self.cooldown = get_env_float("CIRCUIT_COOLDOWN_SECONDS", 300.0, min_value=0.0)
+        self.trial_timeout = get_env_float("CIRCUIT_TRIAL_TIMEOUT_SECONDS", 60.0, min_value=1.0)
+        self.logger = logging.getLogger("throttle")
+        self._domains: dict[str, _DomainState] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def domain_for(url: str) -> str:
+        host = urlparse(url).hostname or url
+        return host[4:] if host.startswith("www.") else host
+
+    def _state(self, domain: str) -> _DomainState:
+        with self._lock:
+            state = self._domains.get(domain)
+            if state is None:
+                state = self._domains[domain] = _DomainState(self.burst)
+            return state
+
+    def is_open(self, url: str) -> bool:
+        state = self._state(self.domain_for(url))
+        with state.lock:
+            return state.opened_at is not None and time.monotonic() - state.opened_at < self.cooldown
+
+    def acquire(self, url: str):
+        """Block until a request to ``url``'s domain is allowed."""
+        domain = self.domain_for(url)
+        state = self._state(domain)
+        trial = False
+        while True:
+            with state.lock:
+                now = time.monotonic()
+                if state.opened_at is not None and not trial:
+                    if now - state.opened_at < self.cooldown:
+                        raise CircuitOpenError(f"circuit open for {domain}")
+                    # Half-open: a single trial request; the rest wait for its outcome
+                    trial_age = now - state.trial_started
+                    if state.trial_in_flight and trial_age < self.trial_timeout:
+                        state.settled.wait(self.trial_timeout - trial_age)
+                        continue
+                    state.trial_in_flight = trial = True
+                    state.trial_started = now
+                    state.failures = self.failure_threshold - 1
+
+                state.tokens = min(self.burst, state.tokens + (now - state.updated) * self.rate)
+                state.updated = now
+
+                wait = state.backoff_until - now
+                if wait <= 0:
+                    if state.tokens >= 1:
+                        state.tokens -= 1
+                        return
+                    wait = (1 - state.tokens) / self.rate
+            time.sleep(wait)
+
+    def record(self, url: str, status: int | None = None, error: bool = False, retry_after=None):
+        """Feed back the outcome of a request so the domain's pace adapts."""
+        domain = self.domain_for(url)
+        state = self._state(domain)
+        failed = error or (status is not None and (status == 429 or status >= 500))
+        with state.lock:
+            now = time.monotonic()
+            trial = state.trial_in_flight
+            if trial:
+                state.trial_in_flight = False
+                state.settled.notify_all()
+            if not failed:
+                if trial:
+                    state.opened_at = None
+                    self.logger.info(f"Circuit closed for {domain} after a successful trial request")
+                state.failures = 0
+                state.backoff /= 2
+                if state.backoff < self.base_backoff / 4:
+                    state.backoff = 0.0
+                return
+
+            state.failures += 1
+            state.backoff = min(max(state.backoff * 2, self.base_backoff), self.max_backoff)
+            delay = state.backoff * random.uniform(0.8, 1.2)
+            try:
+                delay = max(delay, min(float(retry_after), self.max_backoff))
+            except (TypeError, ValueError):
+                pass
+            state.backoff_until = max(state.backoff_until, now + delay)
+
+            if state.failures >= self.failure_threshold and (state.opened_at is None or trial):
+                state.opened_at = now
+                self.logger.warning(
+                    f"Circuit opened for {domain} after {state.failures} failures, "
+                    f"cooling down {self.cooldown:.0f}s"
+                )
+
+    def record_response(self, url: str, response):
+        """Convenience wrapper for Playwright responses (``None`` counts as success)."""
+        if response is None:
+            self.record(url)
+            return
+        self.record(url, status=response.status, retry_after=response.headers.get("retry-after"))
+
+
+_throttle: DomainThrottle | None = None
+_throttle_lock = threading.Lock()
+
+
+def get_throttle() -> DomainThrottle:
+    """Process-wide throttle shared by every scraper and the web-search fallback."""
+    global _throttle
+    with _throttle_lock:
+        if _throttle is None:
+            _throttle = DomainThrottle()
+        return _throttle
@@ -0,0 +1,218 @@
+import io
+import os
+import json
+import hashlib
+import logging
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from throttle import CircuitOpenError, get_throttle
+from utils import get_cache_dir, get_env_int, get_supabase_client
+
+try:
+    from PIL import Image, ImageOps
+    HAS_PIL = True
+except ImportError:
+    Image = None
+    ImageOps = None
+    HAS_PIL = False
+
+logger = logging.getLogger("thumbnails")
+
+THUMBNAIL_DIR = os.environ.get("THUMBNAIL_DIR")
+THUMBNAIL_BUCKET = os.environ.get("THUMBNAIL_BUCKET")
+# Public URL prefix for THUMBNAIL_DIR (e.g. a CDN in front of it)
+THUMBNAIL_BASE_URL = (os.environ.get("THUMBNAIL_BASE_URL") or "").rstrip("/")
+THUMBNAIL_FORMAT = os.environ.get("THUMBNAIL_FORMAT", "webp").lower()
+THUMBNAIL_WIDTH = get_env_int("THUMBNAIL_WIDTH", 640, min_value=32)
+THUMBNAIL_HEIGHT = get_env_int("THUMBNAIL_HEIGHT", 384, min_value=32)
+THUMBNAIL_QUALITY = get_env_int("THUMBNAIL_QUALITY", 70, min_value=1)
+THUMBNAIL_WORKERS = get_env_int("THUMBNAIL_WORKERS", 4, min_value=1)
+THUMBNAIL_MAX_BYTES = get_env_int("THUMBNAIL_MAX_BYTES", 10 * 1024 * 1024, min_value=1024)
+THUMBNAIL_TIMEOUT = get_env_int("THUMBNAIL_TIMEOUT", 15, min_value=1)
+
+_CONTENT_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+
+
+class ThumbnailIndex:
+    """source URL -> {etag, last_modified, key} kept in .cache/thumbnails, so
+    unchanged images are neither re-downloaded nor re-encoded."""
+
+    def __init__(self):
+        self.path = os.path.join(get_cache_dir("thumbnails"), "index.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+        self.keys = {entry["key"] for entry in self.entries.values() if entry.get("key")}
+
+    def get(self, url: str) -> dict:
+        with self._lock:
+            return dict(self.entries.get(url) or {})
+
+    def put(self, url: str, entry: dict):
+        with self._lock:
+            self.entries[url] = entry
+            self.keys.add(entry["key"])
+
+    def has_key(self, key: str) -> bool:
+        with self._lock:
+            return key in self.keys
+
+    def save(self):
+        with self._lock:
+            payload = json.dumps(self.entries)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save thumbnail index: {e}")
+
+
+def _encode(data: bytes) -> bytes:
+    with Image.open(io.BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT))
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() or image.mode == "P" else "RGB")
+        out = io.BytesIO()
+        image.save(out, format=THUMBNAIL_FORMAT.upper(), quality=THUMBNAIL_QUALITY)
+        return out.getvalue()
+
+
+class ThumbnailPipeline:
+    def __init__(self):
+        self.index = ThumbnailIndex()
+        self.throttle = get_throttle()
+        self.bucket = get_supabase_client().storage.from_(THUMBNAIL_BUCKET) if THUMBNAIL_BUCKET else None
+        self.created = 0
+        self.reused = 0
+        self.failed = 0
+
+    def _path(self, key: str) -> str:
+        return f"thumbs/{key}.{THUMBNAIL_FORMAT}"
+
+    def public_url(self, key: str) -> str | None:
+        if self.bucket is not None:
+            return self.bucket.get_public_url(self._path(key))
+        if THUMBNAIL_BASE_URL:
+            return f"{THUMBNAIL_BASE_URL}/{self._path(key)}"
+        return None
+
+    def _fetch(self, url: str, entry: dict) -> bytes | None:
+        """New image bytes, or None when the origin says it is unchanged (304)."""
+        headers = {"User-Agent": "Mozilla/5.0", "Accept": "image/*"}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        self.throttle.acquire(url)
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=THUMBNAIL_TIMEOUT) as r:
+                data = r.read(THUMBNAIL_MAX_BYTES + 1)
+                entry["etag"] = r.headers.get("ETag")
+                entry["last_modified"] = r.headers.get("Last-Modified")
+        except urllib.error.HTTPError as e:
+            self.throttle.record(url, status=e.code)
+            if e.code == 304 and entry.get("key"):
+                return None
+            raise
+        except Exception:
+            self.throttle.record(url, error=True)
+            raise
+        self.throttle.record(url)
+        if len(data) > THUMBNAIL_MAX_BYTES:
+            raise ValueError("image too large")
+        return data
+
+    def _store(self, key: str, thumb: bytes):
+        path = self._path(key)
+        if THUMBNAIL_DIR:
+            full_path = os.path.join(THUMBNAIL_DIR, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(f"{full_path}.tmp", "wb") as f:
+                f.write(thumb)
+            os.replace(f"{full_path}.tmp", full_path)
+        if self.bucket is not None:
+            self.bucket.upload(
+                path,
+                thumb,
+                file_options={
+                    "content-type": _CONTENT_TYPES.get(THUMBNAIL_FORMAT, "application/octet-stream"),
+                    # Keys are content hashes, so a stored thumbnail never changes
+                    "cache-control": "31536000",
+                    "upsert": "true",
+                },
+            )
+
+    def thumbnail_for(self, url: str) -> str | None:
+        """Return the thumbnail key for an image URL, creating it if needed."""
+        entry = self.index.get(url)
+        data = self._fetch(url, entry)
+        if data is None:
+            self.reused += 1
+            return entry["key"]
+
+        # Same bytes under a new URL (or re-served without validators) reuse the stored thumbnail
+        key = hashlib.sha256(data).hexdigest()[:24]
+        missing_locally = THUMBNAIL_DIR and not os.path.exists(os.path.join(THUMBNAIL_DIR, self._path(key)))
+        if not self.index.has_key(key) or missing_locally:
+            self._store(key, _encode(data))
+            self.created += 1
+        else:
+            self.reused += 1
+        entry["key"] = key
+        self.index.put(url, entry)
+        return key
+
+    def _safe_thumbnail(self, url: str) -> str | None:
+        try:
+            return self.thumbnail_for(url)
+        except CircuitOpenError:
+            return self.index.get(url).get("key")
+        except Exception as e:
+            self.failed += 1
+            logger.debug(f"Thumbnail failed for {url}: {e}")
+            # Keep serving the last good thumbnail rather than blanking the column
+            return self.index.get(url).get("key")
+
+    def process(self, rows: list[dict]) -> list[dict]:
+        urls = sorted({
+            row["image_url"] for row in rows
+            if str(row.get("image_url") or "").startswith(("http://", "https://"))
+            and not str(row["image_url"]).lower().split("?")[0].endswith(".svg")
+        })
+        with ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS) as pool:
+            keys = dict(zip(urls, pool.map(self._safe_thumbnail, urls)))
+        self.index.save()
+
+        for row in rows:
+            key = keys.get(row.get("image_url"))
+            row["thumbnail_url"] = self.public_url(key) if key else None
+        logger.info(
+            f"Thumbnails: {self.created} created, {self.reused} unchanged, {self.failed} failed "
+            f"({len(urls)} distinct images)"
+        )
+        return rows
+
+
+def attach_thumbnails(rows: list[dict]) -> list[dict]:
+    """Set ``thumbnail_url`` on each row from a small WebP/AVIF copy of its
+    image_url, stored under a content-hash key in THUMBNAIL_DIR and/or the
+    THUMBNAIL_BUCKET storage bucket. Rows are returned unchanged when the
+    pipeline is not configured or Pillow is missing."""
+    if not THUMBNAIL_BUCKET and not (THUMBNAIL_DIR and THUMBNAIL_BASE_URL):
+        return rows
+    if not HAS_PIL:
+        logger.warning("Pillow is not installed, skipping thumbnails")
+        return rows
+    try:
+        return ThumbnailPipeline().process(rows)
+    except Exception as e:
+        logger.error(f"Thumbnail pipeline failed: {e}")
+        return rows
@@ -2,22 +2,23 @@ import time
 from playwright.sync_api import Page, BrowserContext
 from base_scraper import GenericScraper
 from models import HackathonItem
-from utils import extract_reg_end_date_from_text, search_date_on_web
 
 
 class UnstopScraper(GenericScraper):
     platform_name = "Unstop"
+    CRAWL_INTERVAL_MINUTES = 60
     TARGET_URL = "https://unstop.com/hackathons?oppstatus=open"
     API_PATTERN = "unstop.com/api/public/opportunity/search-new"
+    CARD_SELECTOR = "a[href*='/hackathon/']"
 
     def scrape(self, page: Page, context: BrowserContext) -> list[HackathonItem]:
         items: list[HackathonItem] = []
 
         self._intercept_api(page, self.API_PATTERN, self.TARGET_URL)
 
-        for _ in range(5):
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(2000)
+        # The search API is paginated, so skip scrolling once its pattern is known
+        if not self._follow_api_pages(context, is_empty=lambda payload: not self._opportunities(payload)):
+            self._paginate(page, item_selector=self.CARD_SELECTOR)
 
         if self._captured_responses:
             items = self._parse_api_responses()
@@ -30,110 +31,87 @@ class UnstopScraper(GenericScraper):
 
         return items
 
+    @staticmethod
+    def _opportunities(payload) -> list:
+        if not isinstance(payload, dict):
+            return []
+        data = payload.get("data")
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            return data.get("data", []) or []
+        return []
+
+    def _dateless_links(self, payload) -> list[str]:
+        return [item.link for item in self._items_from_payload(payload) if not item.date]
+
     def _parse_api_responses(self) -> list[HackathonItem]:
         items = []
+        seen = set()
         for payload in self._captured_responses:
-            opportunities = payload.get("data", {}).get("data", [])
-            if not opportunities and isinstance(payload.get("data"), list):
-                opportunities = payload["data"]
-
-            for opp in opportunities:
-                title = opp.get("title", "").strip()
-                if not title:
-                    continue
-
-                link = f"https://unstop.com/hackathon/{opp.get('public_url', '')}" if opp.get("public_url") else ""
-                if not link or link == "https://unstop.com/hackathon/":
-                    continue
-
-                # Try multiple API fields for registration end date
-                end_date = None
-                regn_req = opp.get("regnRequirements")
-                if isinstance(regn_req, dict):
-                    end_date = regn_req.get("end_regn_dt")
-                if not end_date:
-                    end_date = opp.get("end_date")
-                if not end_date:
-                    end_date = opp.get("deadline")
-                if not end_date:
-                    # Check nested dates
-                    dates = opp.get("dates", {})
-                    if isinstance(dates, dict):
-                        end_date = dates.get("end_date") or dates.get("registration_end")
-
-                if end_date and "T" in str(end_date):
-                    end_date = str(end_date).split("T")[0]
-
-                org = ""
-                org_data = opp.get("organisation")
-                if isinstance(org_data, dict):
-                    org = org_data.get("name", "")
-
-                location = opp.get("city", "") or ""
-                is_offline = False
-                eligible = opp.get("oppstatus_eligible_for")
-                if isinstance(eligible, dict):
-                    is_offline = eligible.get("is_offline", False)
-
-                logo = opp.get("logoUrl2") or opp.get("logoUrl") or ""
-
-                items.append(HackathonItem(
-                    title=title,
-                    organizer=org,
-                    date=str(end_date) if end_date else None,
-                    location=location,
-                    link=link,
-                    source_platform="Unstop",
-                    is_offline=bool(is_offline),
-                    image_url=logo,
-                ))
+            for item in self._items_from_payload(payload):
+                if item.link not in seen:
+                    seen.add(item.link)
+                    items.append(item)
         return items
 
-    def _enrich_missing_dates(self, items: list[HackathonItem], context: BrowserContext) -> list[HackathonItem]:
-        """Visit detail pages for items missing dates to extract registration end date."""
-        enriched = []
-        for item in items:
-            if item.date:
-                enriched.append(item)
+    def _items_from_payload(self, payload) -> list[HackathonItem]:
+        items = []
+        for opp in self._opportunities(payload):
+            title = opp.get("title", "").strip()
+            if not title:
+                continue
+
+            link = f"https://unstop.com/hackathon/{opp.get('public_url', '')}" if opp.get("public_url") else ""
+            if not link or link == "https://unstop.com/hackathon/":
                 continue
 
-            # Try visiting the detail page
-            try:
-                detail = context.new_page()
-                detail.goto(item.link, wait_until="domcontentloaded", timeout=15000)
-                detail.wait_for_timeout(3000)
-
-                body_text = detail.inner_text("body")
-                found_date = extract_reg_end_date_from_text(body_text)
-
-                if not found_date:
-                    found_date = search_date_on_web(item.title)
-
-                if found_date:
-                    enriched.append(HackathonItem(
-                        title=item.title,
-                        organizer=item.organizer,
-                        date=found_date,
-                        location=item.location,
-                        link=item.link,
-                        source_platform=item.source_platform,
-                        is_offline=item.is_offline,
-                        image_url=item.image_url,
-                    ))
-                else:
-                    self.logger.warning(f"No date found for: {item.title}")
-                    enriched.append(item)
-
-                detail.close()
-            except Exception as e:
-                self.logger.warning(f"Detail page failed for {item.title}: {e}")
-                enriched.append(item)
-
-        return enriched
+            # Try multiple API fields for registration end date
+            end_date = None
+            regn_req = opp.get("regnRequirements")
+            if isinstance(regn_req, dict):
+                end_date = regn_req.get("end_regn_dt")
+            if not end_date:
+                end_date = opp.get("end_date")
+            if not end_date:
+                end_date = opp.get("deadline")
+            if not end_date:
+                # Check nested dates
+                dates = opp.get("dates", {})
+                if isinstance(dates, dict):
+                    end_date = dates.get("end_date") or dates.get("registration_end")
+
+            if end_date and "T" in str(end_date):
+                end_date = str(end_date).split("T")[0]
+
+            org = ""
+            org_data = opp.get("organisation")
+            if isinstance(org_data, dict):
+                org = org_data.get("name", "")
+
+            location = opp.get("city", "") or ""
+            is_offline = False
+            eligible = opp.get("oppstatus_eligible_for")
+            if isinstance(eligible, dict):
+                is_offline = eligible.get("is_offline", False)
+
+            logo = opp.get("logoUrl2") or opp.get("logoUrl") or ""
+
+            items.append(HackathonItem(
+                title=title,
+                organizer=org,
+                date=str(end_date) if end_date else None,
+                location=location,
+                link=link,
+                source_platform="Unstop",
+                is_offline=bool(is_offline),
+                image_url=logo,
+            ))
+        return items
 
     def _fallback_dom(self, page: Page) -> list[HackathonItem]:
         items = []
-        cards = page.query_selector_all("a[href*='/hackathon/']")
+        cards = page.query_selector_all(self.CARD_SELECTOR)
         seen = set()
         for card in cards:
             href = card.get_attribute("href") or ""
@@ -1,9 +1,11 @@
 import os
 import re
+import time
 import logging
+import threading
+import importlib.util
 from datetime import datetime, date, timedelta
-import dateparser
-from dateparser.search import search_dates
+import date_parser
 from duckduckgo_search import DDGS
 from supabase import create_client
 from dotenv import load_dotenv
@@ -11,6 +13,8 @@ from dotenv import load_dotenv
 load_dotenv()
 SUPABASE_URL = os.environ.get("SUPABASE_URL")
 SUPABASE_KEY = os.environ.get("SUPABASE_KEY")
+WEB_SEARCH_URL = "https://duckduckgo.com"
+CACHE_DIR = os.environ.get("SCRAPER_CACHE_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
 
 
 def get_env_bool(key, default=False):
@@ -33,6 +37,25 @@ def get_env_int(key, default=None, min_value=None):
         return default
 
 
+def get_env_float(key, default=None, min_value=None):
+    value = os.environ.get(key)
+    if value is None:
+        return default
+    try:
+        parsed = float(value)
+        if min_value is not None and parsed < min_value:
+            return min_value
+        return parsed
+    except ValueError:
+        return default
+
+
+def get_cache_dir(name):
+    path = os.path.join(CACHE_DIR, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
 def setup_logging(name):
     logging.basicConfig(
         level=logging.INFO,
@@ -66,19 +89,13 @@ def parse_date_flexible(value):
         if not text:
             return None
         try:
-            results = search_dates(
-                text,
-                settings={"PREFER_DATES_FROM": "future", "RETURN_AS_TIMEZONE_AWARE": False},
-            )
+            results = date_parser.search(text)
             if results:
                 return results[-1][1].strftime("%Y-%m-%d")
         except Exception:
             pass
         try:
-            dt = dateparser.parse(
-                text,
-                settings={"PREFER_DATES_FROM": "future", "RETURN_AS_TIMEZONE_AWARE": False},
-            )
+            dt = date_parser.parse(text)
             if dt:
                 return dt.strftime("%Y-%m-%d")
         except Exception:
@@ -86,71 +103,143 @@ def parse_date_flexible(value):
     return None
 
 
+_COUNTDOWN_PATTERN = (
+    r"\b(?P<cd_days>\d{1,3})\s*d(?:ays?)?\b[^0-9]{0,20}?(?P<cd_hours>\d{1,2})?\s*h(?:ours?|rs?)?\b"
+    r"[^0-9]{0,20}?(?P<cd_minutes>\d{1,2})?\s*m"
+)
+
+_STRONG_PATTERNS = [
+    r"(?:registration|application|submission)s?\s*(?:ends?|closes?|deadline)\s*(?:on|is|at)?\s*[:\-]?\s*(?P<s0>[A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4})",
+    r"(?:registration|application|submission)s?\s*(?:ends?|closes?|deadline)\s*(?:on|is|at)?\s*[:\-]?\s*(?P<s1>\d{1,2}[/\-]\d{1,2}[/\-]\d{4})",
+    r"deadline\s*[:\-]?\s*(?P<s2>[A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4})",
+]
+
+# Listed in priority order; matched longest-first so "submission deadline" wins over "deadline"
+DEADLINE_KEYWORDS = [
+    "registration ends", "registration end", "registration closes",
+    "closes on", "closes in", "deadline", "submission deadline",
+    "last date", "apply by", "applications close", "ends on",
+]
+_KEYWORD_RANK = {k: i for i, k in enumerate(DEADLINE_KEYWORDS)}
+
+# One alternation, one pass: countdowns, then strong phrases, then bare keywords
+_DEADLINE_RE = re.compile(
+    "|".join(
+        [f"(?P<countdown>{_COUNTDOWN_PATTERN})"]
+        + [f"(?:{p})" for p in _STRONG_PATTERNS]
+        + ["(?P<keyword>" + "|".join(
+            re.escape(k).replace(r"\ ", r"\s+") for k in sorted(DEADLINE_KEYWORDS, key=len, reverse=True)
+        ) + ")"]
+    ),
+    re.IGNORECASE,
+)
+
+# Cheap check that a snippet is worth handing to dateparser at all
+_DATE_TOKEN_RE = re.compile(
+    r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b"
+    r"|\b(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*day\b"
+    r"|\b(?:today|tomorrow|tonight)\b"
+    r"|\d{1,4}[/\-.]\d{1,2}|\b\d{4}\b",
+    re.IGNORECASE,
+)
+
+_SNIPPET_LENGTH = 150
+DETAIL_TEXT_LIMIT = get_env_int("DETAIL_TEXT_LIMIT", 8000, min_value=1000)
+
+
+def _find_deadline_candidates(normalized):
+    """Scan the text once and return ranked ``(rank, position, kind, value)`` candidates."""
+    candidates = []
+    seen_keywords = set()
+    for match in _DEADLINE_RE.finditer(normalized):
+        if match.group("countdown"):
+            candidates.append((0, match.start(), "countdown", match))
+            continue
+        for i in range(len(_STRONG_PATTERNS)):
+            value = match.group(f"s{i}")
+            if value:
+                candidates.append((1 + i, match.start(), "strong", (value, match.start())))
+                break
+        else:
+            keyword = " ".join(match.group("keyword").lower().split())
+            if keyword not in seen_keywords:
+                seen_keywords.add(keyword)
+                candidates.append((10 + _KEYWORD_RANK[keyword], match.start(), "keyword", match.start()))
+    candidates.sort(key=lambda c: (c[0], c[1]))
+    return candidates
+
+
+def bound_text(text, limit=DETAIL_TEXT_LIMIT, window=300):
+    """Cut a long page body down to the regions around deadline phrases so
+    extraction works on a few kilobytes instead of the whole page."""
+    if not text:
+        return ""
+    text = str(text)
+    if len(text) <= limit:
+        return text
+
+    parts = []
+    total = 0
+    last_end = 0
+    for match in _DEADLINE_RE.finditer(text):
+        start = max(match.start() - 50, last_end)
+        end = match.start() + window
+        if end <= last_end:
+            continue
+        parts.append(text[start:end])
+        total += end - start
+        last_end = end
+        if total >= limit:
+            break
+    return " ".join(parts)[:limit]
+
+
+def _search_last_date(text):
+    try:
+        results = date_parser.search(text)
+        if results:
+            return results[-1][1].strftime("%Y-%m-%d")
+    except Exception:
+        pass
+    return None
+
+
 def extract_reg_end_date_from_text(text):
     if not text:
         return None
 
-    normalized = " ".join(str(text).split())
-    lowered = normalized.lower()
+    normalized = " ".join(bound_text(text).split())
+    candidates = _find_deadline_candidates(normalized)
 
-    countdown_match = re.search(
-        r"(\d+)\s*d(?:ays?)?[^0-9]*(\d+)?\s*h(?:ours?)?[^0-9]*(\d+)?\s*m",
-        lowered,
-    )
-    if countdown_match:
-        days = int(countdown_match.group(1) or 0)
-        hours = int(countdown_match.group(2) or 0)
-        minutes = int(countdown_match.group(3) or 0)
-        future_date = datetime.now() + timedelta(days=days, hours=hours, minutes=minutes)
-        return future_date.strftime("%Y-%m-%d")
-
-    strong_patterns = [
-        r"(?:registration|application|submission)s?\s*(?:ends?|closes?|deadline)\s*(?:on|is|at)?\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4})",
-        r"(?:registration|application|submission)s?\s*(?:ends?|closes?|deadline)\s*(?:on|is|at)?\s*[:\-]?\s*(\d{1,2}[/\-]\d{1,2}[/\-]\d{4})",
-        r"deadline\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4})",
-    ]
-
-    for pattern in strong_patterns:
-        match = re.search(pattern, lowered)
-        if match:
+    snippet = None
+    for _, _, kind, value in candidates:
+        if kind == "countdown":
+            days = int(value.group("cd_days") or 0)
+            hours = int(value.group("cd_hours") or 0)
+            minutes = int(value.group("cd_minutes") or 0)
+            future_date = datetime.now() + timedelta(days=days, hours=hours, minutes=minutes)
+            return future_date.strftime("%Y-%m-%d")
+        if kind == "strong":
+            date_text, start = value
             try:
-                dt = dateparser.parse(match.group(1), settings={"PREFER_DATES_FROM": "future"})
+                dt = date_parser.parse(date_text)
                 if dt:
                     return dt.strftime("%Y-%m-%d")
             except Exception:
                 pass
+        else:
+            start = value
+        if snippet is None:
+            window = normalized[start : start + _SNIPPET_LENGTH]
+            if _DATE_TOKEN_RE.search(window):
+                snippet = window
 
-    keywords = [
-        "registration ends", "registration end", "registration closes",
-        "closes on", "closes in", "deadline", "submission deadline",
-        "last date", "apply by", "applications close", "ends on",
-    ]
-
-    for key in keywords:
-        if key in lowered:
-            start = lowered.index(key)
-            snippet = normalized[start : start + 150]
-            try:
-                results = search_dates(
-                    snippet,
-                    settings={"PREFER_DATES_FROM": "future", "RETURN_AS_TIMEZONE_AWARE": False},
-                )
-                if results:
-                    return results[-1][1].strftime("%Y-%m-%d")
-            except Exception:
-                pass
-
+    # The expensive search runs at most once: on the best keyword snippet,
+    # or on the whole text when it is short and had no usable keyword.
+    if snippet is not None:
+        return _search_last_date(snippet)
     if len(normalized) < 1000:
-        try:
-            results = search_dates(
-                normalized,
-                settings={"PREFER_DATES_FROM": "future", "RETURN_AS_TIMEZONE_AWARE": False},
-            )
-            if results:
-                return results[-1][1].strftime("%Y-%m-%d")
-        except Exception:
-            pass
-
+        return _search_last_date(normalized)
     return None
 
 
@@ -160,19 +249,106 @@ def search_date_on_web(query_title):
     query = f"{query_title} hackathon registration deadline 2026"
     _logger = logging.getLogger("utils")
     _logger.info(f"Web search fallback: {query}")
+    from throttle import CircuitOpenError, get_throttle
+    throttle = get_throttle()
+    try:
+        throttle.acquire(WEB_SEARCH_URL)
+    except CircuitOpenError as e:
+        _logger.info(f"Web search skipped: {e}")
+        return None
     try:
         results = DDGS().text(query, max_results=3)
+        throttle.record(WEB_SEARCH_URL)
         for res in results:
             snippet = res.get("body", "") + " " + res.get("title", "")
             date_found = extract_reg_end_date_from_text(snippet)
             if date_found:
                 return date_found
     except Exception as e:
+        throttle.record(WEB_SEARCH_URL, error=True)
         _logger.warning(f"Web search failed: {e}")
     return None
 
 
-def get_supabase_client():
+_supabase_client = None
+_supabase_http = None
+_supabase_checked_at = 0.0
+_supabase_lock = threading.Lock()
+_db_logger = logging.getLogger("supabase_client")
+
+
+def _supabase_options():
+    """Client options carrying one pooled keep-alive httpx session (HTTP/2
+    when ``h2`` is installed). None when this supabase-py cannot take one."""
+    try:
+        import httpx
+        from supabase import ClientOptions
+    except ImportError:
+        return None, None
+    http2 = get_env_bool("SUPABASE_HTTP2", True) and importlib.util.find_spec("h2") is not None
+    http_client = httpx.Client(
+        http2=http2,
+        timeout=get_env_float("SUPABASE_TIMEOUT_SECONDS", 30.0, min_value=1.0),
+        limits=httpx.Limits(
+            max_connections=get_env_int("SUPABASE_MAX_CONNECTIONS", 10, min_value=1),
+            max_keepalive_connections=get_env_int("SUPABASE_MAX_CONNECTIONS", 10, min_value=1),
+        ),
+    )
+    try:
+        return ClientOptions(httpx_client=http_client), http_client
+    except TypeError:
+        http_client.close()
+        return None, None
+
+
+def _create_supabase_client():
     if not SUPABASE_URL or not SUPABASE_KEY:
         raise ValueError("Missing Supabase environment variables.")
-    return create_client(SUPABASE_URL, SUPABASE_KEY)
+    options, http_client = _supabase_options()
+    if options is None:
+        return create_client(SUPABASE_URL, SUPABASE_KEY), None
+    return create_client(SUPABASE_URL, SUPABASE_KEY, options=options), http_client
+
+
+def _supabase_healthy(client) -> bool:
+    try:
+        client.table("hackathons").select("id").limit(1).execute()
+        return True
+    except Exception as e:
+        _db_logger.warning(f"Supabase health check failed: {e}")
+        return False
+
+
+def reset_supabase_client():
+    """Drop the shared client (and its connection pool); the next call reconnects."""
+    global _supabase_client, _supabase_http
+    with _supabase_lock:
+        if _supabase_http is not None:
+            try:
+                _supabase_http.close()
+            except Exception:
+                pass
+        _supabase_client = None
+        _supabase_http = None
+
+
+def get_supabase_client():
+    """Process-wide Supabase client. Every DB call in the pipeline shares it and
+    its connection pool, so setup cost does not grow with the number of batches.
+    Once every SUPABASE_HEALTHCHECK_SECONDS the connection is probed and
+    rebuilt if it has gone bad (long-running scheduler)."""
+    global _supabase_client, _supabase_http, _supabase_checked_at
+    interval = get_env_int("SUPABASE_HEALTHCHECK_SECONDS", 300, min_value=0)
+    with _supabase_lock:
+        now = time.monotonic()
+        if _supabase_client is not None and interval and now - _supabase_checked_at > interval:
+            _supabase_checked_at = now
+            if not _supabase_healthy(_supabase_client):
+                _db_logger.info("Reconnecting Supabase client")
+                if _supabase_http is not None:
+                    _supabase_http.close()
+                _supabase_client = None
+        if _supabase_client is None:
+            _supabase_client, _supabase_http = _create_supabase_client()
+            _supabase_checked_at = now
+        return _supabase_client
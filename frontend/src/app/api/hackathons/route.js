@@ -0,0 +1,14 @@
+import { NextResponse } from 'next/server';
+import { fetchHackathons, parseQueryParams } from '@/lib/hackathonQueries';
+
+// GET /api/hackathons?filter=&urgent=1&q=&cursor= -> one page of list rows
+export async function GET(request) {
+  const { hackathons, nextCursor, error } = await fetchHackathons(parseQueryParams(request.nextUrl.searchParams));
+
+  if (error) {
+    console.error("Error fetching hackathons:", error);
+    return NextResponse.json({ error: error.message }, { status: 500 });
+  }
+
+  return NextResponse.json({ hackathons, nextCursor });
+}
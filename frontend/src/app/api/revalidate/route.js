@@ -0,0 +1,14 @@
+import { NextResponse } from 'next/server';
+import { revalidateTag } from 'next/cache';
+import { SNAPSHOT_TAG } from '@/lib/snapshot';
+
+// Called by the backend after it publishes a new snapshot
+export async function POST(request) {
+  const secret = process.env.REVALIDATE_SECRET;
+  if (!secret || request.headers.get('x-revalidate-secret') !== secret) {
+    return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+  }
+
+  revalidateTag(SNAPSHOT_TAG);
+  return NextResponse.json({ revalidated: true, now: Date.now() });
+}
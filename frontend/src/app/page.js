@@ -1,16 +1,12 @@
-import { supabase } from '@/lib/supabaseClient';
+import { fetchHackathons, parseQueryParams } from '@/lib/hackathonQueries';
 import Navbar from '@/components/Navbar';
 import HackathonList from '@/components/HackathonList';
 
-// Force dynamic rendering so we see new DB entries on refresh without rebuilding
-export const dynamic = 'force-dynamic';
-
-export default async function Home() {
-  // 1. Fetch data from Supabase
-  const { data: hackathons, error } = await supabase
-    .from('hackathons')
-    .select('*')
-    .order('reg_end_date', { ascending: true });
+export default async function Home({ searchParams }) {
+  // 1. Fetch the first page matching the URL's filters: from the cached
+  //    snapshot when one is published, otherwise straight from Supabase
+  const params = parseQueryParams(searchParams);
+  const { hackathons, nextCursor, error } = await fetchHackathons({ ...params, cursor: '' });
 
   // 2. Handle Errors
   if (error) {
@@ -36,8 +32,15 @@ export default async function Home() {
   // 3. Render Page
   return (
     <main className="min-h-screen bg-[#0f172a] text-slate-100 font-sans selection:bg-blue-500/30">
-      <Navbar />
-      <HackathonList initialHackathons={hackathons || []} />
+      <Navbar searchQuery={params.q} />
+      <HackathonList
+        initialHackathons={hackathons}
+        initialCursor={nextCursor}
+        activeFilter={params.filter}
+        showUrgency={params.urgent}
+        activeCity={params.city}
+        searchQuery={params.q}
+      />
     </main>
   );
 }
\ No newline at end of file
@@ -1,6 +1,7 @@
 import React from 'react';
+import { CITY_FILTERS } from '@/lib/cities';
 
-const FilterBar = ({ activeFilter, onFilterChange, showUrgency, onUrgencyChange }) => {
+const FilterBar = ({ activeFilter, onFilterChange, showUrgency, onUrgencyChange, activeCity, onCityChange }) => {
     const filters = [
         { id: 'all', label: 'All Events' },
         { id: 'Devpost', label: 'Devpost' },
@@ -45,20 +46,34 @@ const FilterBar = ({ activeFilter, onFilterChange, showUrgency, onUrgencyChange
                 ))}
             </div>
 
-            <div className="flex items-center gap-3 bg-slate-800 p-1.5 rounded-full border border-slate-700">
-                <span className={`text-xs font-medium px-2 ${showUrgency ? 'text-orange-400' : 'text-slate-400'}`}>
-                    🔥 Urgency
-                </span>
-                <button
-                    onClick={() => onUrgencyChange(!showUrgency)}
-                    className={`relative inline-flex h-6 w-11 items-center rounded-full transition-colors focus:outline-none focus:ring-2 focus:ring-blue-500 focus:ring-offset-2 focus:ring-offset-slate-900 ${showUrgency ? 'bg-orange-500' : 'bg-slate-600'
-                        }`}
+            <div className="flex items-center gap-3">
+                <select
+                    value={activeCity}
+                    onChange={(event) => onCityChange(event.target.value)}
+                    aria-label="Filter by city"
+                    className="bg-slate-800 text-slate-300 text-sm font-medium px-4 py-2 rounded-full border border-slate-700 hover:bg-slate-700 focus:outline-none focus:ring-2 focus:ring-blue-500"
                 >
-                    <span
-                        className={`${showUrgency ? 'translate-x-6' : 'translate-x-1'
-                            } inline-block h-4 w-4 transform rounded-full bg-white transition-transform`}
-                    />
-                </button>
+                    <option value="">All Locations</option>
+                    {CITY_FILTERS.map((city) => (
+                        <option key={city} value={city}>{city}</option>
+                    ))}
+                </select>
+
+                <div className="flex items-center gap-3 bg-slate-800 p-1.5 rounded-full border border-slate-700">
+                    <span className={`text-xs font-medium px-2 ${showUrgency ? 'text-orange-400' : 'text-slate-400'}`}>
+                        🔥 Urgency
+                    </span>
+                    <button
+                        onClick={() => onUrgencyChange(!showUrgency)}
+                        className={`relative inline-flex h-6 w-11 items-center rounded-full transition-colors focus:outline-none focus:ring-2 focus:ring-blue-500 focus:ring-offset-2 focus:ring-offset-slate-900 ${showUrgency ? 'bg-orange-500' : 'bg-slate-600'
+                            }`}
+                    >
+                        <span
+                            className={`${showUrgency ? 'translate-x-6' : 'translate-x-1'
+                                } inline-block h-4 w-4 transform rounded-full bg-white transition-transform`}
+                        />
+                    </button>
+                </div>
             </div>
         </div>
     );
@@ -12,6 +12,9 @@ const HackathonCard = ({ hackathon }) => {
 
   const isClosed = hackathon.is_closed;
 
+  // Pre-sized thumbnail when the backend generated one, original image otherwise
+  const imageSrc = hackathon.thumbnail_url || hackathon.image_url;
+
   // Badge Color Logic
   const getSourceBadgeColor = (source) => {
     switch (source?.toLowerCase()) {
@@ -32,15 +35,17 @@ const HackathonCard = ({ hackathon }) => {
     >
       {/* Image Section */}
       <div className="relative h-48 w-full overflow-hidden bg-slate-900 flex items-center justify-center">
-        {hackathon.image_url ? (
+        {imageSrc ? (
           <>
             <div
               className="absolute inset-0 bg-cover bg-center opacity-30 blur-xl scale-110"
-              style={{ backgroundImage: `url(${hackathon.image_url})` }}
+              style={{ backgroundImage: `url(${imageSrc})` }}
             ></div>
             <img
-              src={hackathon.image_url}
+              src={imageSrc}
               alt={hackathon.title}
+              loading="lazy"
+              decoding="async"
               className="relative h-full w-full object-contain p-2 transition-transform duration-500 hover:scale-105"
             />
           </>
@@ -1,45 +1,53 @@
 'use client';
 
-import React, { useState, useMemo } from 'react';
+import React, { useState, useEffect, useTransition } from 'react';
+import { usePathname, useRouter } from 'next/navigation';
 import FilterBar from './FilterBar';
 import HackathonCard from './HackathonCard';
+import { toSearchParams } from '@/lib/queryParams';
+import { useWindowedGrid } from '@/lib/useWindowedGrid';
 
-const HackathonList = ({ initialHackathons }) => {
-    const [activeFilter, setActiveFilter] = useState('all');
-    const [showUrgency, setShowUrgency] = useState(false);
-    const [searchQuery, setSearchQuery] = useState('');
+const HackathonList = ({ initialHackathons, initialCursor, activeFilter, showUrgency, activeCity, searchQuery }) => {
+    const router = useRouter();
+    const pathname = usePathname();
+    const [isPending, startTransition] = useTransition();
+    const [hackathons, setHackathons] = useState(initialHackathons || []);
+    const [nextCursor, setNextCursor] = useState(initialCursor);
+    const [loadingMore, setLoadingMore] = useState(false);
+    // Only the cards near the viewport are mounted, however many pages are loaded
+    const windowed = useWindowedGrid(hackathons.length);
 
-    const filteredHackathons = useMemo(() => {
-        if (!initialHackathons) return [];
+    // A new server render (filters changed) replaces the pages loaded so far
+    useEffect(() => {
+        setHackathons(initialHackathons || []);
+        setNextCursor(initialCursor);
+    }, [initialHackathons, initialCursor]);
 
-        return initialHackathons.filter((hackathon) => {
-            // 1. Filter by Platform/Type
-            if (activeFilter !== 'all') {
-                const platformMatch = hackathon.source?.toLowerCase() === activeFilter.toLowerCase();
-                const modeMatch = hackathon.mode?.toLowerCase() === activeFilter.toLowerCase();
-
-                if (!platformMatch && !modeMatch) return false;
-            }
-
-            // 2. Filter by Urgency (Closing soon - e.g., within 7 days)
-            if (showUrgency) {
-                if (!hackathon.reg_end_date) return false;
-                const daysLeft = (new Date(hackathon.reg_end_date) - new Date()) / (1000 * 60 * 60 * 24);
-                if (daysLeft < 0 || daysLeft > 7) return false;
-            }
-
-            // 3. Search Query
-            if (searchQuery) {
-                const query = searchQuery.toLowerCase();
-                const titleMatch = hackathon.title?.toLowerCase().includes(query);
-                const descMatch = hackathon.description?.toLowerCase().includes(query);
-                const themesMatch = hackathon.themes?.toLowerCase().includes(query);
-                if (!titleMatch && !descMatch && !themesMatch) return false;
-            }
-
-            return true;
+    // Filters live in the URL so the server can push them down to the query
+    const updateQuery = (changes) => {
+        const params = toSearchParams({ filter: activeFilter, urgent: showUrgency, city: activeCity, q: searchQuery, ...changes });
+        const query = params.toString();
+        startTransition(() => {
+            router.replace(query ? `${pathname}?${query}` : pathname, { scroll: false });
         });
-    }, [initialHackathons, activeFilter, showUrgency, searchQuery]);
+    };
+
+    const loadMore = async () => {
+        if (!nextCursor || loadingMore) return;
+        setLoadingMore(true);
+        try {
+            const params = toSearchParams({ filter: activeFilter, urgent: showUrgency, city: activeCity, q: searchQuery, cursor: nextCursor });
+            const response = await fetch(`/api/hackathons?${params}`);
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            const page = await response.json();
+            setHackathons((current) => [...current, ...page.hackathons]);
+            setNextCursor(page.nextCursor);
+        } catch (error) {
+            console.error("Error loading more hackathons:", error);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
 
     return (
         <div className="min-h-screen bg-[#0f172a]">
@@ -47,12 +55,14 @@ const HackathonList = ({ initialHackathons }) => {
 
                 <FilterBar
                     activeFilter={activeFilter}
-                    onFilterChange={setActiveFilter}
+                    onFilterChange={(filter) => updateQuery({ filter })}
                     showUrgency={showUrgency}
-                    onUrgencyChange={setShowUrgency}
+                    onUrgencyChange={(urgent) => updateQuery({ urgent })}
+                    activeCity={activeCity}
+                    onCityChange={(city) => updateQuery({ city })}
                 />
 
-                {(!filteredHackathons || filteredHackathons.length === 0) ? (
+                {hackathons.length === 0 ? (
                     <div className="flex flex-col items-center justify-center py-20 text-center text-slate-400">
                         <div className="w-24 h-24 bg-slate-800 rounded-full flex items-center justify-center mb-6">
                             <span className="text-4xl">🔭</span>
@@ -63,11 +73,33 @@ const HackathonList = ({ initialHackathons }) => {
                         </p>
                     </div>
                 ) : (
-                    <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6">
-                        {filteredHackathons.map((hackathon) => (
-                            <HackathonCard key={hackathon.id} hackathon={hackathon} />
-                        ))}
-                    </div>
+                    <>
+                        <div
+                            ref={windowed.containerRef}
+                            style={{ paddingTop: windowed.paddingTop, paddingBottom: windowed.paddingBottom }}
+                        >
+                            <div
+                                ref={windowed.gridRef}
+                                className={`grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6 transition-opacity ${isPending ? 'opacity-60' : ''}`}
+                            >
+                                {hackathons.slice(windowed.start, windowed.end).map((hackathon) => (
+                                    <HackathonCard key={hackathon.id} hackathon={hackathon} />
+                                ))}
+                            </div>
+                        </div>
+
+                        {nextCursor && (
+                            <div className="flex justify-center mt-10">
+                                <button
+                                    onClick={loadMore}
+                                    disabled={loadingMore}
+                                    className="px-6 py-2.5 rounded-full text-sm font-medium border bg-slate-800 text-slate-300 border-slate-700 hover:bg-slate-700 hover:text-white transition-colors disabled:opacity-50"
+                                >
+                                    {loadingMore ? 'Loading...' : 'Load more'}
+                                </button>
+                            </div>
+                        )}
+                    </>
                 )}
             </div>
         </div>
@@ -1,6 +1,7 @@
 import React from 'react';
+import SearchInput from './SearchInput';
 
-const Navbar = () => {
+const Navbar = ({ searchQuery = '' }) => {
     return (
         <nav className="border-b border-slate-800 bg-slate-900/50 backdrop-blur-xl sticky top-0 z-50">
             <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
@@ -20,21 +21,7 @@ const Navbar = () => {
 
                     {/* Search Bar */}
                     <div className="hidden md:flex flex-1 max-w-xl mx-8">
-                        <div className="relative w-full group">
-                            <div className="absolute inset-y-0 left-0 pl-3 flex items-center pointer-events-none">
-                                <svg className="h-5 w-5 text-slate-500 group-focus-within:text-blue-500 transition-colors" fill="none" viewBox="0 0 24 24" stroke="currentColor">
-                                    <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M21 21l-6-6m2-5a7 7 0 11-14 0 7 7 0 0114 0z" />
-                                </svg>
-                            </div>
-                            <input
-                                type="text"
-                                className="block w-full pl-10 pr-3 py-2 border border-slate-700 rounded-lg leading-5 bg-slate-800 text-slate-300 placeholder-slate-500 focus:outline-none focus:bg-slate-900 focus:ring-1 focus:ring-blue-500 focus:border-blue-500 sm:text-sm transition-all"
-                                placeholder="Search by stack, theme, or name (e.g. 'Web3', 'AI', 'Global')..."
-                            />
-                            <div className="absolute inset-y-0 right-0 pr-3 flex items-center">
-                                {/* Cmd+K removed */}
-                            </div>
-                        </div>
+                        <SearchInput initialQuery={searchQuery} />
                     </div>
 
                     {/* Right Section */}
@@ -0,0 +1,72 @@
+'use client';
+
+import React, { useState, useEffect, useRef, useTransition } from 'react';
+import { usePathname, useRouter, useSearchParams } from 'next/navigation';
+
+// Idle time after the last keystroke before the search is sent
+const SEARCH_DEBOUNCE_MS = 300;
+
+const SearchInput = ({ initialQuery = '' }) => {
+    const router = useRouter();
+    const pathname = usePathname();
+    const searchParams = useSearchParams();
+    const [value, setValue] = useState(initialQuery);
+    const [, startTransition] = useTransition();
+    const timerRef = useRef(null);
+
+    useEffect(() => {
+        setValue(initialQuery);
+    }, [initialQuery]);
+
+    // Search runs server-side: updating `?q=` makes the page re-query
+    const applyQuery = (rawQuery) => {
+        clearTimeout(timerRef.current);
+        const query = rawQuery.trim();
+        if (query === (searchParams.get('q') || '').trim()) return;
+        const params = new URLSearchParams(searchParams.toString());
+        if (query) {
+            params.set('q', query);
+        } else {
+            params.delete('q');
+        }
+        params.delete('cursor');
+        const search = params.toString();
+        // A transition keeps the input responsive while the new results render
+        startTransition(() => {
+            router.replace(search ? `${pathname}?${search}` : pathname, { scroll: false });
+        });
+    };
+
+    useEffect(() => () => clearTimeout(timerRef.current), []);
+
+    const handleChange = (event) => {
+        const nextValue = event.target.value;
+        setValue(nextValue);
+        clearTimeout(timerRef.current);
+        timerRef.current = setTimeout(() => applyQuery(nextValue), SEARCH_DEBOUNCE_MS);
+    };
+
+    const handleSubmit = (event) => {
+        event.preventDefault();
+        applyQuery(value);
+    };
+
+    return (
+        <form onSubmit={handleSubmit} className="relative w-full group" role="search">
+            <div className="absolute inset-y-0 left-0 pl-3 flex items-center pointer-events-none">
+                <svg className="h-5 w-5 text-slate-500 group-focus-within:text-blue-500 transition-colors" fill="none" viewBox="0 0 24 24" stroke="currentColor">
+                    <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M21 21l-6-6m2-5a7 7 0 11-14 0 7 7 0 0114 0z" />
+                </svg>
+            </div>
+            <input
+                type="search"
+                value={value}
+                onChange={handleChange}
+                className="block w-full pl-10 pr-3 py-2 border border-slate-700 rounded-lg leading-5 bg-slate-800 text-slate-300 placeholder-slate-500 focus:outline-none focus:bg-slate-900 focus:ring-1 focus:ring-blue-500 focus:border-blue-500 sm:text-sm transition-all"
+                placeholder="Search by stack, theme, or name (e.g. 'Web3', 'AI', 'Global')..."
+            />
+        </form>
+    );
+};
+
+export default SearchInput;
@@ -0,0 +1,12 @@
+// Cities offered in the location filter; names must match the keys of
+// backend/data/gazetteer.json, which the backend stores in `cities`.
+export const CITY_FILTERS = [
+  'Chennai',
+  'Bengaluru',
+  'Hyderabad',
+  'Mumbai',
+  'Delhi NCR',
+  'Pune',
+  'Kolkata',
+  'Coimbatore',
+];
@@ -0,0 +1,141 @@
+import { supabase } from '@/lib/supabaseClient';
+import { loadShard, snapshotsEnabled } from '@/lib/snapshot';
+
+export { parseQueryParams, toSearchParams } from '@/lib/queryParams';
+
+export const PAGE_SIZE = 24;
+export const URGENCY_DAYS = 7;
+
+// Only the columns HackathonCard reads (keep SNAPSHOT_COLUMNS in backend/snapshots.py in step)
+export const LIST_COLUMNS = 'id, title, organizer, description, themes, mode, cities, reg_end_date, is_closed, link, image_url, thumbnail_url, source';
+
+// Filter ids that map to the `mode` column; everything else is a platform (`source`)
+const MODE_FILTERS = {
+  online: 'Online',
+  'in-person': 'Offline',
+};
+
+const toIsoDate = (date) => date.toISOString().slice(0, 10);
+
+// Keyset cursor over (reg_end_date, id), matching the list's sort order
+export const encodeCursor = (row) => `${row.reg_end_date}_${row.id}`;
+
+function decodeCursor(cursor) {
+  const split = cursor.indexOf('_');
+  if (split <= 0) return null;
+  const date = cursor.slice(0, split);
+  const id = cursor.slice(split + 1);
+  if (!/^\d{4}-\d{2}-\d{2}$/.test(date) || !/^[\w-]+$/.test(id)) return null;
+  return { date, id };
+}
+
+function resolveFilters({ filter, urgent, city }) {
+  const mode = MODE_FILTERS[filter.toLowerCase()] || null;
+  const source = !mode && filter !== 'all' ? filter : null;
+  let dateFrom = null;
+  let dateTo = null;
+  if (urgent) {
+    const today = new Date();
+    dateFrom = toIsoDate(today);
+    dateTo = toIsoDate(new Date(today.getTime() + URGENCY_DAYS * 24 * 60 * 60 * 1000));
+  }
+  return { mode, source, city: city || null, dateFrom, dateTo };
+}
+
+function toPage(rows, limit, cursorFor) {
+  const hasMore = rows.length > limit;
+  const hackathons = hasMore ? rows.slice(0, limit) : rows;
+  return {
+    hackathons,
+    nextCursor: hasMore ? cursorFor(hackathons) : null,
+    error: null,
+  };
+}
+
+// Ranked full-text search (public.search_hackathons); relevance order
+// rules out keyset pagination, so its cursor is an offset ("o:<n>").
+async function searchHackathons(q, filters, cursor, limit) {
+  const offset = cursor.startsWith('o:') ? Math.max(parseInt(cursor.slice(2), 10) || 0, 0) : 0;
+  const { data, error } = await supabase
+    .rpc('search_hackathons', {
+      search_query: q,
+      filter_source: filters.source,
+      filter_mode: filters.mode,
+      filter_city: filters.city,
+      date_from: filters.dateFrom,
+      date_to: filters.dateTo,
+      result_limit: limit + 1,
+      result_offset: offset,
+    })
+    .select(LIST_COLUMNS);
+
+  if (error) {
+    return { hackathons: [], nextCursor: null, error };
+  }
+  return toPage(data || [], limit, () => `o:${offset + limit}`);
+}
+
+// Same filters and keyset cursor as the DB query, applied to a snapshot shard
+function pageFromSnapshot(rows, filters, cursor, limit) {
+  const matching = rows.filter((row) => (
+    (!filters.mode || row.mode === filters.mode)
+    && (!filters.source || row.source === filters.source)
+    && (!filters.city || (row.cities || []).includes(filters.city))
+    && (!filters.dateFrom || row.reg_end_date >= filters.dateFrom)
+    && (!filters.dateTo || row.reg_end_date <= filters.dateTo)
+  ));
+
+  let start = 0;
+  const position = cursor ? decodeCursor(cursor) : null;
+  if (position) {
+    const index = matching.findIndex((row) => encodeCursor(row) === cursor);
+    start = index >= 0
+      ? index + 1
+      : matching.findIndex((row) => row.reg_end_date > position.date);
+    if (start < 0) start = matching.length;
+  }
+
+  return toPage(matching.slice(start, start + limit + 1), limit, (page) => encodeCursor(page[page.length - 1]));
+}
+
+export async function fetchHackathons({ filter = 'all', urgent = false, city = '', q = '', cursor = '', limit = PAGE_SIZE } = {}) {
+  const filters = resolveFilters({ filter, urgent, city });
+  if (q) {
+    return searchHackathons(q, filters, cursor, limit);
+  }
+
+  if (snapshotsEnabled()) {
+    try {
+      const rows = await loadShard(filters);
+      if (rows) return pageFromSnapshot(rows, filters, cursor, limit);
+    } catch (error) {
+      console.error("Snapshot unavailable, querying Supabase:", error);
+    }
+  }
+
+  let query = supabase
+    .from('hackathons')
+    .select(LIST_COLUMNS)
+    .order('reg_end_date', { ascending: true })
+    .order('id', { ascending: true })
+    .limit(limit + 1);
+
+  if (filters.mode) query = query.eq('mode', filters.mode);
+  if (filters.source) query = query.eq('source', filters.source);
+  if (filters.city) query = query.contains('cities', [filters.city]);
+  if (filters.dateFrom) query = query.gte('reg_end_date', filters.dateFrom);
+  if (filters.dateTo) query = query.lte('reg_end_date', filters.dateTo);
+
+  const position = cursor ? decodeCursor(cursor) : null;
+  if (position) {
+    query = query.or(
+      `reg_end_date.gt.${position.date},and(reg_end_date.eq.${position.date},id.gt.${position.id})`
+    );
+  }
+
+  const { data, error } = await query;
+  if (error) {
+    return { hackathons: [], nextCursor: null, error };
+  }
+  return toPage(data || [], limit, (page) => encodeCursor(page[page.length - 1]));
+}
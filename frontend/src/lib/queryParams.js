@@ -0,0 +1,25 @@
+// URL <-> list query state, shared by the server page, the API route and client components
+
+export function parseQueryParams(params) {
+  const get = (key) => {
+    const value = typeof params?.get === 'function' ? params.get(key) : params?.[key];
+    return Array.isArray(value) ? value[0] || '' : value || '';
+  };
+  return {
+    filter: get('filter') || 'all',
+    urgent: get('urgent') === '1',
+    city: get('city'),
+    q: get('q').trim(),
+    cursor: get('cursor'),
+  };
+}
+
+export function toSearchParams({ filter, urgent, city, q, cursor }) {
+  const params = new URLSearchParams();
+  if (filter && filter !== 'all') params.set('filter', filter);
+  if (urgent) params.set('urgent', '1');
+  if (city) params.set('city', city);
+  if (q) params.set('q', q);
+  if (cursor) params.set('cursor', cursor);
+  return params;
+}
@@ -0,0 +1,52 @@
+import { gunzipSync } from 'zlib';
+
+// Static JSON snapshots published by the backend (backend/snapshots.py).
+// Reads go through Next's data cache and are invalidated on publish via
+// /api/revalidate, so user traffic never reaches the database.
+export const SNAPSHOT_TAG = 'hackathons-snapshot';
+
+const SNAPSHOT_BASE_URL = process.env.SNAPSHOT_BASE_URL;
+const MANIFEST_REVALIDATE_SECONDS = 3600;
+
+export const snapshotsEnabled = () => Boolean(SNAPSHOT_BASE_URL);
+
+const shardKey = (value) => value.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '');
+
+async function fetchManifest() {
+  const response = await fetch(`${SNAPSHOT_BASE_URL}/manifest.json`, {
+    next: { revalidate: MANIFEST_REVALIDATE_SECONDS, tags: [SNAPSHOT_TAG] },
+  });
+  if (!response.ok) throw new Error(`Snapshot manifest returned HTTP ${response.status}`);
+  return response.json();
+}
+
+function decodeShard(buffer) {
+  // Hosts that send Content-Encoding: gzip have already inflated the body
+  const isGzip = buffer.length > 1 && buffer[0] === 0x1f && buffer[1] === 0x8b;
+  return JSON.parse((isGzip ? gunzipSync(buffer) : buffer).toString('utf8'));
+}
+
+// Returns the rows of the narrowest shard covering the filters, in list order
+export async function loadShard({ mode, source, city, dateFrom }) {
+  const manifest = await fetchManifest();
+
+  let key = 'all';
+  if (city) key = `city/${shardKey(city)}`;
+  else if (source) key = `platform/${shardKey(source)}`;
+  else if (mode) key = `mode/${shardKey(mode)}`;
+  else if (dateFrom) key = 'closing-soon';
+
+  const entry = manifest.shards?.[key];
+  if (!entry) {
+    // No shard for a city/platform/mode means no rows for it in this version
+    return key === 'all' ? null : [];
+  }
+
+  // Shard paths are versioned, so they can be cached until the next publish
+  const response = await fetch(`${SNAPSHOT_BASE_URL}/${entry.path}`, {
+    cache: 'force-cache',
+    next: { tags: [SNAPSHOT_TAG] },
+  });
+  if (!response.ok) throw new Error(`Snapshot shard ${key} returned HTTP ${response.status}`);
+  return decodeShard(Buffer.from(await response.arrayBuffer()));
+}
@@ -0,0 +1,92 @@
+'use client';
+
+import { useEffect, useRef, useState } from 'react';
+
+// Column counts of the list grid (grid-cols-1 md:grid-cols-2 lg:grid-cols-3
+// xl:grid-cols-4), by Tailwind's viewport breakpoints
+const COLUMN_BREAKPOINTS = [[1280, 4], [1024, 3], [768, 2]];
+// Until a row has been measured; a card is a 192px image plus its details
+const ESTIMATED_ROW_HEIGHT = 420;
+// Rows mounted above and below the viewport so fast scrolls don't flash empty space
+const OVERSCAN_ROWS = 2;
+// Items rendered on the server and before the first measurement: a full
+// first page (PAGE_SIZE in hackathonQueries), so SSR HTML has every card
+const INITIAL_ITEMS = 24;
+// The viewport width is unknown until mount, so the grid starts single-column
+const INITIAL_COLUMNS = 1;
+
+const columnsFor = (width) => {
+  for (const [minWidth, columns] of COLUMN_BREAKPOINTS) {
+    if (width >= minWidth) return columns;
+  }
+  return 1;
+};
+
+// Windowed rendering for a page-scrolled grid: only the rows near the
+// viewport are mounted, and spacers stand in for the rest. Rows are assumed
+// to be of similar height; the average height of the mounted rows is used
+// for everything off-screen.
+export function useWindowedGrid(itemCount, { gap = 24 } = {}) {
+  const containerRef = useRef(null);
+  const gridRef = useRef(null);
+  const [columns, setColumns] = useState(INITIAL_COLUMNS);
+  const [rowHeight, setRowHeight] = useState(ESTIMATED_ROW_HEIGHT);
+  const [rows, setRows] = useState({ start: 0, end: Math.ceil(INITIAL_ITEMS / INITIAL_COLUMNS) });
+
+  const totalRows = Math.ceil(itemCount / columns);
+  const hasItems = itemCount > 0;
+  const rowPitch = rowHeight + gap;
+
+  // Recompute the visible row range on scroll/resize, at most once per frame
+  useEffect(() => {
+    let frame = 0;
+    const update = () => {
+      frame = 0;
+      const container = containerRef.current;
+      if (!container) return;
+      setColumns(columnsFor(window.innerWidth));
+      const top = container.getBoundingClientRect().top;
+      const start = Math.max(0, Math.floor(-top / rowPitch) - OVERSCAN_ROWS);
+      const end = Math.ceil((window.innerHeight - top) / rowPitch) + OVERSCAN_ROWS;
+      setRows((current) => (current.start === start && current.end === end ? current : { start, end }));
+    };
+    const schedule = () => {
+      if (!frame) frame = requestAnimationFrame(update);
+    };
+    update();
+    window.addEventListener('scroll', schedule, { passive: true });
+    window.addEventListener('resize', schedule);
+    return () => {
+      window.removeEventListener('scroll', schedule);
+      window.removeEventListener('resize', schedule);
+      if (frame) cancelAnimationFrame(frame);
+    };
+  }, [rowPitch, itemCount]);
+
+  const startRow = Math.min(rows.start, Math.max(totalRows - 1, 0));
+  const endRow = Math.max(Math.min(rows.end, totalRows), startRow);
+  const renderedRows = endRow - startRow;
+
+  // Learn the real row height from the rows that are mounted
+  useEffect(() => {
+    const grid = gridRef.current;
+    if (!grid || renderedRows === 0 || typeof ResizeObserver === 'undefined') return undefined;
+    const observer = new ResizeObserver(() => {
+      const measured = (grid.offsetHeight + gap) / renderedRows - gap;
+      if (measured > 0) {
+        setRowHeight((current) => (Math.abs(current - measured) > 1 ? measured : current));
+      }
+    });
+    observer.observe(grid);
+    return () => observer.disconnect();
+  }, [renderedRows, gap, hasItems]);
+
+  return {
+    containerRef,
+    gridRef,
+    start: startRow * columns,
+    end: Math.min(endRow * columns, itemCount),
+    paddingTop: startRow * rowPitch,
+    paddingBottom: Math.max(totalRows - endRow, 0) * rowPitch,
+  };
+}
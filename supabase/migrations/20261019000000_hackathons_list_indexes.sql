@@ -0,0 +1,17 @@
+-- Indexes backing the frontend's server-side list queries
+-- (frontend/src/lib/hackathonQueries.js): keyset pagination over
+-- (reg_end_date, id), platform/mode filters and title substring search.
+
+create extension if not exists pg_trgm;
+
+create index if not exists hackathons_reg_end_date_id_idx
+    on public.hackathons (reg_end_date, id);
+
+create index if not exists hackathons_source_reg_end_date_idx
+    on public.hackathons (source, reg_end_date, id);
+
+create index if not exists hackathons_mode_reg_end_date_idx
+    on public.hackathons (mode, reg_end_date, id);
+
+create index if not exists hackathons_title_trgm_idx
+    on public.hackathons using gin (title gin_trgm_ops);
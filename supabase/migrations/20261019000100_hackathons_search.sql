@@ -0,0 +1,57 @@
+-- Ranked full-text search over titles, themes and organizers.
+-- The backend now persists `themes` and `organizer`; a stored tsvector
+-- (title > themes > organizer) with a GIN index keeps lookups sub-linear,
+-- and the title trigram index catches partial words and typos.
+
+alter table public.hackathons add column if not exists organizer text not null default '';
+alter table public.hackathons add column if not exists themes text not null default '';
+
+alter table public.hackathons add column if not exists search_vector tsvector
+    generated always as (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(themes, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(organizer, '')), 'C')
+    ) stored;
+
+create index if not exists hackathons_search_vector_idx
+    on public.hackathons using gin (search_vector);
+
+-- Every search term is matched as a prefix ("hack" finds "hackathon").
+-- Filters mirror frontend/src/lib/hackathonQueries.js; results are ordered
+-- by relevance, then by closing date.
+create or replace function public.search_hackathons(
+    search_query text,
+    filter_source text default null,
+    filter_mode text default null,
+    date_from text default null,
+    date_to text default null,
+    result_limit integer default 24,
+    result_offset integer default 0
+)
+returns setof public.hackathons
+language sql
+stable
+as $$
+    with q as (
+        select to_tsquery('english', string_agg(term || ':*', ' & ')) as tsq
+        from regexp_split_to_table(lower(trim(search_query)), '[^[:alnum:]]+') as term
+        where term <> ''
+    )
+    select h.*
+    from public.hackathons h, q
+    -- LIKE wildcards in the query are matched literally
+    where (h.search_vector @@ q.tsq or h.title ilike '%' || replace(replace(replace(trim(search_query),
+             '\', '\\'), '%', '\%'), '_', '\_') || '%')
+      and (filter_source is null or h.source = filter_source)
+      and (filter_mode is null or h.mode = filter_mode)
+      and (date_from is null or h.reg_end_date::date >= date_from::date)
+      and (date_to is null or h.reg_end_date::date <= date_to::date)
+    order by
+        coalesce(ts_rank(h.search_vector, q.tsq), 0) + similarity(h.title, trim(search_query)) desc,
+        h.reg_end_date,
+        h.id
+    limit result_limit
+    offset result_offset
+$$;
+
+grant execute on function public.search_hackathons(text, text, text, text, text, integer, integer) to anon, authenticated;
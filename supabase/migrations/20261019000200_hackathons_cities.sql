@@ -0,0 +1,52 @@
+-- Normalised city tags per row (backend/geo.py, data/gazetteer.json), so a
+-- region filter is an indexed array-containment lookup instead of a regex
+-- scan over free-text locations.
+
+alter table public.hackathons add column if not exists location text not null default '';
+alter table public.hackathons add column if not exists cities text[] not null default '{}';
+
+create index if not exists hackathons_cities_idx
+    on public.hackathons using gin (cities);
+
+-- search_hackathons gains a city filter; drop the old signature first so
+-- PostgREST does not see two overloads.
+drop function if exists public.search_hackathons(text, text, text, text, text, integer, integer);
+
+create or replace function public.search_hackathons(
+    search_query text,
+    filter_source text default null,
+    filter_mode text default null,
+    filter_city text default null,
+    date_from text default null,
+    date_to text default null,
+    result_limit integer default 24,
+    result_offset integer default 0
+)
+returns setof public.hackathons
+language sql
+stable
+as $$
+    with q as (
+        select to_tsquery('english', string_agg(term || ':*', ' & ')) as tsq
+        from regexp_split_to_table(lower(trim(search_query)), '[^[:alnum:]]+') as term
+        where term <> ''
+    )
+    select h.*
+    from public.hackathons h, q
+    -- LIKE wildcards in the query are matched literally
+    where (h.search_vector @@ q.tsq or h.title ilike '%' || replace(replace(replace(trim(search_query),
+             '\', '\\'), '%', '\%'), '_', '\_') || '%')
+      and (filter_source is null or h.source = filter_source)
+      and (filter_mode is null or h.mode = filter_mode)
+      and (filter_city is null or h.cities @> array[filter_city])
+      and (date_from is null or h.reg_end_date::date >= date_from::date)
+      and (date_to is null or h.reg_end_date::date <= date_to::date)
+    order by
+        coalesce(ts_rank(h.search_vector, q.tsq), 0) + similarity(h.title, trim(search_query)) desc,
+        h.reg_end_date,
+        h.id
+    limit result_limit
+    offset result_offset
+$$;
+
+grant execute on function public.search_hackathons(text, text, text, text, text, text, integer, integer) to anon, authenticated;
@@ -0,0 +1,46 @@
+-- Expiry lifecycle (backend/lifecycle.py): expired rows are moved to an
+-- archive table in one server-side statement instead of being deleted and
+-- shipped back to the client just to be counted. The live table stays small
+-- for list queries while history remains available for dedup and analytics.
+
+-- A real date column lets the (reg_end_date, id) index from
+-- 20261019000000_hackathons_list_indexes.sql serve the expiry range scan.
+alter table public.hackathons
+    alter column reg_end_date type date using reg_end_date::date;
+
+create table if not exists public.hackathons_archive (
+    like public.hackathons,
+    archived_at timestamptz not null default now()
+);
+
+create unique index if not exists hackathons_archive_link_idx
+    on public.hackathons_archive (link);
+
+create index if not exists hackathons_archive_reg_end_date_idx
+    on public.hackathons_archive (reg_end_date);
+
+-- History is backend-only; no policies means anon/authenticated see nothing.
+alter table public.hackathons_archive enable row level security;
+
+create or replace function public.archive_expired_hackathons(cutoff date)
+returns integer
+language sql
+as $$
+    with moved as (
+        delete from public.hackathons
+        where reg_end_date < cutoff
+        returning *
+    ),
+    archived as (
+        insert into public.hackathons_archive
+        select moved.*, now() from moved
+        on conflict (link) do update
+            set title = excluded.title,
+                reg_end_date = excluded.reg_end_date,
+                archived_at = excluded.archived_at
+        returning 1
+    )
+    select count(*)::integer from archived
+$$;
+
+revoke execute on function public.archive_expired_hackathons(date) from public, anon, authenticated;
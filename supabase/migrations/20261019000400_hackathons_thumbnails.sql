@@ -0,0 +1,37 @@
+-- Small WebP/AVIF copies of image_url (backend/thumbnails.py), stored under a
+-- content-hash key so the CDN can cache them indefinitely. Null means the
+-- card falls back to the original image.
+
+alter table public.hackathons add column if not exists thumbnail_url text;
+alter table public.hackathons_archive add column if not exists thumbnail_url text;
+
+-- The archive now ends with (archived_at, thumbnail_url) while the live table
+-- ends with thumbnail_url, so `select moved.*, now()` no longer lines up.
+-- Build the archive row by column name instead of position.
+create or replace function public.archive_expired_hackathons(cutoff date)
+returns integer
+language sql
+as $$
+    with moved as (
+        delete from public.hackathons
+        where reg_end_date < cutoff
+        returning *
+    ),
+    archived as (
+        insert into public.hackathons_archive
+        select (jsonb_populate_record(
+            null::public.hackathons_archive,
+            to_jsonb(moved) || jsonb_build_object('archived_at', now())
+        )).*
+        from moved
+        on conflict (link) do update
+            set title = excluded.title,
+                reg_end_date = excluded.reg_end_date,
+                thumbnail_url = excluded.thumbnail_url,
+                archived_at = excluded.archived_at
+        returning 1
+    )
+    select count(*)::integer from archived
+$$;
+
+revoke execute on function public.archive_expired_hackathons(date) from public, anon, authenticated;